@@ -0,0 +1,107 @@
+"""
+Compares generating many clients with one CLI process each to a single `batch` process.
+
+A synthetic OpenAPI-spec with `--schemas` schemas and endpoints is written once per client. The
+clients are generated by `--clients` separate `from-file` processes, which each import the
+generator, load the templates and run Ruff twice. They are then generated again by one `batch`
+process from a manifest.
+
+Usage:
+    python benchmarks/batch_generation_benchmark.py [--clients 20] [--schemas 30]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+CLI = [sys.executable, "-c", "from fastapi_client_generator.cli import cli; cli()"]
+
+
+def create_api_spec(schema_count: int) -> Dict:
+    """Creates a spec with a schema and an endpoint returning it per index."""
+    schemas = {}
+    paths = {}
+
+    for index in range(schema_count):
+        schemas[f"Resource{index}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string"},
+                "size": {"type": "integer"},
+            },
+        }
+        paths[f"/resource{index}"] = {
+            "get": {
+                "summary": f"Get resource {index}",
+                "responses": {
+                    "200": {
+                        "description": "The resource",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Resource{index}"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Batch benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def run(args: List[str], directory: Path) -> float:
+    """Runs a CLI command in the directory and returns its duration in seconds."""
+    started_at = time.perf_counter()
+    subprocess.run(args, cwd=directory, check=True, capture_output=True)
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=20, help="Number of clients to generate")
+    parser.add_argument("--schemas", type=int, default=30, help="Number of schemas per spec")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        manifest = []
+
+        for index in range(args.clients):
+            spec_path = directory / f"service{index}.json"
+            spec_path.write_text(json.dumps(create_api_spec(args.schemas)))
+            manifest.append({"client_name": f"service{index}_client", "source": spec_path.name})
+
+        manifest_path = directory / "manifest.json"
+        manifest_path.write_text(json.dumps({"clients": manifest}))
+
+        separate = sum(
+            run(
+                [*CLI, "from-file", "-c", entry["client_name"], "-f", entry["source"]],
+                directory,
+            )
+            for entry in manifest
+        )
+        batch = run([*CLI, "batch", "--manifest", str(manifest_path)], directory)
+
+    print(f"Clients: {args.clients}, schemas per client: {args.schemas}")
+    print(f"{'generation':<22}{'total (s)':>11}{'per client (ms)':>18}")
+    for mode, duration in (("separate processes", separate), ("batch", batch)):
+        print(f"{mode:<22}{duration:>11.2f}{duration / args.clients * 1000:>18.0f}")
+    print(f"speedup: {separate / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
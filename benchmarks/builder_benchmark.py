@@ -0,0 +1,165 @@
+"""
+Measures the CPU time and peak memory of the schema and endpoint builders on a large spec.
+
+A synthetic OpenAPI-spec with `--resources` resources is generated. Every resource has an object
+schema with a nested reference, a page schema and a create schema, a paginated list operation with
+query and header parameters, and create, read, update and delete operations. The schema and endpoint
+processors render the client into memory without formatting it, so only the builders are measured.
+
+Usage:
+    python benchmarks/builder_benchmark.py [--resources 300] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+from typing import Dict, List
+
+from fastapi_client_generator.processors.endpoint_processor import EndpointProcessor
+from fastapi_client_generator.processors.pre_processor import PreProcessor
+from fastapi_client_generator.processors.schema_processor import SchemaProcessor
+from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.memory_file_manager import MemoryFileManager
+
+
+def create_query_param(name: str, schema_type: str = "string", **schema: int) -> Dict:
+    """Creates an optional query parameter."""
+    return {
+        "name": name,
+        "in": "query",
+        "required": False,
+        "description": f"The {name}",
+        "schema": {"type": schema_type, **schema},
+    }
+
+
+def create_response(schema_name: str) -> Dict:
+    """Creates a `200` response returning the referenced schema."""
+    ref = f"#/components/schemas/{schema_name}"
+    return {
+        "200": {"description": "OK", "content": {"application/json": {"schema": {"$ref": ref}}}}
+    }
+
+
+def create_api_spec(resource_count: int) -> Dict:
+    """Creates a spec with three schemas and five operations per resource."""
+    schemas: Dict[str, Dict] = {}
+    paths: Dict[str, Dict] = {}
+
+    for index in range(resource_count):
+        name = f"Resource{index}"
+        parent_ref = f"#/components/schemas/Resource{max(index - 1, 0)}"
+        create_body = {
+            "content": {
+                "application/json": {"schema": {"$ref": f"#/components/schemas/{name}Create"}}
+            }
+        }
+        id_param = {
+            "name": "resourceId",
+            "in": "path",
+            "required": True,
+            "schema": {"type": "string"},
+        }
+
+        schemas[name] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string", "maxLength": 40, "description": "Name"},
+                "createdAt": {"type": "string", "title": "Created"},
+                "size": {"type": "integer"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "status": {"type": "string", "enum": ["active", "archived"]},
+                "parent": {"anyOf": [{"$ref": parent_ref}, {"type": "null"}]},
+                f"field{index}": {"type": "number"},
+            },
+        }
+        schemas[f"{name}Page"] = {
+            "type": "object",
+            "properties": {
+                "items": {"type": "array", "items": {"$ref": f"#/components/schemas/{name}"}},
+                "total": {"type": "integer"},
+            },
+        }
+        schemas[f"{name}Create"] = {
+            "type": "object",
+            "required": ["name"],
+            "properties": {"name": {"type": "string"}, f"value{index}": {"type": "integer"}},
+        }
+        paths[f"/resources{index}"] = {
+            "get": {
+                "summary": f"List resource {index}",
+                "parameters": [
+                    create_query_param("limit", "integer", maximum=100),
+                    create_query_param("offset", "integer"),
+                    create_query_param("search"),
+                    create_query_param("sortBy"),
+                    {"name": "X-Trace", "in": "header", "schema": {"type": "string"}},
+                ],
+                "responses": create_response(f"{name}Page"),
+            },
+            "post": {"requestBody": create_body, "responses": create_response(name)},
+        }
+        paths[f"/resources{index}/{{resourceId}}"] = {
+            "get": {"parameters": [id_param], "responses": create_response(name)},
+            "put": {
+                "parameters": [id_param],
+                "requestBody": create_body,
+                "responses": create_response(name),
+            },
+            "delete": {"parameters": [id_param], "responses": {"204": {"description": "Deleted"}}},
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Builder benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def run_builders(api_spec: Dict) -> None:
+    """Renders the schemas and endpoints of the spec into memory."""
+    config = Config(
+        api_spec=api_spec,
+        client_name="builder_client",
+        format_code=False,
+        file_manager=MemoryFileManager(),
+    )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        PreProcessor(config).run()
+        SchemaProcessor(config).run()
+        EndpointProcessor(config).run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--resources", type=int, default=300, help="Number of resources")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs, the fastest is reported")
+    args = parser.parse_args()
+
+    api_spec = create_api_spec(args.resources)
+    run_builders(api_spec)
+    durations: List[float] = []
+
+    for _ in range(args.repeat):
+        started_at = time.process_time()
+        run_builders(api_spec)
+        durations.append(time.process_time() - started_at)
+
+    tracemalloc.start()
+    run_builders(api_spec)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Resources: {args.resources}, operations: {args.resources * 5}")
+    print(f"builders CPU time: {min(durations) * 1000:.0f} ms")
+    print(f"peak memory: {peak / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Measures the per-call overhead of generated endpoint methods over raw `requests` calls.
+
+A client is generated from a small FastAPI application with one `GET /items/{item_id}` route that
+has optional query parameters. Every call is answered by a stub transport with a canned response,
+so no socket is opened and only the work on the calling side is measured. The route is called
+`--calls` times as a raw `requests` call, with and without the proxy settings of the environment
+being read per request, and through the generated client with the stub passed as `transport` and
+mounted in the default session of the client.
+
+Usage:
+    python benchmarks/call_overhead_benchmark.py [--calls 20000]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import timeit
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from fastapi_client_generator import FastapiClientGenerator
+
+CLIENT_NAME = "call_overhead_client"
+BASE_URL = "http://api.local"
+DEFAULT_HEADERS = {"Authorization": "Bearer token"}
+BODY = json.dumps({"id": "item_1", "name": "Benchmark item", "description": None}).encode()
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: str, category: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+    return {"id": item_id}
+
+
+class StubTransport(BaseAdapter):
+    """Answers every request with the same JSON body, without sending it."""
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.raw = io.BytesIO(BODY)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def generate_client(folder: str) -> ModuleType:
+    """Generates the client of the FastAPI application without formatting it."""
+    os.chdir(folder)
+    sys.path.insert(0, folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        FastapiClientGenerator(client_name=CLIENT_NAME, format_code=False).from_fastapi(app)
+
+    return importlib.import_module(CLIENT_NAME)
+
+
+def create_raw_call(trust_env: bool) -> Callable[[], Any]:
+    """Creates a raw `requests` call of the route through the stub transport."""
+    session = Session()
+    session.trust_env = trust_env
+    session.mount("http://", StubTransport())
+
+    return lambda: session.get(
+        f"{BASE_URL}/items/item_1", headers=DEFAULT_HEADERS, params={"limit": 10}, timeout=15
+    ).json()
+
+
+def measure(call: Callable[[], Any], calls: int) -> float:
+    """Returns the fastest mean latency of a call in microseconds, out of five rounds."""
+    call()
+    return min(timeit.repeat(call, number=calls, repeat=5)) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=20000, help="Calls per round")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        call_overhead_client = generate_client(folder)
+        transport_client = call_overhead_client.ClientAlpha(
+            base_url=BASE_URL, default_headers=DEFAULT_HEADERS, transport=StubTransport()
+        )
+        default_client = call_overhead_client.ClientAlpha(
+            base_url=BASE_URL, default_headers=DEFAULT_HEADERS
+        )
+        default_client._request_base._session.mount("http://", StubTransport())
+
+        calls = {
+            "raw requests, environment read per call": create_raw_call(trust_env=True),
+            "raw requests": create_raw_call(trust_env=False),
+            "generated, transport": lambda: transport_client.items_item_id.get(
+                item_id="item_1", category=None, limit=10
+            ),
+            "generated, default session": lambda: default_client.items_item_id.get(
+                item_id="item_1", category=None, limit=10
+            ),
+        }
+        latencies = {name: measure(call, args.calls) for name, call in calls.items()}
+
+    print(f"Calls per round: {args.calls}")
+
+    for name, latency in latencies.items():
+        overhead = latency - latencies["raw requests"]
+        print(f"{name}: {latency:.1f} µs per call ({overhead:+.1f} µs over raw requests)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Compares checking a generated client against a spec with regenerating it.
+
+A synthetic OpenAPI-spec with `--schemas` schemas and endpoints is generated once. The client is
+then checked against the same spec, which only hashes the spec, and against a spec where one
+schema changed, which renders the client in memory without formatting it. For comparison, the client is regenerated from the changed spec.
+
+Usage:
+    python benchmarks/check_benchmark.py [--schemas 2000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+
+
+def create_api_spec(schema_count: int) -> Dict:
+    """Creates a spec with a distinct schema, and an endpoint returning it, per index."""
+    schemas = {}
+    paths = {}
+
+    for index in range(schema_count):
+        schemas[f"Resource{index}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "string"}, f"field{index}": {"type": "string"}},
+        }
+        paths[f"/resource{index}"] = {
+            "get": {
+                "summary": f"Get resource {index}",
+                "responses": {
+                    "200": {
+                        "description": "The resource",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Resource{index}"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Check benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schemas", type=int, default=2000, help="Number of schemas in the spec")
+    args = parser.parse_args()
+    api_spec = create_api_spec(args.schemas)
+    generator = FastapiClientGenerator(client_name="check_client")
+    results = []
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        os.chdir(temp_directory)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.from_api_spec(api_spec)
+
+        started_at = time.perf_counter()
+        stale_files = generator.check(api_spec)
+        results.append(("check, unchanged", time.perf_counter() - started_at, len(stale_files)))
+
+        api_spec["components"]["schemas"]["Resource0"]["properties"]["size"] = {"type": "integer"}
+
+        started_at = time.perf_counter()
+        stale_files = generator.check(api_spec)
+        results.append(("check, one changed", time.perf_counter() - started_at, len(stale_files)))
+
+        started_at = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.from_api_spec(api_spec)
+        results.append(("regenerate", time.perf_counter() - started_at, None))
+
+        os.chdir(ROOT_PATH)
+
+    print(f"Schemas: {args.schemas}")
+    print(f"{'mode':<22}{'time (ms)':>11}{'stale files':>14}")
+    for mode, duration, stale_count in results:
+        stale = "" if stale_count is None else stale_count
+        print(f"{mode:<22}{duration * 1000:>11.1f}{stale:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measures the peak memory of rendering one large endpoint module to disk.
+
+A synthetic OpenAPI-spec with a single path is generated. The path has five operations, each with
+`--params` described query parameters, so the endpoint module grows with the number of parameters.
+Only the endpoint builder is traced: the spec and its intermediate representation are created
+before the measurement starts. The code is not formatted.
+
+Usage:
+    python benchmarks/endpoint_streaming_benchmark.py [--params 1600]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import tracemalloc
+from typing import Dict
+
+from fastapi_client_generator.builders.endpoints.endpoint_builder import EndpointBuilder
+from fastapi_client_generator.processors.pre_processor import PreProcessor
+from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.spec_ir import EndpointNode
+
+ENDPOINT_PATH = "/reports"
+
+
+def create_api_spec(param_count: int) -> Dict:
+    """Creates a spec with one path of five operations with the given number of parameters."""
+    parameters = [
+        {
+            "name": f"filter{index}",
+            "in": "query",
+            "required": False,
+            "description": f"Only return reports matching filter {index} of the report query",
+            "schema": {"type": "string"},
+        }
+        for index in range(param_count)
+    ]
+    operations = {
+        method: {
+            "summary": f"{method.upper()} reports",
+            "parameters": parameters,
+            "responses": {"200": {"description": "OK"}},
+        }
+        for method in ["get", "put", "post", "patch", "delete"]
+    }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Streaming benchmark", "version": "1.0.0"},
+        "paths": {ENDPOINT_PATH: operations},
+        "components": {"schemas": {}},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--params", type=int, default=1600, help="Parameters per operation")
+    args = parser.parse_args()
+
+    api_spec = create_api_spec(args.params)
+
+    with tempfile.TemporaryDirectory() as folder:
+        os.chdir(folder)
+        config = Config(api_spec=api_spec, client_name="streaming_client", format_code=False)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            PreProcessor(config).run()
+
+        endpoint_path = config.root_path / "endpoints"
+        config.file_manager.create_folder(endpoint_path)
+        endpoint = EndpointNode(ENDPOINT_PATH, api_spec["paths"][ENDPOINT_PATH], {})
+
+        tracemalloc.start()
+        EndpointBuilder(config, "Reports", "reports", endpoint).build()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        module_size = config.file_manager.staged_path(endpoint_path / "reports.py").stat().st_size
+        config.file_manager.discard_staging()
+
+    print(f"Operations: 5, parameters per operation: {args.params}")
+    print(f"endpoint module: {module_size / 1024:.0f} KB")
+    print(f"peak memory: {peak / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
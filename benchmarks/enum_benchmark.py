@@ -0,0 +1,141 @@
+"""
+Measures the import and validation time of a client whose schemas use large enums.
+
+A synthetic OpenAPI-spec is generated with `--schemas` object schemas that each use a country and
+a currency enum with `--values` values, once inline in a field and once as named enum schema. The
+client is generated twice: with the default threshold, which shares the large enums as hashed-set
+validators, and with the threshold disabled, which inlines a `Literal[...]` in every field. Both
+clients are imported and their validators built in a fresh interpreter.
+
+Usage:
+    python benchmarks/enum_benchmark.py [--schemas 50] [--values 2000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.shared.schema_enums import DEFAULT_ENUM_THRESHOLD
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+
+MEASURE_SCRIPT = """
+import json, time, timeit
+
+started_at = time.perf_counter()
+from {client_name}.schemas.schema_graph import rebuild_schemas
+from {client_name}.schemas.schema{last}_schema import Schema{last}Schema
+imported_at = time.perf_counter()
+rebuild_schemas()
+built_at = time.perf_counter()
+
+payload = {{"country": "C{value:05d}", "currency": "X{value:05d}", "origin": "C00001"}}
+Schema{last}Schema.model_validate(payload)
+number = 20000
+validate = min(timeit.repeat(lambda: Schema{last}Schema.model_validate(payload), number=number, repeat=5))
+
+print(json.dumps({{
+    "import": imported_at - started_at,
+    "build": built_at - imported_at,
+    "validate": validate / number,
+}}))
+"""
+
+
+def create_api_spec(schema_count: int, value_count: int) -> Dict:
+    """Creates a spec where every schema uses an inline and a named enum with many values."""
+    countries = [f"C{index:05d}" for index in range(value_count)]
+    currencies = [f"X{index:05d}" for index in range(value_count)]
+    schemas: Dict[str, Dict] = {"Country": {"type": "string", "enum": countries}}
+
+    for index in range(schema_count):
+        schemas[f"Schema{index}"] = {
+            "type": "object",
+            "required": ["country", "currency"],
+            "properties": {
+                "country": {"type": "string", "enum": countries},
+                "currency": {"type": "string", "enum": currencies},
+                "origin": {"$ref": "#/components/schemas/Country"},
+            },
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Enum benchmark", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def generate_client(directory: Path, client_name: str, spec_path: Path, threshold: int) -> int:
+    """Generates a client and returns the size of its schemas in bytes."""
+    cwd = Path.cwd()
+    try:
+        os.chdir(directory)
+        FastapiClientGenerator(client_name=client_name, enum_threshold=threshold).from_file_path(
+            spec_path
+        )
+    finally:
+        os.chdir(cwd)
+
+    schemas_path = directory / client_name / "schemas"
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(directory / client_name)])
+    return sum(path.stat().st_size for path in schemas_path.glob("*.py"))
+
+
+def measure(directory: Path, client_name: str, schema_count: int, value_count: int) -> Dict:
+    """Imports the client in a fresh interpreter and returns the measured durations."""
+    script = MEASURE_SCRIPT.format(
+        client_name=client_name, last=schema_count - 1, value=value_count - 1
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=directory, capture_output=True, text=True
+    )
+    if output.returncode:
+        raise RuntimeError(output.stderr)
+    return json.loads(output.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schemas", type=int, default=50, help="Number of schemas in the spec")
+    parser.add_argument("--values", type=int, default=2000, help="Number of values per enum")
+    args = parser.parse_args()
+
+    results = {}
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        spec_path = directory / "openapi.json"
+        spec_path.write_text(json.dumps(create_api_spec(args.schemas, args.values)))
+
+        for mode, threshold in (
+            ("inline Literal", args.values),
+            ("shared", DEFAULT_ENUM_THRESHOLD),
+        ):
+            client_name = "benchmark_enum_" + ("shared" if mode == "shared" else "inline")
+            size = generate_client(directory, client_name, spec_path, threshold)
+            results[mode] = {
+                "size": size,
+                **measure(directory, client_name, args.schemas, args.values),
+            }
+
+    print(f"Schemas: {args.schemas}, values per enum: {args.values}")
+    print(
+        f"{'enums':<16}{'source (KB)':>13}{'import (ms)':>13}{'build (ms)':>12}{'validate (us)':>15}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<16}{result['size'] / 1024:>13.0f}{result['import'] * 1000:>13.1f}"
+            f"{result['build'] * 1000:>12.1f}{result['validate'] * 1_000_000:>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Compares the throughput of concurrent calls over pooled HTTP/1.1 connections and over HTTP/2.
+
+A client is generated from a small FastAPI application with one `GET /items/{item_id}` route.
+`--concurrency` threads call the route `--requests` times in total. Two local servers answer every
+request after `--latency` seconds: a threaded HTTP/1.1 server, called through the default pool with
+one connection per thread, and an HTTP/2 server without TLS, called through `HTTP2Transport` with
+`--connections` multiplexed connections. The number of connections each server accepted is reported.
+
+Usage:
+    python benchmarks/http2_transport_benchmark.py [--requests 2000] [--concurrency 64]
+        [--latency 0.02] [--connections 1]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import ModuleType
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import RequestReceived
+
+from fastapi_client_generator import FastapiClientGenerator
+
+CLIENT_NAME = "http2_client"
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: str) -> Dict:
+    return {"id": item_id, "name": "Benchmark item"}
+
+
+def create_body(path: str) -> bytes:
+    """Creates the item the servers respond with."""
+    return json.dumps({"id": path.rsplit("/", 1)[-1], "name": "Benchmark item"}).encode()
+
+
+class Http11Handler(BaseHTTPRequestHandler):
+    """Answers every request after the latency, keeping the connection open."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    opened_connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).opened_connections += 1
+
+    def do_GET(self) -> None:
+        time.sleep(self.latency)
+        body = create_body(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class Http2Protocol(asyncio.Protocol):
+    """Answers every request after the latency, many requests are in flight per connection."""
+
+    latency = 0.0
+    opened_connections = 0
+
+    def connection_made(self, transport: Any) -> None:
+        type(self).opened_connections += 1
+        self._transport = transport
+        self._connection = H2Connection(H2Configuration(client_side=False))
+        self._connection.initiate_connection()
+        transport.write(self._connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self._connection.receive_data(data):
+            if isinstance(event, RequestReceived):
+                path = dict(event.headers)[b":path"].decode()
+                asyncio.ensure_future(self._respond(event.stream_id, path))
+
+        self._transport.write(self._connection.data_to_send())
+
+    async def _respond(self, stream_id: int, path: str) -> None:
+        await asyncio.sleep(self.latency)
+        body = create_body(path)
+        self._connection.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-type", "application/json")],
+        )
+        self._connection.send_data(stream_id, body, end_stream=True)
+        self._transport.write(self._connection.data_to_send())
+
+
+def start_http2_server() -> int:
+    """Runs the HTTP/2 server on an event loop in a background thread and returns its port."""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(Http2Protocol, "127.0.0.1", 0))
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return server.sockets[0].getsockname()[1]
+
+
+def generate_client(folder: str) -> ModuleType:
+    """Generates the client of the FastAPI application without formatting it."""
+    os.chdir(folder)
+    sys.path.insert(0, folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        FastapiClientGenerator(client_name=CLIENT_NAME, format_code=False).from_fastapi(app)
+
+    return importlib.import_module(CLIENT_NAME)
+
+
+def measure(client: Any, requests: int, concurrency: int) -> float:
+    """Returns the number of calls per second when `concurrency` threads call the client."""
+    started_at = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        items: List[Any] = list(
+            executor.map(
+                lambda index: client.items_item_id.get(item_id=str(index)), range(requests)
+            )
+        )
+
+    assert [item["id"] for item in items] == [str(index) for index in range(requests)]
+    return requests / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Calls in total")
+    parser.add_argument("--concurrency", type=int, default=64, help="Threads calling the client")
+    parser.add_argument("--latency", type=float, default=0.02, help="Server latency in seconds")
+    parser.add_argument("--connections", type=int, default=1, help="HTTP/2 connections")
+    args = parser.parse_args()
+
+    Http11Handler.latency = Http2Protocol.latency = args.latency
+    http11_server = ThreadingHTTPServer(("127.0.0.1", 0), Http11Handler)
+    threading.Thread(target=http11_server.serve_forever, daemon=True).start()
+    http2_port = start_http2_server()
+
+    with tempfile.TemporaryDirectory() as folder:
+        http2_client = generate_client(folder)
+        clients = {
+            "HTTP/1.1 pool": (
+                http2_client.ClientAlpha(
+                    base_url=f"http://127.0.0.1:{http11_server.server_port}",
+                    default_headers={},
+                    pool_maxsize=args.concurrency,
+                ),
+                Http11Handler,
+            ),
+            "HTTP/2": (
+                http2_client.ClientAlpha(
+                    base_url=f"http://127.0.0.1:{http2_port}",
+                    default_headers={},
+                    transport=http2_client.HTTP2Transport(
+                        max_connections=args.connections, http1=False
+                    ),
+                ),
+                Http2Protocol,
+            ),
+        }
+
+        print(
+            f"Requests: {args.requests}, concurrency: {args.concurrency}, "
+            f"server latency: {args.latency * 1000:.0f} ms"
+        )
+
+        for name, (client, server) in clients.items():
+            calls_per_second = measure(client, args.requests, args.concurrency)
+            print(
+                f"{name}: {calls_per_second:.0f} calls/s, "
+                f"{server.opened_connections} connections opened"
+            )
+
+    http11_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
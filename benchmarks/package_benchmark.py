@@ -0,0 +1,102 @@
+"""
+Compares packaging a client from its generated folder with generating it directly into a wheel.
+
+A synthetic OpenAPI-spec with `--schemas` schemas and endpoints is generated as a client folder,
+whose files are then read back and packed into a wheel, like a packaging step after generation
+does. The same client is then generated into a wheel directly, from memory.
+
+Usage:
+    python benchmarks/package_benchmark.py [--schemas 500]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.shared.client_archive import ClientArchive
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+CLIENT_NAME = "package_client"
+
+
+def create_api_spec(schema_count: int) -> Dict:
+    """Creates a spec with a distinct schema, and an endpoint returning it, per index."""
+    schemas = {}
+    paths = {}
+
+    for index in range(schema_count):
+        schemas[f"Resource{index}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "string"}, f"field{index}": {"type": "string"}},
+        }
+        paths[f"/resource{index}"] = {
+            "get": {
+                "summary": f"Get resource {index}",
+                "responses": {
+                    "200": {
+                        "description": "The resource",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Resource{index}"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Package benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def package_folder(api_spec: Dict, directory: Path) -> Path:
+    """Generates the client folder, reads its files back and packs them into a wheel."""
+    FastapiClientGenerator(client_name=CLIENT_NAME).from_api_spec(api_spec)
+    files = {
+        path.relative_to(directory).as_posix(): path.read_text()
+        for path in (directory / CLIENT_NAME).rglob("*.py")
+    }
+    return ClientArchive(files).write_wheel(directory / "folder", name=CLIENT_NAME, version="1.0")
+
+
+def package_memory(api_spec: Dict, directory: Path) -> Path:
+    """Generates the client in memory and writes the wheel directly."""
+    generator = FastapiClientGenerator(client_name=CLIENT_NAME)
+    return generator.to_wheel(api_spec, directory / "memory", version="1.0")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schemas", type=int, default=500, help="Number of schemas in the spec")
+    args = parser.parse_args()
+    api_spec = create_api_spec(args.schemas)
+    results = []
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        os.chdir(directory)
+
+        for mode, package in (("folder, then wheel", package_folder), ("wheel", package_memory)):
+            started_at = time.perf_counter()
+            wheel_path = package(api_spec, directory)
+            results.append((mode, time.perf_counter() - started_at, wheel_path.stat().st_size))
+
+        os.chdir(ROOT_PATH)
+
+    print(f"Schemas: {args.schemas}")
+    print(f"{'packaging':<22}{'time (s)':>10}{'wheel (kB)':>13}")
+    for mode, duration, size in results:
+        print(f"{mode:<22}{duration:>10.2f}{size / 1024:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
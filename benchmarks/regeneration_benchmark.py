@@ -0,0 +1,103 @@
+"""
+Measures the disk writes of regenerating a client whose spec did not change.
+
+A synthetic OpenAPI-spec with `--schemas` schemas and endpoints is generated once. The client is
+then regenerated from the same spec, which stages the tree, compares it by content hash and keeps
+every existing file, and from a spec where one schema changed.
+
+Usage:
+    python benchmarks/regeneration_benchmark.py [--schemas 300]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+
+
+def create_api_spec(schema_count: int) -> Dict:
+    """Creates a spec with a distinct schema, and an endpoint returning it, per index."""
+    schemas = {}
+    paths = {}
+
+    for index in range(schema_count):
+        schemas[f"Resource{index}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "string"}, f"field{index}": {"type": "string"}},
+        }
+        paths[f"/resource{index}"] = {
+            "get": {
+                "summary": f"Get resource {index}",
+                "responses": {
+                    "200": {
+                        "description": "The resource",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Resource{index}"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Regeneration benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def modification_times(client_path: Path) -> Dict[Path, int]:
+    """Returns the modification time of every file within the client."""
+    return {path: path.stat().st_mtime_ns for path in client_path.rglob("*") if path.is_file()}
+
+
+def generate(api_spec: Dict, client_path: Path) -> int:
+    """Generates the client and returns the number of files that were written."""
+    before = modification_times(client_path) if client_path.exists() else {}
+    FastapiClientGenerator(client_name=client_path.name).from_api_spec(api_spec)
+    after = modification_times(client_path)
+
+    return sum(before.get(path) != modified_at for path, modified_at in after.items())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schemas", type=int, default=300, help="Number of schemas in the spec")
+    args = parser.parse_args()
+    api_spec = create_api_spec(args.schemas)
+    results = []
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        os.chdir(temp_directory)
+        client_path = Path(temp_directory) / "regeneration_client"
+
+        for mode in ("first generation", "unchanged spec", "one changed schema"):
+            if mode == "one changed schema":
+                api_spec["components"]["schemas"]["Resource0"]["properties"]["size"] = {
+                    "type": "integer"
+                }
+
+            started_at = time.perf_counter()
+            written = generate(api_spec, client_path)
+            results.append((mode, time.perf_counter() - started_at, written))
+
+        os.chdir(ROOT_PATH)
+
+    print(f"Schemas: {args.schemas}")
+    print(f"{'generation':<22}{'time (s)':>10}{'files written':>16}")
+    for mode, duration, written in results:
+        print(f"{mode:<22}{duration:>10.2f}{written:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compares decoding and encoding of the generated schemas between the pydantic and msgspec backend.
+
+Both clients are generated from `assets/openapi-mock.json` into a temporary directory within the
+repository, so the generated code is formatted with the Ruff settings of the project. Decoding
+mirrors the generated endpoint code: pydantic parses `response.json()` into the model, msgspec
+decodes the raw response bytes. Encoding mirrors the request body: pydantic dumps the model for
+`requests` to serialize, msgspec encodes the struct to bytes.
+
+Usage:
+    python benchmarks/schema_backend_benchmark.py [--items 1000] [--repeat 5]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, Dict
+
+import msgspec
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+SPEC_PATH = ROOT_PATH / "assets" / "openapi-mock.json"
+
+
+def generate_clients(directory: Path) -> Dict[str, object]:
+    """Generates a client for each backend in the directory and returns their schema modules."""
+    cwd = Path.cwd()
+    os.chdir(directory)
+    sys.path.insert(0, str(directory))
+
+    try:
+        modules = {}
+        for backend in ("pydantic", "msgspec"):
+            client_name = f"benchmark_{backend}_client"
+            FastapiClientGenerator(client_name=client_name, schema_backend=backend).from_file_path(
+                SPEC_PATH
+            )
+            modules[backend] = importlib.import_module(
+                f"{client_name}.schemas.item_list_response_schema"
+            )
+        return modules
+    finally:
+        os.chdir(cwd)
+
+
+def measure(function: Callable[[], object], repeat: int, number: int) -> float:
+    """Returns the best time of a single call in microseconds."""
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=1000, help="Number of items in the payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurement rounds")
+    args = parser.parse_args()
+
+    payload = {
+        "items": [
+            {"id": f"item_{index}", "name": f"Item {index}", "description": "An item"}
+            for index in range(args.items)
+        ],
+        "total": args.items,
+    }
+    body = json.dumps(payload).encode()
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as directory:
+        modules = generate_clients(Path(directory))
+
+        pydantic_schema = modules["pydantic"].ItemListResponseSchema
+        msgspec_schema = modules["msgspec"].ItemListResponseSchema
+        pydantic_model = pydantic_schema(**json.loads(body))
+        msgspec_struct = msgspec.json.decode(body, type=msgspec_schema)
+
+        number = max(1, 20_000 // max(args.items, 1))
+        results = {
+            "decode": (
+                measure(lambda: pydantic_schema(**json.loads(body)), args.repeat, number),
+                measure(
+                    lambda: msgspec.json.decode(body, type=msgspec_schema), args.repeat, number
+                ),
+            ),
+            "encode": (
+                measure(lambda: json.dumps(pydantic_model.model_dump()), args.repeat, number),
+                measure(lambda: msgspec.json.encode(msgspec_struct), args.repeat, number),
+            ),
+        }
+
+    print(f"Payload: {args.items} items, {len(body)} bytes")
+    print(f"{'operation':<10}{'pydantic (us)':>16}{'msgspec (us)':>16}{'speedup':>10}")
+    for operation, (pydantic_time, msgspec_time) in results.items():
+        print(
+            f"{operation:<10}{pydantic_time:>16.1f}{msgspec_time:>16.1f}"
+            f"{pydantic_time / msgspec_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
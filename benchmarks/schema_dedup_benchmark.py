@@ -0,0 +1,162 @@
+"""
+Measures the effect of structural schema deduplication on generation, package size and import time.
+
+A synthetic OpenAPI-spec is generated in the shape FastAPI produces: every one of the `--models`
+models is present as `*Input` and `*Output` schema, and a `Body*` wrapper with the same fields. Every
+model has an endpoint that accepts the body and returns the output schema. The client is generated
+with and without deduplication, and imported in a fresh interpreter that rebuilds every schema.
+
+Usage:
+    python benchmarks/schema_dedup_benchmark.py [--models 500]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+
+MEASURE_SCRIPT = """
+import json, time
+
+started_at = time.perf_counter()
+import {client_name}
+from {client_name}.schemas.schema_graph import rebuild_schemas
+imported_at = time.perf_counter()
+rebuild_schemas()
+built_at = time.perf_counter()
+
+print(json.dumps({{"import": imported_at - started_at, "build": built_at - imported_at}}))
+"""
+
+
+def create_api_spec(model_count: int) -> Dict:
+    """Creates a spec with an `*Input`, `*Output` and `Body*` schema and an endpoint per model."""
+    schemas = {}
+    paths = {}
+
+    for index in range(model_count):
+        model = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": {
+                "id": {"type": "string"},
+                "name": {"type": "string", "description": f"Name of model {index}"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "parent": {"$ref": f"#/components/schemas/Model{index // 2}Input"},
+            },
+        }
+        schemas[f"Model{index}Input"] = {"title": f"Model{index}", **model}
+        schemas[f"Model{index}Output"] = {
+            "title": f"Model{index}",
+            **model,
+            "properties": {
+                **model["properties"],
+                "parent": {"$ref": f"#/components/schemas/Model{index // 2}Output"},
+            },
+        }
+        schemas[f"BodyCreateModel{index}"] = {"title": f"Body_create_model_{index}", **model}
+        paths[f"/models{index}"] = {
+            "post": {
+                "summary": f"Create model {index}",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": f"#/components/schemas/BodyCreateModel{index}"}
+                        }
+                    },
+                },
+                "responses": {
+                    "200": {
+                        "description": "The created model",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Model{index}Output"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Deduplication benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def generate_client(directory: Path, client_name: str, spec_path: Path, deduplicate: bool) -> Dict:
+    """Generates a client and returns the generation time and the size of its schemas."""
+    cwd = Path.cwd()
+    try:
+        os.chdir(directory)
+        started_at = time.perf_counter()
+        FastapiClientGenerator(
+            client_name=client_name, deduplicate_schemas=deduplicate
+        ).from_file_path(spec_path)
+        generation = time.perf_counter() - started_at
+    finally:
+        os.chdir(cwd)
+
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(directory / client_name)])
+    schemas_path = directory / client_name / "schemas"
+    return {
+        "generation": generation,
+        "size": sum(path.stat().st_size for path in schemas_path.glob("*.py")),
+    }
+
+
+def measure(directory: Path, client_name: str) -> Dict:
+    """Imports the client and builds its schemas in a fresh interpreter."""
+    script = MEASURE_SCRIPT.format(client_name=client_name)
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=directory, capture_output=True, text=True
+    )
+    if output.returncode:
+        raise RuntimeError(output.stderr)
+    return json.loads(output.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", type=int, default=500, help="Number of models in the spec")
+    args = parser.parse_args()
+
+    results = {}
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        spec_path = directory / "openapi.json"
+        spec_path.write_text(json.dumps(create_api_spec(args.models)))
+
+        for mode, deduplicate in (("duplicated", False), ("deduplicated", True)):
+            client_name = f"benchmark_dedup_{mode}"
+            results[mode] = {
+                **generate_client(directory, client_name, spec_path, deduplicate),
+                **measure(directory, client_name),
+            }
+
+    print(f"Models: {args.models}, schemas: {args.models * 3}")
+    print(
+        f"{'schemas':<16}{'generation (s)':>16}{'source (KB)':>13}{'import (ms)':>13}{'build (ms)':>12}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<16}{result['generation']:>16.2f}{result['size'] / 1024:>13.0f}"
+            f"{result['import'] * 1000:>13.1f}{result['build'] * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Measures the cold import time and first-call latency of a client with many Pydantic schemas.
+
+A synthetic OpenAPI-spec with `--schemas` object schemas is generated, each schema references
+two earlier schemas and every 50th pair of schemas references each other. The client is imported in a
+fresh interpreter, once with the generated deferred model building and once with `defer_build`
+disabled in the `BaseSchema`, which builds every validator at import time.
+
+Usage:
+    python benchmarks/schema_import_benchmark.py [--schemas 2000]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+CLIENT_NAME = "benchmark_import_client"
+
+MEASURE_SCRIPT = """
+import json, sys, time
+
+started_at = time.perf_counter()
+import {client_name}
+imported_at = time.perf_counter()
+
+from {client_name}.schemas.schema{last}_schema import Schema{last}Schema
+
+payload = {{"id": "1", "name": "first", "parent": {{"id": "0", "name": "parent"}}}}
+Schema{last}Schema.model_validate(payload)
+first_call_at = time.perf_counter()
+Schema{last}Schema.model_validate(payload)
+second_call_at = time.perf_counter()
+
+if "--rebuild" in sys.argv:
+    from {client_name}.schemas.schema_graph import rebuild_schemas
+    rebuild_schemas()
+rebuilt_at = time.perf_counter()
+
+print(json.dumps({{
+    "import": imported_at - started_at,
+    "first_call": first_call_at - imported_at,
+    "second_call": second_call_at - first_call_at,
+    "rebuild": rebuilt_at - second_call_at,
+}}))
+"""
+
+
+def create_api_spec(schema_count: int) -> Dict:
+    """Creates a spec with an endpoint for every schema and a few reference cycles."""
+    schemas = {}
+    paths = {}
+
+    for index in range(schema_count):
+        properties = {"id": {"type": "string"}, "name": {"type": "string"}}
+
+        if index > 0:
+            properties["parent"] = {"$ref": f"#/components/schemas/Schema{index // 2}"}
+        if index > 2:
+            properties["related"] = {
+                "type": "array",
+                "items": {"$ref": f"#/components/schemas/Schema{index // 3}"},
+            }
+        if index % 50 == 0 and index + 1 < schema_count:
+            properties["next"] = {"$ref": f"#/components/schemas/Schema{index + 1}"}
+
+        schemas[f"Schema{index}"] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": properties,
+        }
+        paths[f"/resource{index}"] = {
+            "get": {
+                "summary": f"Get resource {index}",
+                "responses": {
+                    "200": {
+                        "description": "The resource",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/Schema{index}"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Import benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def measure(directory: Path, schema_count: int, rebuild: bool = False) -> Dict[str, float]:
+    """Imports the client in a fresh interpreter and returns the measured durations."""
+    script = MEASURE_SCRIPT.format(client_name=CLIENT_NAME, last=schema_count - 1)
+    args = [sys.executable, "-c", script, *(["--rebuild"] if rebuild else [])]
+    output = subprocess.run(args, cwd=directory, capture_output=True, text=True)
+    if output.returncode:
+        raise RuntimeError(output.stderr)
+    return json.loads(output.stdout)
+
+
+def disable_defer_build(directory: Path) -> None:
+    """Turns off deferred building in the base schema and drops the bytecode of the client."""
+    base_schema_path = directory / CLIENT_NAME / "schemas" / "base_schema.py"
+    base_schema_path.write_text(
+        base_schema_path.read_text().replace("defer_build=True", "defer_build=False")
+    )
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(directory / CLIENT_NAME)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--schemas", type=int, default=2000, help="Number of schemas in the spec")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        spec_path = directory / "openapi.json"
+        spec_path.write_text(json.dumps(create_api_spec(args.schemas)))
+
+        cwd = Path.cwd()
+        try:
+            os.chdir(directory)
+            FastapiClientGenerator(client_name=CLIENT_NAME).from_file_path(spec_path)
+        finally:
+            os.chdir(cwd)
+
+        subprocess.run([sys.executable, "-m", "compileall", "-q", str(directory / CLIENT_NAME)])
+        results = {
+            "deferred": measure(directory, args.schemas),
+            "deferred + rebuild_schemas": measure(directory, args.schemas, rebuild=True),
+        }
+        disable_defer_build(directory)
+        results["eager"] = measure(directory, args.schemas)
+
+    print(f"Schemas: {args.schemas}")
+    print(
+        f"{'mode':<28}{'import (ms)':>14}{'first call (ms)':>18}{'next call (ms)':>17}{'rebuild (ms)':>15}"
+    )
+    for mode, result in results.items():
+        print(
+            f"{mode:<28}{result['import'] * 1000:>14.1f}{result['first_call'] * 1000:>18.2f}"
+            f"{result['second_call'] * 1000:>17.3f}{result['rebuild'] * 1000:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Compares the generation of a full client with a client for a single tag of a large spec.
+
+A synthetic OpenAPI-spec with `--tags` tags is generated, every tag has `--operations` operations
+that each use a request and response schema of their own and a schema shared by the tag. The client
+is generated for the whole spec and for the operations of one tag only.
+
+Usage:
+    python benchmarks/selective_generation_benchmark.py [--tags 40] [--operations 10]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+
+
+def create_api_spec(tag_count: int, operation_count: int) -> Dict:
+    """Creates a spec where every operation reaches three schemas, one shared within its tag."""
+    schemas: Dict[str, Dict] = {}
+    paths: Dict[str, Dict] = {}
+
+    for tag_index in range(tag_count):
+        shared = f"Tag{tag_index}Meta"
+        schemas[shared] = {
+            "type": "object",
+            "properties": {"created": {"type": "string"}, "owner": {"type": "string"}},
+        }
+
+        for index in range(operation_count):
+            name = f"Tag{tag_index}Resource{index}"
+            schemas[f"{name}Create"] = {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string"}, "size": {"type": "integer"}},
+            }
+            schemas[name] = {
+                "type": "object",
+                "required": ["id", "name"],
+                "properties": {
+                    "id": {"type": "string"},
+                    "name": {"type": "string"},
+                    "meta": {"$ref": f"#/components/schemas/{shared}"},
+                },
+            }
+            paths[f"/tag{tag_index}/resource{index}"] = {
+                "post": {
+                    "operationId": f"create{name}",
+                    "tags": [f"tag{tag_index}"],
+                    "summary": f"Create {name}",
+                    "requestBody": {
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": f"#/components/schemas/{name}Create"}
+                            }
+                        }
+                    },
+                    "responses": {
+                        "200": {
+                            "description": "Created",
+                            "content": {
+                                "application/json": {
+                                    "schema": {"$ref": f"#/components/schemas/{name}"}
+                                }
+                            },
+                        }
+                    },
+                }
+            }
+
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "Selective generation benchmark", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+
+
+def generate_client(
+    directory: Path, client_name: str, spec_path: Path, include_tags: Optional[List[str]]
+) -> Dict:
+    """Generates a client and returns the generation time, number of files and size."""
+    cwd = Path.cwd()
+    try:
+        os.chdir(directory)
+        started_at = time.perf_counter()
+        FastapiClientGenerator(client_name=client_name, include_tags=include_tags).from_file_path(
+            spec_path
+        )
+        generation = time.perf_counter() - started_at
+    finally:
+        os.chdir(cwd)
+
+    files = list((directory / client_name).rglob("*.py"))
+    return {
+        "generation": generation,
+        "files": len(files),
+        "size": sum(path.stat().st_size for path in files),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tags", type=int, default=40, help="Number of tags in the spec")
+    parser.add_argument("--operations", type=int, default=10, help="Number of operations per tag")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as temp_directory:
+        directory = Path(temp_directory)
+        spec_path = directory / "openapi.json"
+        spec_path.write_text(json.dumps(create_api_spec(args.tags, args.operations)))
+
+        results = {
+            "full spec": generate_client(directory, "benchmark_full", spec_path, None),
+            "one tag": generate_client(directory, "benchmark_tag", spec_path, ["tag0"]),
+        }
+
+    print(f"Tags: {args.tags}, operations per tag: {args.operations}")
+    print(f"{'client':<12}{'generation (s)':>16}{'files':>8}{'size (KB)':>12}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<12}{result['generation']:>16.2f}{result['files']:>8}"
+            f"{result['size'] / 1024:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
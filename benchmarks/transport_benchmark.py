@@ -0,0 +1,146 @@
+"""
+Measures the latency of calls from a generated client to a co-located application.
+
+A client is generated from a small FastAPI application with one `GET /items/{item_id}` route. The
+route is called `--calls` times through four transports: a keep-alive HTTP/1.1 connection to a
+local server over TCP loopback and over a Unix domain socket, `WSGITransport` with an equivalent
+WSGI application, and `ASGITransport` with the FastAPI application itself. The local servers answer
+without an application framework, so their numbers are a lower bound for calling the FastAPI
+application over a socket.
+
+Usage:
+    python benchmarks/transport_benchmark.py [--calls 2000]
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingUnixStreamServer
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable
+
+from fastapi import FastAPI
+
+from fastapi_client_generator import FastapiClientGenerator
+
+CLIENT_NAME = "transport_client"
+ITEM = {"id": "item_1", "name": "Benchmark item", "description": None}
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+def get_item(item_id: str) -> Dict:
+    return {**ITEM, "id": item_id}
+
+
+class ItemHandler(BaseHTTPRequestHandler):
+    """Answers every request with the item, keeping the connection open."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        body = json.dumps({**ITEM, "id": self.path.rsplit("/", 1)[-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class UnixSocketItemHandler(ItemHandler):
+    """Answers over a Unix domain socket, which has no Nagle algorithm to disable."""
+
+    disable_nagle_algorithm = False
+
+
+def wsgi_app(environ: Dict, start_response: Callable) -> Iterable[bytes]:
+    """The WSGI equivalent of the FastAPI route."""
+    body = json.dumps({**ITEM, "id": environ["PATH_INFO"].rsplit("/", 1)[-1]}).encode()
+    start_response("200 OK", [("Content-Type", "application/json")])
+    return [body]
+
+
+def generate_client(folder: str) -> ModuleType:
+    """Generates the client of the FastAPI application without formatting it."""
+    os.chdir(folder)
+    sys.path.insert(0, folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        FastapiClientGenerator(client_name=CLIENT_NAME, format_code=False).from_fastapi(app)
+
+    return importlib.import_module(CLIENT_NAME)
+
+
+def measure(client: Any, calls: int) -> float:
+    """Returns the mean latency of a call in microseconds, after a few warm-up calls."""
+    for _ in range(10):
+        client.items_item_id.get(item_id="item_1")
+
+    started_at = time.perf_counter()
+
+    for _ in range(calls):
+        client.items_item_id.get(item_id="item_1")
+
+    return (time.perf_counter() - started_at) / calls * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per transport")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ItemHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    with tempfile.TemporaryDirectory() as folder:
+        unix_server = ThreadingUnixStreamServer(
+            os.path.join(folder, "api.sock"), UnixSocketItemHandler
+        )
+        unix_server.daemon_threads = True
+        threading.Thread(target=unix_server.serve_forever, daemon=True).start()
+        transport_client = generate_client(folder)
+        clients = {
+            "loopback HTTP/1.1": transport_client.ClientAlpha(
+                base_url=f"http://127.0.0.1:{server.server_port}", default_headers={}
+            ),
+            "Unix socket HTTP/1.1": transport_client.ClientAlpha(
+                base_url=transport_client.unix_socket_url(unix_server.server_address),
+                default_headers={},
+            ),
+            "WSGITransport": transport_client.ClientAlpha(
+                base_url="http://app",
+                default_headers={},
+                transport=transport_client.WSGITransport(wsgi_app),
+            ),
+            "ASGITransport (FastAPI)": transport_client.ClientAlpha(
+                base_url="http://app",
+                default_headers={},
+                transport=transport_client.ASGITransport(app),
+            ),
+        }
+
+        print(f"Calls per transport: {args.calls}")
+
+        for name, client in clients.items():
+            print(f"{name}: {measure(client, args.calls):.0f} µs per call")
+
+        unix_server.shutdown()
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
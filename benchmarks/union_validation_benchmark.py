@@ -0,0 +1,143 @@
+"""
+Compares the validation of polymorphic payloads between discriminated and plain unions.
+
+A synthetic OpenAPI-spec with a batch of events is generated, where every event is one of
+`--members` schemas that are told apart by a required `type` property with a `const` value. The
+generated client validates the events as discriminated union. The same member schemas are
+validated as a plain `Union`, which Pydantic resolves by trying the members one by one.
+
+Usage:
+    python benchmarks/union_validation_benchmark.py [--members 20] [--events 1000] [--repeat 5]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+from pydantic import TypeAdapter
+
+from fastapi_client_generator import FastapiClientGenerator
+
+ROOT_PATH = Path(__file__).resolve().parents[1]
+CLIENT_NAME = "benchmark_union_client"
+
+
+def create_api_spec(member_count: int) -> Dict:
+    """Creates a spec with an event batch schema whose events are a union of `member_count` schemas."""
+    schemas = {
+        f"Event{index}": {
+            "type": "object",
+            "required": ["type", "id", "sequence"],
+            "properties": {
+                "type": {"type": "string", "const": f"event_{index}"},
+                "id": {"type": "string"},
+                "sequence": {"type": "integer"},
+                "message": {"type": "string"},
+            },
+        }
+        for index in range(member_count)
+    }
+    schemas["EventBatch"] = {
+        "type": "object",
+        "required": ["events"],
+        "properties": {
+            "events": {
+                "type": "array",
+                "items": {
+                    "oneOf": [
+                        {"$ref": f"#/components/schemas/Event{index}"}
+                        for index in range(member_count)
+                    ]
+                },
+            }
+        },
+    }
+
+    return {
+        "openapi": "3.1.0",
+        "info": {"title": "Union benchmark", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def create_payload(member_count: int, event_count: int) -> List[Dict]:
+    """Creates events that are spread evenly over all union members."""
+    return [
+        {
+            "type": f"event_{index % member_count}",
+            "id": f"event-{index}",
+            "sequence": index,
+            "message": "Something happened",
+        }
+        for index in range(event_count)
+    ]
+
+
+def generate_client(directory: Path, member_count: int) -> None:
+    """Generates the benchmark client in the directory and makes it importable."""
+    spec_path = directory / "openapi.json"
+    spec_path.write_text(json.dumps(create_api_spec(member_count)))
+
+    cwd = Path.cwd()
+    os.chdir(directory)
+    sys.path.insert(0, str(directory))
+
+    try:
+        FastapiClientGenerator(client_name=CLIENT_NAME).from_file_path(spec_path)
+    finally:
+        os.chdir(cwd)
+
+
+def measure(function: Callable[[], object], repeat: int, number: int) -> float:
+    """Returns the best time of a single call in microseconds."""
+    return min(timeit.repeat(function, repeat=repeat, number=number)) / number * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--members", type=int, default=20, help="Number of union members")
+    parser.add_argument("--events", type=int, default=1000, help="Number of events in the payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurement rounds")
+    args = parser.parse_args()
+
+    payload = {"events": create_payload(args.members, args.events)}
+
+    with tempfile.TemporaryDirectory(dir=ROOT_PATH) as directory:
+        generate_client(Path(directory), args.members)
+
+        batch_schema = importlib.import_module(
+            f"{CLIENT_NAME}.schemas.event_batch_schema"
+        ).EventBatchSchema
+        members = tuple(
+            getattr(
+                importlib.import_module(f"{CLIENT_NAME}.schemas.event{index}_schema"),
+                f"Event{index}Schema",
+            )
+            for index in range(args.members)
+        )
+        plain_union = TypeAdapter(List[Union[members]])  # type: ignore[valid-type]
+
+        assert batch_schema.model_validate(payload).events == plain_union.validate_python(
+            payload["events"]
+        )
+
+        number = max(1, 20_000 // max(args.events, 1))
+        discriminated = measure(lambda: batch_schema.model_validate(payload), args.repeat, number)
+        plain = measure(lambda: plain_union.validate_python(payload["events"]), args.repeat, number)
+
+    print(f"Payload: {args.events} events over {args.members} union members")
+    print(f"{'union':<16}{'validation (us)':>18}{'per event (us)':>17}")
+    for name, duration in (("plain", plain), ("discriminated", discriminated)):
+        print(f"{name:<16}{duration:>18.1f}{duration / args.events:>17.3f}")
+    print(f"speedup: {plain / discriminated:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
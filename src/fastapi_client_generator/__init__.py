@@ -1,3 +1,23 @@
-from fastapi_client_generator.client import FastapiClientGenerator
+import importlib
+from typing import TYPE_CHECKING
 
-__all__ = ["FastapiClientGenerator"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from fastapi_client_generator.batch import BatchGenerator
+    from fastapi_client_generator.client import FastapiClientGenerator
+
+__all__ = ["BatchGenerator", "FastapiClientGenerator"]
+
+_LAZY_IMPORTS = {
+    "BatchGenerator": "fastapi_client_generator.batch",
+    "FastapiClientGenerator": "fastapi_client_generator.client",
+}
+
+
+def __getattr__(name: str):
+    """Imports the generators on first access, so the CLI starts without loading them."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import typer
+
+from fastapi_client_generator.client import FastapiClientGenerator
+from fastapi_client_generator.processors.post_processor import PostProcessor
+from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.utils import download_api_spec_content
+
+
+class BatchGenerator:
+    def __init__(
+        self,
+        manifest: List[Dict[str, Any]],
+        base_path: Optional[Union[str, Path]] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Generates several API clients within a single process.
+
+        The specs are read and downloaded concurrently, the clients are generated by a pool of
+        workers that share one Jinja environment, and Ruff runs once over all staged clients
+        instead of twice per client. Every client folder is then replaced by its staged folder.
+
+        Args:
+            manifest: One entry per client, containing the `client_name` and the `source` of its
+                OpenAPI-spec (a URL or file path). Other keys are passed to `FastapiClientGenerator`,
+                e.g. `schema_backend` or `include_tags`.
+            base_path: Folder that relative file paths in the manifest are resolved against.
+                Defaults to the current working directory.
+            max_workers: Number of specs that are read, and clients that are generated, at once.
+        """
+        self._manifest = manifest
+        self._base_path = Path(base_path) if base_path is not None else Path.cwd()
+        self._max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+
+        for entry in manifest:
+            if "client_name" not in entry or "source" not in entry:
+                raise ValueError(f"Manifest entry requires a 'client_name' and 'source': {entry}")
+
+    @classmethod
+    def from_manifest_file(
+        cls, manifest_path: Union[str, Path], max_workers: Optional[int] = None
+    ) -> "BatchGenerator":
+        """
+        Creates a batch from a JSON manifest file.
+
+        The manifest is a list of entries, or an object with the list under `clients`. Relative
+        spec paths are resolved against the folder of the manifest.
+
+        Args:
+            manifest_path: Path to the JSON manifest.
+            max_workers: Number of specs that are read, and clients that are generated, at once.
+        """
+        path = Path(manifest_path).expanduser().resolve()
+        manifest = json.loads(path.read_text())
+
+        if isinstance(manifest, dict):
+            manifest = manifest.get("clients", [])
+
+        return cls(manifest=manifest, base_path=path.parent, max_workers=max_workers)
+
+    def run(self) -> List[Path]:
+        """
+        Generates every client of the manifest.
+
+        Returns:
+            The folders of the generated clients, in the order of the manifest.
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            api_specs = list(executor.map(self._read_api_spec, self._manifest))
+            generators = [self._create_generator(entry) for entry in self._manifest]
+            configs = [
+                generator.create_config(api_spec)
+                for generator, api_spec in zip(generators, api_specs)
+            ]
+
+            try:
+                list(executor.map(self._stage_client, generators, configs))
+                self._format_clients(configs)
+
+                for config in configs:
+                    PostProcessor(config).run()
+            finally:
+                for config in configs:
+                    config.file_manager.discard_staging()
+
+        return [config.root_path for config in configs]
+
+    def _read_api_spec(self, entry: Dict[str, Any]) -> Dict:
+        """Reads the OpenAPI-spec of a manifest entry from its URL or file path."""
+        source = str(entry["source"])
+
+        if source.startswith(("http://", "https://")):
+            return download_api_spec_content(source)
+
+        path = (self._base_path / Path(source).expanduser()).resolve()
+        return json.loads(path.read_text())
+
+    def _create_generator(self, entry: Dict[str, Any]) -> FastapiClientGenerator:
+        """Creates the generator of a manifest entry, which leaves the formatting to the batch."""
+        options = {key: value for key, value in entry.items() if key != "source"}
+        return FastapiClientGenerator(**options, format_code=False)
+
+    def _stage_client(self, generator: FastapiClientGenerator, config: Config) -> None:
+        """Generates the client of a manifest entry in its staging folder."""
+        generator.stage(config)
+
+    def _format_clients(self, configs: List[Config]) -> None:
+        """Performs `ruff format` once on all staged clients."""
+        action = f"Running 'ruff format' on {len(configs)} API-clients"
+        typer.echo(f"{action} \n")
+
+        client_paths = [config.file_manager.staged_path(config.root_path) for config in configs]
+        subprocess.run(["ruff", "format", *client_paths, "--no-cache"], check=False)
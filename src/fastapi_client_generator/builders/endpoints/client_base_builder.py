@@ -3,6 +3,7 @@ from typing import List, Tuple
 
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.import_planner import ImportPlanner
 from fastapi_client_generator.shared.template_enum import TemplateEnum
 
 
@@ -81,8 +82,25 @@ class ClientBaseBuilder(BuilderInterface):
             name=TemplateEnum.CLIENT_BASE_TEMPLATE.value
         ).render(
             {
-                "import_base": self._config.import_base,
+                "import_block": self._create_client_base_imports(),
                 "client_base_classes": self._client_base_classes,
-                "client_base_imports": sorted(self._client_base_imports, key=lambda x: x[0]),
             }
         )
+
+    def _create_client_base_imports(self) -> str:
+        """
+        Creates the sorted imports of the client base, every endpoint class is used by the client.
+
+        Returns:
+            The import block of the client base.
+        """
+        import_planner = ImportPlanner(self._config.import_base)
+        import_planner.require(
+            "from typing import Dict, Iterable, Optional",
+            f"from {self._config.import_base}.utils.rate_limit import RateLimiter",
+            f"from {self._config.import_base}.utils.request_base import RequestBase",
+            f"from {self._config.import_base}.utils.transport import Transport",
+            f"from {self._config.import_base}.utils.warmup import build_validators",
+            *self._client_base_imports,
+        )
+        return import_planner.create_import_block()
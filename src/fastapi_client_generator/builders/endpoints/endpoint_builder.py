@@ -1,11 +1,13 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator
 
 from fastapi_client_generator.builders.endpoints.endpoint_method_builder import (
     EndpointMethodBuilder,
 )
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.import_planner import TYPING_IMPORT, ImportPlanner
+from fastapi_client_generator.shared.spec_ir import EndpointNode
 from fastapi_client_generator.shared.template_enum import TemplateEnum
 
 
@@ -15,24 +17,26 @@ class EndpointBuilder(BuilderInterface):
         config: Config,
         endpoint_class_name: str,
         endpoint_file_name: str,
-        endpoint_path: str,
-        endpoint_data: dict,
+        endpoint: EndpointNode,
     ) -> None:
         super().__init__(config)
         self._endpoint_class_name = endpoint_class_name
         self._endpoint_file_name = endpoint_file_name
-        self._endpoint_path = endpoint_path
-        self._endpoint_data = endpoint_data
+        self._endpoint = endpoint
 
     def build(self):
         """Builds a Python file for given endpoint"""
         self._create_endpoint_file()
-        self._create_endpoint_methods()
 
     def _create_endpoint_file(self) -> None:
-        """Creates an Python file for the given endpoint within the endpoint folder."""
-        return self._config.file_manager.save_python(
-            file_path=self._create_file_path(), code=self._create_code()
+        """
+        Creates an Python file for the given endpoint within the endpoint folder.
+
+        The code is streamed to the file while it is rendered, so only a single method is held in
+        memory at a time.
+        """
+        return self._config.file_manager.stream_python(
+            file_path=self._create_file_path(), chunks=self._create_code()
         )
 
     def _create_file_path(self) -> Path:
@@ -44,48 +48,62 @@ class EndpointBuilder(BuilderInterface):
         """
         return self._config.root_path / "endpoints" / f"{self._endpoint_file_name}.py"
 
-    def _create_code(self) -> str:
+    def _create_code(self) -> Iterator[str]:
         """
         Creates the python code for each endpoints that is included within the `endpoint_data`.
 
+        The imports and schema classes of every method are collected first, as they are rendered
+        above the methods. The methods themselves are rendered while the template is consumed.
+
         Returns:
-            The rendered Jinja template as a string
+            The rendered Jinja template in chunks
         """
 
         endpoint_methods = self._create_endpoint_methods()
 
         return self._config.jinja_env.get_template(
             name=TemplateEnum.ENDPOINT_TEMPLATE.value,
-        ).render(
+        ).generate(
             {
-                "import_base": self._config.import_base,
+                "import_block": endpoint_methods.get("import_block", ""),
                 "endpoint_class_name": self._endpoint_class_name,
-                "endpoint_path": self._endpoint_path,
-                "method_schema_imports": endpoint_methods.get("method_schema_imports", []),
+                "endpoint_path": self._endpoint.path,
                 "method_functions": endpoint_methods.get("method_functions", []),
+                "schema_classes": endpoint_methods.get("schema_classes", []),
             }
         )
 
     def _create_endpoint_methods(self) -> Dict:
         """
         Calls the `EndpointMethodBuilder` for each method available within the given endpoint.
+
+        The imports of the module are planned from the code of every method, so only the names
+        the methods refer to are imported, each once.
         """
 
         method_functions = []
-        method_schema_imports = []
+        schema_classes = []
+        import_planner = ImportPlanner(self._config.import_base)
+        import_planner.add(TYPING_IMPORT)
+        import_planner.require(
+            f"from {self._config.import_base}.utils.request_base import RequestBase"
+        )
+        import_planner.use("Tuple[type, ...]")
 
-        for method_name, method_data in self._endpoint_data.items():
+        for operation in self._endpoint.operations:
             endpoint_method = EndpointMethodBuilder(
-                config=self._config,
-                endpoint_path=self._endpoint_path,
-                method_name=method_name,
-                method_data=method_data,
+                config=self._config, operation=operation
             ).build()
 
             method_functions.append(endpoint_method["method_function"])
-            method_schema_imports.extend(endpoint_method["method_schema_imports"])
+            schema_classes.extend(endpoint_method["method_schema_classes"])
+            import_planner.add(*endpoint_method["method_schema_imports"])
+            import_planner.use(*endpoint_method["method_code"])
+
+        import_planner.use(*schema_classes)
 
         return {
             "method_functions": method_functions,
-            "method_schema_imports": method_schema_imports,
+            "import_block": import_planner.create_import_block(),
+            "schema_classes": sorted(set(schema_classes)),
         }
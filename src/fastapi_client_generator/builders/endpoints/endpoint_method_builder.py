@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Iterator, List, Optional
 
 from fastapi_client_generator.builders.endpoints.endpoint_method_docstring_builder import (
     EndpointMethodDocstringBuilder,
@@ -14,58 +14,44 @@ from fastapi_client_generator.builders.endpoints.endpoint_method_response_builde
 )
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.spec_ir import OperationNode
 from fastapi_client_generator.shared.template_enum import TemplateEnum
-from fastapi_client_generator.shared.utils import pascal_to_snake
 
 
 class EndpointMethodBuilder(BuilderInterface):
-    def __init__(
-        self,
-        config: Config,
-        endpoint_path: str,
-        method_name: str,
-        method_data: dict,
-    ) -> None:
+    def __init__(self, config: Config, operation: OperationNode) -> None:
         super().__init__(config)
-        self._endpoint_path = endpoint_path
-        self._method_name = method_name
-        self._method_data = method_data
+        self._operation = operation
 
     def build(self) -> Dict:
         """
         Generates a python function for the given endpoint based on the method information.
 
         Returns:
-            A dictionary containing the method_template and method_imports
+            A dictionary containing the method_function, method_imports and the method_code the
+            imports are planned with. The method function is rendered lazily, in chunks, while it
+            is iterated.
         """
 
-        method_docstring = EndpointMethodDocstringBuilder(
-            endpoint_path=self._endpoint_path,
-            method_name=self._method_name,
-            method_data=self._method_data,
-        ).build()
+        method_docstring = EndpointMethodDocstringBuilder(operation=self._operation).build()
         method_parameters = EndpointMethodParameterBuilder(
-            config=self._config, method_data=self._method_data
+            config=self._config, operation=self._operation
         ).build()
         method_request_body = EndpointMethodRequestBodyBuilder(
-            config=self._config, method_data=self._method_data
+            config=self._config, operation=self._operation
         ).build()
         method_response = EndpointMethodResponseBuilder(
-            config=self._config, method_data=self._method_data
+            config=self._config, operation=self._operation
         ).build()
 
-        method_function = self._config.jinja_env.get_template(
-            name=TemplateEnum.ENDPOINT_METHOD_TEMPLATE.value
-        ).render(
-            {
-                "endpoint_path": self._process_endpoint_path(),
-                "method_name": self._method_name,
-                "method_docstring": method_docstring,
-                "method_parameters": method_parameters,
-                "method_request_body": method_request_body,
-                "method_response": method_response,
-            }
-        )
+        method_context = {
+            "endpoint_path": self._process_endpoint_path(),
+            "method_name": self._operation.method,
+            "method_docstring": method_docstring,
+            "method_parameters": method_parameters,
+            "method_request_body": method_request_body,
+            "method_response": method_response,
+        }
 
         method_schema_imports = [
             *method_parameters.get("schema_imports", []),
@@ -73,9 +59,122 @@ class EndpointMethodBuilder(BuilderInterface):
             *method_response.get("schema_imports", []),
         ]
 
+        pagination = self._create_pagination(method_parameters, method_response)
+
+        if pagination:
+            method_schema_imports.extend(pagination["schema_imports"])
+
         return {
-            "method_function": method_function,
+            "method_function": self._create_method_function(method_context, pagination),
+            "method_code": self._create_method_code(
+                method_parameters, method_request_body, method_response, pagination
+            ),
             "method_schema_imports": method_schema_imports,
+            "method_schema_classes": [
+                *method_request_body.get("schema_classes", []),
+                *method_response.get("schema_classes", []),
+            ],
+        }
+
+    def _create_method_function(
+        self, method_context: Dict, pagination: Optional[Dict]
+    ) -> Iterator[str]:
+        """
+        Renders the method, followed by its `iter_all` helper when it paginates.
+
+        Returns:
+            The chunks of the rendered code, rendered as they are consumed.
+        """
+        yield from self._config.jinja_env.get_template(
+            name=TemplateEnum.ENDPOINT_METHOD_TEMPLATE.value
+        ).generate(method_context)
+
+        if pagination:
+            yield from self._config.jinja_env.get_template(
+                name=TemplateEnum.ENDPOINT_METHOD_PAGINATION_TEMPLATE.value
+            ).generate({"method_name": self._operation.method, "pagination": pagination})
+
+    def _create_method_code(
+        self,
+        method_parameters: Dict,
+        method_request_body: Dict,
+        method_response: Dict,
+        pagination: Optional[Dict],
+    ) -> List[str]:
+        """
+        Collects the code the method is rendered from, which refers to the names it imports.
+
+        The remaining code of the method templates only refers to its arguments and `self`, apart
+        from the `Iterator` and `Optional` annotations of the `iter_all` helper.
+
+        Returns:
+            The pieces of code of the method, and of its `iter_all` helper when it paginates.
+        """
+        method_code = [
+            method_parameters["functional_arguments"],
+            method_parameters["query_parameters"],
+            method_response["response_type"],
+            method_response["method_response"],
+        ]
+
+        if method_request_body["exists"]:
+            method_code.append(method_request_body["functional_arguments"])
+            method_code.append(method_request_body["request_body_argument"])
+
+        if method_response["is_download"]:
+            method_code.append(method_response["functional_arguments"])
+
+        if pagination:
+            method_code.extend(
+                [
+                    pagination["functional_arguments"],
+                    f"Iterator[{pagination['item_type']}]",
+                    pagination["helper"],
+                    pagination["read_items"],
+                    pagination["read_next_cursor"] or "",
+                    pagination["read_total"] or "",
+                ]
+            )
+
+            if pagination["limit_argument"]:
+                method_code.append("Optional[int]")
+
+        return method_code
+
+    def _create_pagination(self, method_parameters: Dict, method_response: Dict) -> Optional[Dict]:
+        """
+        Combines the pagination detected in the parameters and the response of a `get` method.
+
+        Returns:
+            The information used to render the `iter_all` helper. None when the method does not
+            paginate, or when cursor pagination lacks a next cursor in the response.
+        """
+        parameter_pagination = method_parameters.get("pagination")
+        response_pagination = method_response.get("pagination")
+
+        if self._operation.method != "get" or not parameter_pagination or not response_pagination:
+            return None
+
+        if (
+            parameter_pagination["style"] == "cursor"
+            and not response_pagination["read_next_cursor"]
+        ):
+            return None
+
+        helper = {
+            "cursor": "iterate_cursor_pages",
+            "offset": "iterate_offset_pages",
+            "page": "iterate_numbered_pages",
+        }[parameter_pagination["style"]]
+
+        return {
+            **parameter_pagination,
+            **response_pagination,
+            "helper": helper,
+            "schema_imports": [
+                *response_pagination["schema_imports"],
+                f"from {self._config.import_base}.utils.pagination import {helper}",
+            ],
         }
 
     def _process_endpoint_path(self) -> str:
@@ -83,14 +182,15 @@ class EndpointMethodBuilder(BuilderInterface):
         Processes the endpoint path by replacing path parameters to snake_case variables.
 
         Returns:
-            The endpoint path that is called.
+            The endpoint path that is called, starting with a single slash so the request base can
+            append it to the base URL as it is.
         """
-        endpoint_path = self._endpoint_path
+        endpoint_path = "/" + self._operation.path.lstrip("/")
 
-        for param in self._method_data.get("parameters", []):
-            if param["in"] != "path":
+        for param in self._operation.parameters:
+            if param.location != "path":
                 continue
 
-            endpoint_path = endpoint_path.replace(param["name"], pascal_to_snake(param["name"]))
+            endpoint_path = endpoint_path.replace(param.name, param.argument)
 
         return endpoint_path
@@ -1,17 +1,11 @@
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
+from fastapi_client_generator.shared.spec_ir import OperationNode
 
 
 class EndpointMethodDocstringBuilder(BuilderInterface):
-    def __init__(
-        self,
-        endpoint_path: str,
-        method_name: str,
-        method_data: dict,
-    ) -> None:
+    def __init__(self, operation: OperationNode) -> None:
         super().__init__(None)
-        self._endpoint_path = endpoint_path
-        self._method_name = method_name
-        self._method_data = method_data
+        self._operation = operation
 
     def build(self) -> str:
         """
@@ -33,16 +27,16 @@ class EndpointMethodDocstringBuilder(BuilderInterface):
         Returns:
             Summary as docstring line
         """
-        if self._method_data.get("summary"):
-            return self._method_data.get("summary")
+        if self._operation.summary:
+            return self._operation.summary
 
-        return f"Calls endpoint `{self._endpoint_path}` as method `{self._method_name}`."
+        return f"Calls endpoint `{self._operation.path}` as method `{self._operation.method}`."
 
     def _create_description(self) -> str:
         """
         Creates the docstring description if available within method data.
         """
-        if self._method_data.get("description"):
-            return f"\n{self._method_data.get('description')}\n"
+        if self._operation.description:
+            return f"\n{self._operation.description}\n"
 
         return ""
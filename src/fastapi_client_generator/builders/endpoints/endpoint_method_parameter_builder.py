@@ -1,23 +1,20 @@
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Sequence
 
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.spec_ir import OperationNode, ParameterNode
 from fastapi_client_generator.shared.utils import (
     convert_ref_to_class_name,
     convert_ref_to_import_path,
     map_primitive,
-    pascal_to_snake,
 )
 
 
 class EndpointMethodParameterBuilder(BuilderInterface):
-    def __init__(
-        self,
-        config: Config,
-        method_data: dict,
-    ) -> None:
+    def __init__(self, config: Config, operation: OperationNode) -> None:
         super().__init__(config=config)
-        self._method_data = method_data
+        self._operation = operation
 
     def build(self) -> Dict:
         """
@@ -31,19 +28,25 @@ class EndpointMethodParameterBuilder(BuilderInterface):
             "docstring_args": self._create_docstring_args(),
             "query_parameters": self._create_query_parameters(),
             "schema_imports": self._create_schema_imports(),
+            "pagination": self._create_pagination(),
         }
 
-    def _create_functional_arguments(self) -> str:
+    def _create_functional_arguments(self, excluded: Sequence[str] = ()) -> str:
         """Generates the parameter related functional arguments for the given method.
 
+        Args:
+            excluded: Names of OpenAPI parameters that are left out.
+
         Returns:
             A string with all functional arguments
         """
         functional_arguments = [
-            self._param_to_func_arg(param) for param in self._method_data.get("parameters", [])
+            self._param_to_func_arg(param)
+            for param in self._operation.parameters
+            if param.name not in excluded
         ]
 
-        arg_with_default = ["headers: Dict = {}"]
+        arg_with_default = ["headers: Optional[Dict] = None"]
         arg_without_default = []
 
         for functional_argument in functional_arguments:
@@ -55,82 +58,187 @@ class EndpointMethodParameterBuilder(BuilderInterface):
 
         return ",".join([*arg_without_default, *arg_with_default])
 
-    def _create_docstring_args(self) -> List[str]:
+    def _create_docstring_args(self, excluded: Sequence[str] = ()) -> Iterator[str]:
         """
         Generates docstring arguments for parameters.
 
+        The arguments are created while the template iterates them, so the docstrings of methods
+        that are not rendered yet are not held in memory.
+
+        Args:
+            excluded: Names of OpenAPI parameters that are left out.
+
+        Returns:
+            An iterator over the arguments. Empty when no params available.
+        """
+        return (
+            self._convert_param_to_arg(param)
+            for param in self._operation.parameters
+            if param.name not in excluded
+        )
+
+    def _create_pagination(self) -> Optional[Dict]:
+        """
+        Detects whether the method paginates by its query parameters.
+
+        The `x-pagination` extension of the operation is used when available, the configured
+        pagination conventions otherwise. Cursor pagination takes precedence over `limit`/`offset`,
+        which takes precedence over `page`/`page_size`.
+
         Returns:
-            A list of arguments. Returns empty list when no params available.
+            A dict with the pagination style and the arguments used by the `iter_all` helper.
+            None when the method does not paginate.
         """
+        extension = self._operation.pagination
 
-        param_list = self._method_data.get("parameters", None)
+        if extension is False:
+            return None
 
-        if not param_list:
-            return []
+        if not isinstance(extension, dict):
+            extension = {}
 
-        return [self._convert_param_to_arg(param) for param in param_list]
+        query_params = {
+            param.name: param for param in self._operation.parameters if param.location == "query"
+        }
+        limit = self._find_pagination_param("limit", query_params, extension)
+        offset = self._find_pagination_param("offset", query_params, extension)
+        page = self._find_pagination_param("page", query_params, extension)
+        cursor = self._find_pagination_param("cursor", query_params, extension)
+
+        style_params = {
+            "cursor": [cursor, limit] if cursor else [],
+            "offset": [offset, limit] if offset and limit else [],
+            "page": [page, limit] if page and limit else [],
+        }
+        style = extension.get("style") or next(
+            (style for style, params in style_params.items() if params), None
+        )
+        pagination_params = [param for param in style_params.get(style, []) if param]
 
-    def _convert_param_to_arg(self, param: Dict) -> str:
-        """Converts an Open-API parameter to a docstring argument."""
-        name = pascal_to_snake(param.get("name"))
-        param_type = self._read_param_type(param)
-        param_description = self._read_param_description(param)
+        if not pagination_params:
+            return None
 
-        return f"{name}{param_type}: {param_description}"
+        non_pagination_params = [
+            param for param in self._operation.parameters if param.name not in pagination_params
+        ]
+        first_page = self._read_schema_value(query_params.get(page), "default")
+
+        return {
+            "style": style,
+            "limit_argument": query_params[limit].argument if limit else None,
+            "offset_argument": query_params[offset].argument if offset else None,
+            "page_argument": query_params[page].argument if page else None,
+            "first_page": 1 if first_page is None else first_page,
+            "cursor_argument": query_params[cursor].argument if cursor else None,
+            "page_size": self._read_page_size(query_params.get(limit)),
+            "functional_arguments": self._create_functional_arguments(excluded=pagination_params),
+            "docstring_args": self._create_docstring_args(excluded=pagination_params),
+            "forwarded_arguments": "".join(
+                f"{param.argument}={param.argument}," for param in non_pagination_params
+            ),
+        }
 
-    def _read_param_type(self, param: dict) -> str:
+    def _find_pagination_param(
+        self, role: str, query_params: Dict[str, ParameterNode], extension: Dict
+    ) -> Optional[str]:
         """
-        Reads the OpenAPI param type if known.
+        Finds the query parameter that fulfills the given pagination role.
+
+        Args:
+            role: One of `limit`, `offset`, `page` or `cursor`.
+            query_params: The query parameters of the method by name.
+            extension: The `x-pagination` extension of the method.
 
         Returns:
-            Param type if known, empty string otherwise
+            The name of the parameter, None when the method has no such parameter.
         """
-        schema: dict = param.get("schema", None)
-
-        if not schema:
-            return ""
+        if f"{role}_param" in extension:
+            name = extension[f"{role}_param"]
+            return name if name in query_params else None
 
-        param_type = schema.get("type", None)
+        conventions = self._config.pagination_conventions.get(f"{role}_params", [])
+        return next((name for name in conventions if name in query_params), None)
 
-        if not param_type:
-            return ""
+    def _read_page_size(self, param: Optional[ParameterNode]) -> Optional[int]:
+        """
+        Reads the page size that is requested by default, preferring the largest allowed size to
+        keep the number of requests low.
 
-        return f" ({param_type})"
+        Returns:
+            The maximum of the limit parameter, its default otherwise. None when neither is known.
+        """
+        return self._read_schema_value(param, "maximum") or self._read_schema_value(
+            param, "default"
+        )
+
+    def _read_schema_value(self, param: Optional[ParameterNode], key: str) -> Optional[int]:
+        """Reads an integer value from the schema of the given parameter."""
+        value = param.schema.get(key) if param else None
+        return (
+            int(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+        )
+
+    def _convert_param_to_arg(self, param: ParameterNode) -> str:
+        """Converts an Open-API parameter to a docstring argument."""
+        return f"{param.argument}{self._read_param_type(param)}: {param.description}"
 
-    def _read_param_description(self, param: dict) -> str:
+    def _read_param_type(self, param: ParameterNode) -> str:
         """
-        Reads the OpenAPI param description if known.
+        Reads the OpenAPI param type if known.
 
         Returns:
-            Description if known, empty string otherwise
+            Param type if known, empty string otherwise
         """
-        return param.get("description", "")
+        param_type = param.schema.get("type", None)
+
+        if not param_type:
+            return ""
+
+        return f" ({param_type})"
 
     def _create_query_parameters(self) -> str:
         """
-        Converts OpenAPI query parameters into a valid Python dictionary string
-        referencing function arguments.
-        """
-        query_params = []
+        Converts OpenAPI query parameters into a Python expression referencing function arguments.
 
-        for param in self._method_data.get("parameters", []):
-            if param.get("in") != "query":
-                continue
-
-            name = param["name"]
-            name_py = pascal_to_snake(name)
+        Parameters that are `None` are dropped while the dictionary is built, instead of being
+        filtered by `requests` on every call. Only required parameters are added as they are.
 
-            schema = param.get("schema", {})
-            is_ref = schema.get("$ref", False)
+        Returns:
+            A dictionary expression, `None` when the method has no query parameters.
+        """
+        query_params = [param for param in self._operation.parameters if param.location == "query"]
+
+        if not query_params:
+            return "None"
+
+        if all(param.required and not param.ref for param in query_params):
+            return f"{{{', '.join(f'{param.name!r}: {param.argument}' for param in query_params)}}}"
+
+        if len(query_params) == 1 and query_params[0].ref:
+            items = self._create_ref_query_items(query_params[0])
+        else:
+            items = ", ".join(
+                f"*{self._create_ref_query_items(param)}"
+                if param.ref
+                else f"({param.name!r}, {param.argument})"
+                for param in query_params
+            )
+            items = f"({items},)" if len(query_params) == 1 else f"({items})"
 
-            if is_ref:
-                query_params.append(f"**{name_py}.model_dump()")
+        return f"{{name: value for name, value in {items} if value is not None}}"
 
-                continue
+    def _create_ref_query_items(self, param: ParameterNode) -> str:
+        """
+        Converts a query parameter that references a schema into the items of its fields.
 
-            query_params.append(f"'{name}': {name_py}")
+        Returns:
+            The `model_dump()` items for Pydantic schemas. The `msgspec.to_builtins()` items for
+            msgspec Structs, which have no `model_dump` method, keyed by their original field names.
+        """
+        if self._config.schema_backend == SchemaBackendEnum.MSGSPEC:
+            return f"msgspec.to_builtins({param.argument}).items()"
 
-        return f"{{{', '.join(query_params)}}}"
+        return f"{param.argument}.model_dump().items()"
 
     def _create_schema_imports(self) -> List[str]:
         """Finds all schema references defined in the OpenAPI parameters and generates Python import statements for them.
@@ -140,46 +248,45 @@ class EndpointMethodParameterBuilder(BuilderInterface):
         """
         schema_imports = []
 
-        for param in self._method_data.get("parameters", []):
-            schema = param.get("schema", {})
-            is_ref = schema.get("$ref", False)
-
-            if not is_ref:
+        for param in self._operation.parameters:
+            if not param.ref:
                 continue
 
             schema_import_path = convert_ref_to_import_path(
-                import_base=self._config.import_base, ref=schema.get("$ref")
+                import_base=self._config.import_base, ref=param.ref
             )
             schema_imports.append(schema_import_path)
 
+            if (
+                param.location == "query"
+                and self._config.schema_backend == SchemaBackendEnum.MSGSPEC
+            ):
+                schema_imports.append("import msgspec")
+
         return schema_imports
 
-    def _determ_param_type(self, param: dict) -> str:
+    def _determ_param_type(self, param: ParameterNode) -> str:
         """
         Generates the param type.
 
         Returns:
             A primitive python type when found. Returns schema otherwise.
         """
-        schema = param.get("schema", {})
-
-        if "$ref" in schema:
-            return convert_ref_to_class_name(schema.get("$ref"))
+        if param.ref:
+            return convert_ref_to_class_name(param.ref)
 
-        return map_primitive(schema.get("type"))
+        return map_primitive(param.schema.get("type"))
 
-    def _param_to_func_arg(self, param: dict) -> str:
+    def _param_to_func_arg(self, param: ParameterNode) -> str:
         """
         Converts the given parameter to a function arg.
 
         Return:
             Python typed function argument.
         """
-        param_name = param.get("name")
-        param_name_py = pascal_to_snake(param_name)
         param_type_py = self._determ_param_type(param)
 
-        arg_required = f"{param_name_py}: {param_type_py}"
-        arg_optional = f"{param_name_py}: Optional[{param_type_py}] = None"
+        arg_required = f"{param.argument}: {param_type_py}"
+        arg_optional = f"{param.argument}: Optional[{param_type_py}] = None"
 
-        return arg_required if param.get("required", False) else arg_optional
+        return arg_required if param.required else arg_optional
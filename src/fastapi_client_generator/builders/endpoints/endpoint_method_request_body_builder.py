@@ -2,6 +2,13 @@ from typing import Dict, List
 
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.spec_ir import (
+    BINARY_BODY,
+    JSON_BODY,
+    MULTIPART_BODY,
+    OperationNode,
+)
 from fastapi_client_generator.shared.utils import (
     convert_ref_to_class_name,
     convert_ref_to_import_path,
@@ -9,15 +16,12 @@ from fastapi_client_generator.shared.utils import (
 
 
 class EndpointMethodRequestBodyBuilder(BuilderInterface):
-    def __init__(
-        self,
-        config: Config,
-        method_data: dict,
-    ) -> None:
+    def __init__(self, config: Config, operation: OperationNode) -> None:
         super().__init__(config)
-        self._method_data = method_data
-        self._exists = self._is_existing()
-        self._request_body_type = self._determ_request_body_type()  # ← added
+        self._request_body = operation.request_body
+        self._exists = self._request_body is not None
+        self._request_body_kind = self._request_body.kind if self._exists else None
+        self._request_body_type = self._determ_request_body_type()
 
     def build(self) -> Dict:
         """
@@ -28,9 +32,11 @@ class EndpointMethodRequestBodyBuilder(BuilderInterface):
         """
         return {
             "exists": self._exists,
+            "is_upload": self._request_body_kind in (BINARY_BODY, MULTIPART_BODY),
             "functional_arguments": self._create_functional_arguments(),
             "docstring_args": self._create_docstring_args(),
             "schema_imports": self._create_schema_imports(),
+            "schema_classes": self._create_schema_classes(),
             "request_body_argument": self._create_request_body_argument(),
         }
 
@@ -57,7 +63,7 @@ class EndpointMethodRequestBodyBuilder(BuilderInterface):
 
         return [
             "content_type (string): The content-type that is accepted by the API.",
-            f"request_body ({self._request_body_type}): The requested body",  # ← updated
+            f"request_body ({self._request_body_type}): The requested body",
         ]
 
     def _create_content_type_func_arg(self) -> str:
@@ -67,13 +73,10 @@ class EndpointMethodRequestBodyBuilder(BuilderInterface):
         Returns:
             Returns list of available content types.
         """
+        content_types = self._request_body.content_types
+        content_type_str = ", ".join(repr(content_type) for content_type in content_types)
 
-        content = self._read_request_body_content()
-        content_types = [content_type for content_type, _ in content.items()]
-
-        content_type_str = ",".join(content_types)
-
-        return f"content_type: Literal['{content_type_str}'] = '{content_types[0]}'"
+        return f"content_type: Literal[{content_type_str}] = {repr(content_types[0])}"
 
     def _create_payload_func_arg(self) -> str:
         """
@@ -84,10 +87,16 @@ class EndpointMethodRequestBodyBuilder(BuilderInterface):
         Returns:
             A functional argument called request_body that represents the request body.
         """
-        content = self._read_request_body_content()
+        if self._request_body_kind == BINARY_BODY:
+            return "request_body: Optional[FileInput] = None"
+
+        if self._request_body_kind == MULTIPART_BODY:
+            return "request_body: Optional[Dict[str, Any]] = None"
 
-        for _, content_data in content.items():
-            return f"request_body: {self._determ_content_data_type(content_data)}"
+        if not self._request_body.ref:
+            return "request_body: Dict = {}"
+
+        return f"request_body: {convert_ref_to_class_name(self._request_body.ref)} = {{}}"
 
     def _create_schema_imports(self) -> List[str]:
         """
@@ -96,89 +105,82 @@ class EndpointMethodRequestBodyBuilder(BuilderInterface):
         Returns:
             List[str]: A list of fully qualified import paths for the referenced schemas.
         """
-        schema_imports = []
+        if self._request_body_kind == BINARY_BODY:
+            return [f"from {self._config.import_base}.utils.upload import BinaryBody, FileInput"]
 
-        content = self._read_request_body_content()
+        if self._request_body_kind == MULTIPART_BODY:
+            return [f"from {self._config.import_base}.utils.upload import MultipartBody"]
 
-        for _, content_data in content.items():
-            if not self._is_content_reference(content_data):
-                continue
+        if self._request_body_kind is None:
+            return []
 
-            schema: Dict = content_data.get("schema", {})
+        schema_imports = []
+
+        for ref in self._request_body.refs:
             schema_import_path = convert_ref_to_import_path(
-                import_base=self._config.import_base, ref=schema.get("$ref")
+                import_base=self._config.import_base, ref=ref
             )
             schema_imports.append(schema_import_path)
 
+            if self._config.schema_backend == SchemaBackendEnum.MSGSPEC:
+                schema_imports.append("import msgspec")
+
         return schema_imports
 
-    def _create_request_body_argument(self) -> str:
+    def _create_schema_classes(self) -> List[str]:
         """
-        Determines the request_body argument that is sent to the request base.
+        Collects the schema classes the request body is serialized with, used to warm up the client.
 
         Returns:
-            The request body argument.
+            The class names of the referenced request body schemas.
         """
-        content = self._read_request_body_content()
-        argument = "request_body= request_body"
-
-        for _, content_data in content.items():
-            if not self._is_content_reference(content_data):
-                return argument
+        if self._request_body_kind != JSON_BODY:
+            return []
 
-            return f"{argument}.model_dump()"
+        return [convert_ref_to_class_name(ref) for ref in self._request_body.refs]
 
-    def _read_request_body_content(self) -> Dict:
+    def _create_request_body_argument(self) -> str:
         """
-        Reads the content from the request body when existing.
+        Determines the request_body argument that is sent to the request base.
 
         Returns:
-            A dict with all different request body content types. Returns an empty dict when no content.
+            The request body argument.
         """
-        request_body: Dict = self._method_data.get("requestBody", {})
-        content: Dict = request_body.get("content", {})
+        if self._request_body_kind == BINARY_BODY:
+            return "upload=BinaryBody(request_body, content_type=content_type)"
 
-        return content
+        if self._request_body_kind == MULTIPART_BODY:
+            file_fields = "".join(f"{repr(field)}," for field in self._request_body.file_fields)
+            return f"upload=MultipartBody(request_body, file_fields=({file_fields}))"
 
-    def _determ_content_data_type(self, content_data: Dict) -> str:
-        """
-        Determ the content data type.
+        if self._request_body_kind is None:
+            return None
 
-        Creates the right type based on the content data schema type.
+        argument = "request_body= request_body"
 
-        Returns:
-            Returns dict as type when object, otherwise returns the referenced schema.
-        """
-        if not self._is_content_reference(content_data):
-            return "Dict = {}"
+        if not self._request_body.ref:
+            return argument
+
+        if self._config.schema_backend == SchemaBackendEnum.MSGSPEC:
+            return "content=msgspec.json.encode(request_body)"
 
-        schema: Dict = content_data.get("schema", {})
-        schema_class_name = convert_ref_to_class_name(schema.get("$ref"))
-        schema_fallback = "{}"
-        return f"{schema_class_name} = {schema_fallback}"
+        return f"{argument}.model_dump()"
 
     def _determ_request_body_type(self) -> str:
         """
         Determine the Python type for request_body.
         Minimal helper used only for docstrings.
         """
-        content = self._read_request_body_content()
-
-        for _, content_data in content.items():
-            if self._is_content_reference(content_data):
-                schema = content_data.get("schema", {})
-                return convert_ref_to_class_name(schema.get("$ref"))
-            else:
-                return "Dict[str, Any]"
+        if self._request_body_kind == BINARY_BODY:
+            return "FileInput"
 
-        return "Any"
+        if self._request_body_kind == MULTIPART_BODY:
+            return "Dict[str, Any]"
 
-    def _is_content_reference(self, content_data: Dict) -> bool:
-        """Returns True if the content_data is a OpenAPI reference."""
-        schema: Dict = content_data.get("schema", {})
+        if self._request_body_kind is None:
+            return "Any"
 
-        return "$ref" in schema
+        if self._request_body.ref:
+            return convert_ref_to_class_name(self._request_body.ref)
 
-    def _is_existing(self) -> bool:
-        """Returns true if method data contains a request body."""
-        return "requestBody" in self._method_data
+        return "Dict[str, Any]"
@@ -2,6 +2,8 @@ from typing import Dict, List, Optional
 
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.spec_ir import FieldNode, OperationNode
 from fastapi_client_generator.shared.utils import (
     convert_ref_to_class_name,
     convert_ref_to_import_path,
@@ -9,16 +11,14 @@ from fastapi_client_generator.shared.utils import (
 
 
 class EndpointMethodResponseBuilder(BuilderInterface):
-    def __init__(
-        self,
-        config: Config,
-        method_data: Dict,
-    ) -> None:
+    def __init__(self, config: Config, operation: OperationNode) -> None:
         super().__init__(config)
 
-        self._method_data = method_data
-        self._content_schema = self._read_content_schema()
-        self._response_ref = self._extract_ref(self._content_schema)
+        self._pagination_extension = operation.pagination
+        self._response = operation.response
+        self._is_download = self._response.is_download
+        self._content_schema = self._response.schema
+        self._response_ref = self._response.ref
 
     def build(self) -> Dict:
         """
@@ -27,13 +27,150 @@ class EndpointMethodResponseBuilder(BuilderInterface):
         Returns:
             A dict with response information.
         """
+        response_type = self._create_response_type()
+
         return {
-            "response_type": self._create_response_type(),
+            "is_download": self._is_download,
+            "functional_arguments": self._create_functional_arguments(),
+            "docstring_args": self._create_docstring_args(),
+            "response_type": response_type,
             "method_response": self._create_method_response(),
             "schema_imports": self._create_schema_imports(),
-            "docstring_return": self._create_docstring_return(),
+            "schema_classes": self._create_schema_classes(),
+            "docstring_return": self._create_docstring_return(response_type),
+            "pagination": self._create_pagination(),
         }
 
+    def _create_functional_arguments(self) -> str:
+        """
+        Generates the response related functional arguments, only used by download methods.
+
+        Returns:
+            The download arguments, or an empty string for regular methods.
+        """
+        if not self._is_download:
+            return ""
+
+        return ",".join(
+            [
+                "destination: Optional[DownloadTarget] = None",
+                "chunk_size: int = CHUNK_SIZE",
+                "resume: bool = False",
+            ]
+        )
+
+    def _create_docstring_args(self) -> List[str]:
+        """Generates the docstring arguments for the download arguments."""
+        if not self._is_download:
+            return []
+
+        return [
+            "destination (DownloadTarget): Path or binary file object to stream the file to. Returns an iterator of chunks when omitted.",
+            "chunk_size (int): Number of bytes read from the connection at once.",
+            "resume (bool): Continues a partially downloaded `destination` path using a Range request.",
+        ]
+
+    def _create_pagination(self) -> Optional[Dict]:
+        """
+        Detects where a paginated response keeps its items, next cursor and total.
+
+        Plain array responses are pages by themselves. For object responses the array property is
+        looked up using the `x-pagination` extension or the configured pagination conventions.
+
+        Returns:
+            A dict with the item type and expressions that read from a `page` variable. None when
+            the response does not contain a list of items.
+        """
+        extension = self._pagination_extension
+
+        if extension is False or self._is_download or not self._content_schema:
+            return None
+
+        if not isinstance(extension, dict):
+            extension = {}
+
+        if self._response.type == "array":
+            return self._create_page_pagination(
+                self._content_schema.get("items") or {}, items="page"
+            )
+
+        properties = self._response.properties
+        items_field = self._find_pagination_field("items", properties, extension)
+
+        if not items_field or (properties[items_field] or {}).get("type") != "array":
+            return None
+
+        next_cursor_field = self._find_pagination_field("next_cursor", properties, extension)
+        total_field = self._find_pagination_field("total", properties, extension)
+
+        return self._create_page_pagination(
+            properties[items_field].get("items") or {},
+            items=self._create_page_accessor(items_field),
+            next_cursor=self._create_page_accessor(next_cursor_field),
+            total=self._create_page_accessor(total_field),
+        )
+
+    def _create_page_pagination(
+        self,
+        item_schema: Dict,
+        items: str,
+        next_cursor: Optional[str] = None,
+        total: Optional[str] = None,
+    ) -> Dict:
+        """
+        Creates the pagination information for the given items of a page.
+
+        Returns:
+            A dict with the item type, its imports and the page accessors.
+        """
+        item_ref = item_schema.get("$ref") if self._response_ref else None
+
+        return {
+            "item_type": convert_ref_to_class_name(item_ref) if item_ref else "Any",
+            "schema_imports": [
+                convert_ref_to_import_path(import_base=self._config.import_base, ref=item_ref)
+            ]
+            if item_ref
+            else [],
+            "read_items": items,
+            "read_next_cursor": next_cursor,
+            "read_total": total,
+        }
+
+    def _create_page_accessor(self, field: Optional[str]) -> Optional[str]:
+        """
+        Creates the expression that reads the field from a `page` variable.
+
+        Returns:
+            Attribute access for generated schemas, key access for plain JSON responses.
+        """
+        if not field:
+            return None
+
+        if not self._response_ref:
+            return f"page.get({repr(field)})"
+
+        return f"page.{FieldNode(field, {}).name}"
+
+    def _find_pagination_field(self, role: str, properties: Dict, extension: Dict) -> Optional[str]:
+        """
+        Finds the response property that fulfills the given pagination role.
+
+        Args:
+            role: One of `items`, `next_cursor` or `total`.
+            properties: The properties of the response schema.
+            extension: The `x-pagination` extension of the method.
+
+        Returns:
+            The name of the property, None when the response has no such property.
+        """
+        if f"{role}_field" in extension:
+            name = extension[f"{role}_field"]
+            return name if name in properties else None
+
+        conventions = self._config.pagination_conventions.get(f"{role}_fields", [])
+        return next((name for name in conventions if name in properties), None)
+
     def _create_response_type(self) -> str:
         """
         Creates the response type for the given endpoint method based on the available responses.
@@ -41,14 +178,14 @@ class EndpointMethodResponseBuilder(BuilderInterface):
         Returns:
             A schema class name, a list of schemas, or Dict as fallback.
         """
-        if self._content_schema:
-            schema_type = self._content_schema.get("type")
+        if self._is_download:
+            return "Union[int, Iterator[bytes]]"
 
+        if self._content_schema:
             # Array of referenced model
-            if schema_type == "array":
-                items = self._content_schema.get("items", {})
-                if "$ref" in items:
-                    return f"List[{convert_ref_to_class_name(items['$ref'])}]"
+            if self._response.type == "array":
+                if self._response.item_ref:
+                    return f"List[{convert_ref_to_class_name(self._response.item_ref)}]"
 
                 return "List[Dict]"
 
@@ -66,14 +203,14 @@ class EndpointMethodResponseBuilder(BuilderInterface):
             Parsed model instance(s) if a reference exists,
             otherwise the plain JSON response.
         """
-        if self._content_schema:
-            schema_type = self._content_schema.get("type")
+        if self._config.schema_backend == SchemaBackendEnum.MSGSPEC and self._content_schema:
+            return self._create_msgspec_method_response()
 
+        if self._content_schema:
             # Array of referenced model
-            if schema_type == "array":
-                items = self._content_schema.get("items", {})
-                if "$ref" in items:
-                    class_name = convert_ref_to_class_name(items["$ref"])
+            if self._response.type == "array":
+                if self._response.item_ref:
+                    class_name = convert_ref_to_class_name(self._response.item_ref)
                     return f"[{class_name}(**item) for item in response.json()]"
                 return "response.json()"
 
@@ -84,6 +221,23 @@ class EndpointMethodResponseBuilder(BuilderInterface):
 
         return "response.json()"
 
+    def _create_msgspec_method_response(self) -> str:
+        """
+        Creates the response for the msgspec backend, which decodes the JSON bytes straight into the
+        response type without building intermediate dicts.
+
+        Returns:
+            A `msgspec.json.decode(...)` call for the response content.
+        """
+        if self._response.item_ref:
+            decode_type = f"List[{convert_ref_to_class_name(self._response.item_ref)}]"
+        elif self._response_ref and self._response.type != "array":
+            decode_type = convert_ref_to_class_name(self._response_ref)
+        else:
+            return "msgspec.json.decode(response.content)"
+
+        return f"msgspec.json.decode(response.content, type={decode_type})"
+
     def _create_schema_imports(self) -> List[str]:
         """
         Converts the response ref into import statements.
@@ -91,77 +245,43 @@ class EndpointMethodResponseBuilder(BuilderInterface):
         Returns:
             List[str]: A list of fully qualified import paths for the referenced schemas.
         """
+        if self._is_download:
+            return [
+                f"from {self._config.import_base}.utils.download import CHUNK_SIZE, DownloadTarget"
+            ]
+
+        backend_imports = (
+            ["import msgspec"]
+            if self._config.schema_backend == SchemaBackendEnum.MSGSPEC and self._content_schema
+            else []
+        )
+
         if not self._response_ref:
-            return []
+            return backend_imports
 
         import_path = convert_ref_to_import_path(
             import_base=self._config.import_base,
             ref=self._response_ref,
         )
-        return [import_path]
-
-    def _create_docstring_return(self) -> str:
-        """
-        Creates the return annotation for the method docstring.
-        """
-        response_type = self._create_response_type()
-        return f"{response_type}: The response returned by the endpoint."
-
-    def _read_content_schema(self) -> Optional[Dict]:
-        """
-        Extracts the schema from the first valid 2xx content-type response.
-
-        Returns:
-            The schema dict or None.
-        """
-        responses: Dict = self._method_data.get("responses", {})
-
-        for status, status_info in responses.items():
-            if not self._number_in_between(int(status), 200, 299):
-                continue
-
-            content = status_info.get("content", {})
-            schema = self._read_first_content_type(content)
+        return [*backend_imports, import_path]
 
-            if schema:
-                return schema
-
-        return None
-
-    def _number_in_between(self, number: int, min: int, max: int) -> bool:
+    def _create_schema_classes(self) -> List[str]:
         """
-        Determines if the number is between value min and max.
+        Collects the schema classes the response is validated with, used to warm up the client.
 
         Returns:
-            True if in between.
+            The class name of the referenced response schema, empty for downloads and plain JSON.
         """
-        return min <= number <= max
-
-    def _read_first_content_type(self, content: Dict) -> Optional[Dict]:
-        """
-        Returns the schema of the first defined content type.
-
-        Returns:
-            The schema dict or None.
-        """
-        for _, content_data in content.items():
-            return content_data.get("schema", {})
+        if self._is_download or not self._response_ref:
+            return []
 
-        return None
+        return [convert_ref_to_class_name(self._response_ref)]
 
-    def _extract_ref(self, schema: Optional[Dict]) -> Optional[str]:
+    def _create_docstring_return(self, response_type: str) -> str:
         """
-        Finds a $ref in the schema, or in array items.
-
-        Returns:
-            The reference string or None.
+        Creates the return annotation for the method docstring.
         """
-        if not schema:
-            return None
+        if self._is_download:
+            return f"{response_type}: The number of written bytes, or an iterator over the file chunks."
 
-        if "$ref" in schema:
-            return schema["$ref"]
-
-        if schema.get("type") == "array":
-            items = schema.get("items", {})
-            return items.get("$ref")
+        return f"{response_type}: The response returned by the endpoint."
@@ -1,9 +1,14 @@
 from pathlib import Path
-from typing import List, Set, Union
+from typing import List, Optional, Set, Tuple
 
 from fastapi_client_generator.builders.schema.schema_field_builder import SchemaFieldBuilder
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.import_planner import TYPING_IMPORT, plan_imports
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.schema_enums import SchemaEnums
+from fastapi_client_generator.shared.schema_unions import SchemaUnions
+from fastapi_client_generator.shared.spec_ir import FieldNode, SchemaNode
 from fastapi_client_generator.shared.template_enum import TemplateEnum
 from fastapi_client_generator.shared.utils import (
     convert_enum_to_literal,
@@ -18,12 +23,19 @@ class SchemaBuilder(BuilderInterface):
     def __init__(
         self,
         config: Config,
-        schema_name: str,
-        schema_data: dict,
+        schema: SchemaNode,
+        schema_cycle: Optional[Set[str]] = None,
+        schema_unions: Optional[SchemaUnions] = None,
+        schema_enums: Optional[SchemaEnums] = None,
     ) -> None:
         super().__init__(config)
-        self._schema_name = schema_name
-        self._schema_data = schema_data or {}
+        self._schema = schema
+        self._schema_name = schema.name
+        self._schema_data = schema.data
+        self._schema_cycle = schema_cycle or set()
+        self._schema_unions = schema_unions
+        self._schema_tag = schema_unions.tag_of(schema.name) if schema_unions else None
+        self._schema_enums = schema_enums
 
     def build(self) -> None:
         """Builds the pydantic schemas for the API-client."""
@@ -49,10 +61,7 @@ class SchemaBuilder(BuilderInterface):
         Returns:
             The rendered Jinja template as string
         """
-
-        schema_type = self._schema_data.get("type")
-
-        if is_primitive_type(schema_type):
+        if is_primitive_type(self._schema.type):
             return self._create_primitive_schema()
 
         return self._create_object_schema()
@@ -60,7 +69,10 @@ class SchemaBuilder(BuilderInterface):
     def _create_primitive_schema(self) -> str:
         """Converts a OpenAPI primitive type schema to a Pydantic schema."""
 
-        schema_declaration = map_primitive(self._schema_data.get("type"))
+        if self._schema_enums and self._schema_enums.is_large(self._schema_data):
+            return self._create_enum_schema()
+
+        schema_declaration = map_primitive(self._schema.type)
 
         if "enum" in self._schema_data:
             schema_declaration = convert_enum_to_literal(self._schema_data)
@@ -69,33 +81,133 @@ class SchemaBuilder(BuilderInterface):
             name=TemplateEnum.SCHEMA_PRIMITIVE_TEMPLATE.value,
         ).render(
             {
+                "import_block": plan_imports(
+                    self._config.import_base,
+                    ["from __future__ import annotations", TYPING_IMPORT],
+                    [schema_declaration],
+                ),
                 "schema_name": f"{self._schema_name}Schema",
                 "schema_declaration": schema_declaration,
                 "description": self._schema_data.get("description"),
             }
         )
 
-    def _create_object_schema(self) -> str:
-        """Converts a OpenAPI object type schema to a Pydantic schema."""
+    def _create_enum_schema(self) -> str:
+        """Converts a OpenAPI enum schema with many values to a hashed-set validated type."""
+        enum_definition = self._schema_enums.create_definition(
+            f"{self._schema_name}Schema", self._schema_data
+        )
+
         return self._config.jinja_env.get_template(
-            name=TemplateEnum.SCHEMA_OBJECT_TEMPLATE.value
+            name=TemplateEnum.SCHEMA_ENUM_TEMPLATE.value,
         ).render(
             {
-                "import_base": self._config.import_base,
+                "import_block": self._schema_enums.create_import_block(
+                    [enum_definition], self._config.import_base, self._config.schema_backend
+                ),
+                "schema_backend": self._config.schema_backend.value,
+                "enums": [{**enum_definition, "description": self._schema_data.get("description")}],
+            }
+        )
+
+    def _create_object_schema(self) -> str:
+        """
+        Converts a OpenAPI object type schema to a Pydantic or msgspec schema.
+
+        The imports are planned from the fields, so only the names the fields refer to are imported.
+        """
+        if self._config.schema_backend == SchemaBackendEnum.MSGSPEC:
+            template = TemplateEnum.SCHEMA_OBJECT_MSGSPEC_TEMPLATE
+            backend_import = "import msgspec"
+        else:
+            template = TemplateEnum.SCHEMA_OBJECT_TEMPLATE
+            backend_import = "from pydantic import Field"
+
+        schema_fields = self._create_schema_field_list()
+        schema_options = self._create_schema_options()
+        schema_code = ["BaseSchema", schema_options, *schema_fields]
+        import_list = [
+            "from __future__ import annotations",
+            backend_import,
+            TYPING_IMPORT,
+            "from typing_extensions import Annotated",
+            f"from {self._config.import_base}.schemas.base_schema import BaseSchema",
+            *self._create_imports(),
+        ]
+        deferred_import_block = plan_imports(
+            self._config.import_base, self._create_imports(deferred=True), schema_code
+        )
+
+        return self._config.jinja_env.get_template(name=template.value).render(
+            {
                 "schema_name": f"{self._schema_name}Schema",
-                "schema_fields": self._create_schema_field_list(),
-                "import_list": self._create_imports(),
+                "schema_fields": schema_fields,
+                "schema_options": schema_options,
+                "tag_subclasses": self._create_tag_subclasses(),
+                "import_block": plan_imports(self._config.import_base, import_list, schema_code),
+                "deferred_import_list": deferred_import_block.splitlines(),
             }
         )
 
+    def _create_schema_options(self) -> str:
+        """
+        Creates the class keyword arguments of a msgspec Struct that is member of a discriminated union.
+
+        msgspec reads and writes the tag itself, so the tag property is not generated as a field.
+
+        Returns:
+            The keyword arguments prefixed with a comma, an empty string when there are none.
+        """
+        if self._config.schema_backend != SchemaBackendEnum.MSGSPEC or not self._schema_tag:
+            return ""
+
+        tag_field, tag_values = self._schema_tag
+        return f", tag_field={repr(tag_field)}, tag={repr(tag_values[0])}"
+
+    def _create_tag_subclasses(self) -> List[Tuple[str, str]]:
+        """
+        Creates a subclass of a msgspec Struct for every tag value after the first.
+
+        A Struct is selected by a single tag value, the subclasses let the union select the schema by
+        its other tag values as well.
+
+        Returns:
+            The class name and the tag keyword argument of every subclass.
+        """
+        if self._config.schema_backend != SchemaBackendEnum.MSGSPEC or not self._schema_tag:
+            return []
+
+        _, tag_values = self._schema_tag
+        class_names = self._schema_unions.tag_class_names(self._schema_name)
+        return [
+            (class_name, f"tag={repr(tag_value)}")
+            for class_name, tag_value in zip(class_names[1:], tag_values[1:])
+        ]
+
     def _create_schema_field_list(self) -> List[str]:
-        """Creates a Pydantic field for each property within the schema using `SchemaFieldBuilder`."""
-        properties = self._schema_data.get("properties", {}) or {}
+        """
+        Creates a Pydantic field for each property within the schema using `SchemaFieldBuilder`.
+
+        The tag property of a member of a discriminated union only accepts the tags of the member,
+        it is added when the schema does not declare it and left to msgspec for Structs.
+        """
+        fields = self._schema.fields
+        tag_field, tag_values = self._schema_tag or (None, None)
         generated_field_list = []
 
-        for field_key, field_obj in properties.items():
+        if tag_field is not None and all(field.key != tag_field for field in fields):
+            fields = [FieldNode(tag_field, {}, tag_field in self._schema.required), *fields]
+
+        for field in fields:
+            if field.key == tag_field and self._config.schema_backend == SchemaBackendEnum.MSGSPEC:
+                continue
+
             field_name, field_declaration = SchemaFieldBuilder(
-                field_key=field_key, field_obj=field_obj, schema_obj=self._schema_data
+                field=field,
+                schema_backend=self._config.schema_backend,
+                schema_unions=self._schema_unions,
+                schema_enums=self._schema_enums,
+                tag_values=tag_values if field.key == tag_field else None,
             ).build()
 
             schema_field = f"{field_name}: {field_declaration}"
@@ -103,79 +215,45 @@ class SchemaBuilder(BuilderInterface):
 
         return generated_field_list
 
-    def _create_imports(self) -> List[str]:
+    def _create_imports(self, deferred: bool = False) -> List[str]:
         """
         Creates the schema imports where the current schema depends on.
 
+        Schemas within the same reference cycle import each other at the bottom of the module, after
+        the class is defined, so the circular import resolves. The annotations are postponed, so the
+        names are only needed once the model is built. Shared enums are imported at the top.
+
+        Args:
+            deferred: Creates the imports of the schemas in the same cycle instead of the others.
+
         Returns:
             A list container all required imports.
         """
-        ref_list = self._collect_schema_ref_list()
         schema_imports = []
 
-        for ref_name in sorted(ref_list):
-            if ref_name == self._schema_name:
+        for ref_name in sorted(self._schema.refs):
+            if ref_name == self._schema_name or (ref_name in self._schema_cycle) != deferred:
                 continue
 
             import_path = convert_ref_to_import_path(
                 import_base=self._config.import_base, ref=ref_name
             )
-            schema_imports.append(import_path)
-
-        return schema_imports
-
-    def _collect_schema_ref_list(self) -> Set[str]:
-        """
-        Collects all ref elements from the schema properties object.
+            schema_imports.append(import_path + self._create_tag_subclass_imports(ref_name))
 
-        Returns:
-            A list of all schemas that are referenced.
-        """
-        ref_list: Set[str] = set()
-        properties: dict = self._schema_data.get("properties", {})
-
-        for prop in properties.values():
-            self._walk_node(prop, ref_list)
-
-        return ref_list
-
-    def _walk_node(self, node: Union[dict, list, None], ref_list: Set[str]) -> None:
-        """Dispatches to the correct handler based on the node type."""
-        if node is None:
-            return
-        if isinstance(node, dict):
-            self._walk_dict(node, ref_list)
-        elif isinstance(node, list):
-            self._walk_list(node, ref_list)
-
-    def _walk_dict(self, node: dict, ref_list: Set[str]) -> None:
-        """Collects all refs from a dict and adds them to the `ref_list`."""
-
-        if "$ref" in node:
-            self._add_ref_from_string(node["$ref"], ref_list)
+        shared_enums = self._schema_enums.used_by(self._schema_name) if self._schema_enums else []
 
-        if node.get("type") == "array":
-            self._walk_node(node.get("items"), ref_list)
-
-        for key in ("oneOf", "anyOf", "allOf"):
-            if key in node:
-                self._walk_node(node[key], ref_list)
+        if shared_enums and not deferred:
+            schema_imports.append(
+                f"from {self._config.import_base}.schemas.shared_enums import {', '.join(shared_enums)}"
+            )
 
-        for value in node.values():
-            if isinstance(value, (dict, list)):
-                self._walk_node(value, ref_list)
+        return schema_imports
 
-    def _walk_list(self, items: list, ref_list: Set[str]) -> None:
-        """Walks through a list and triggers `_walk_dict` for each item."""
-        for item in items:
-            self._walk_node(item, ref_list)
+    def _create_tag_subclass_imports(self, ref_name: str) -> str:
+        """Creates the additional names to import of a msgspec Struct with tag subclasses."""
+        if self._config.schema_backend != SchemaBackendEnum.MSGSPEC or not self._schema_unions:
+            return ""
 
-    def _add_ref_from_string(self, ref_str: str, ref_list: Set[str]) -> None:
-        """
-        Extracts the last section of a $ref string which is the schema name thats is required as import.
-
-        The value is stored within the ref_list.
-        """
-        parts = ref_str.split("/")
-        if parts:
-            ref_list.add(parts[-1])
+        return "".join(
+            f", {class_name}" for class_name in self._schema_unions.tag_class_names(ref_name)[1:]
+        )
@@ -1,6 +1,10 @@
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastapi_client_generator.interfaces.builder_interface import BuilderInterface
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.schema_enums import SchemaEnums
+from fastapi_client_generator.shared.schema_unions import UNION_KEYS, SchemaUnions
+from fastapi_client_generator.shared.spec_ir import FieldNode
 from fastapi_client_generator.shared.utils import (
     convert_enum_to_literal,
     convert_ref_to_class_name,
@@ -11,20 +15,32 @@ from fastapi_client_generator.shared.utils import (
 
 class SchemaFieldBuilder(BuilderInterface):
     """
-    Generates a single Pydantic field line from an OpenAPI property.
+    Generates a single Pydantic or msgspec field line from an OpenAPI property.
     Handles:
       - primitive types (string, boolean, integer, number)
       - $ref
       - arrays of primitive
       - arrays of $ref
+      - oneOf/anyOf unions, discriminated when `schema_unions` finds a tag property
+      - allOf wrapping a single type
+      - enums, shared when `schema_enums` considers them large
     """
 
-    def __init__(self, field_key: str, field_obj: Dict, schema_obj: Dict) -> None:
+    def __init__(
+        self,
+        field: FieldNode,
+        schema_backend: SchemaBackendEnum = SchemaBackendEnum.PYDANTIC,
+        schema_unions: Optional[SchemaUnions] = None,
+        tag_values: Optional[List[Any]] = None,
+        schema_enums: Optional[SchemaEnums] = None,
+    ) -> None:
         super().__init__(config=None)
-        self._field_key = field_key
-        self._field_key_snake_case = pascal_to_snake(field_key)
-        self._field_obj = field_obj or {}
-        self._schema_obj = schema_obj or {}
+        self._field = field
+        self._field_obj = field.data
+        self._schema_backend = schema_backend
+        self._schema_unions = schema_unions
+        self._tag_values = tag_values
+        self._schema_enums = schema_enums
 
     def build(self) -> Tuple[str, str]:
         """
@@ -40,30 +56,78 @@ class SchemaFieldBuilder(BuilderInterface):
                 - The complete field declaration as a string
                 (e.g., `"created_at: Optional[str] = Field(default=None, alias='createdAt')"`).
         """
+        if self._tag_values:
+            return self._field.name, self._create_tag_declaration()
+
         field_type = self._resolve_type(self._field_obj)
 
+        if self._schema_backend == SchemaBackendEnum.MSGSPEC:
+            return self._field.name, self._create_msgspec_declaration(field_type)
+
         field_params = [self._determ_default(), *self._determ_common_params(), self._determ_alias()]
-        field_key = self._validate_key_not_reserved()
         field_declaration = f"{self._wrap_optional(field_type)} = Field({self._stringify_field_params(field_params)})"
 
-        return field_key, field_declaration
+        return self._field.name, field_declaration
 
-    def _validate_key_not_reserved(self) -> str:
+    def _create_tag_declaration(self) -> str:
         """
-        Validates if the key of the schema field does not match a reserved python word.
+        Creates the declaration of the tag field of a member of a discriminated union.
 
-        Adds a '_' when it's reserved.
+        The field only accepts the tag values of the schema, so Pydantic can select the member by
+        the tag. A single tag value is used as default, so it does not need to be passed.
 
         Returns:
-            The key of the schema field.
+            The field declaration (e.g., `"Literal['cat'] = Field(default='cat', alias='petType')"`).
         """
+        field_type = convert_enum_to_literal({"enum": self._tag_values})
+        field_params = [
+            f"default={repr(self._tag_values[0])}" if len(self._tag_values) == 1 else "default=...",
+            self._read_optional_field_param("description", str),
+            self._read_optional_field_param("title", str),
+            self._determ_alias(),
+        ]
 
-        reserved_list = ["from"]
+        return f"{field_type} = Field({self._stringify_field_params(field_params)})"
 
-        if self._field_key_snake_case not in reserved_list:
-            return self._field_key_snake_case
+    def _create_msgspec_declaration(self, field_type: str) -> str:
+        """
+        Creates the field declaration for a msgspec Struct.
 
-        return f"{self._field_key_snake_case}_"
+        Constraints and documentation are attached using `Annotated[..., msgspec.Meta(...)]`, the
+        original property name is kept with `msgspec.field(name=...)` when it is not snake_case.
+
+        Returns:
+            The field declaration (e.g., `"created_at: Optional[str] = msgspec.field(default=None, name='createdAt')"`).
+        """
+        meta_params = [
+            self._read_optional_field_param(key, key_type)
+            for key, key_type in (("description", str), ("title", str))
+        ]
+
+        if field_type == "str":
+            meta_params += [
+                self._read_optional_field_param(key, key_type)
+                for key, key_type in (("maxLength", int), ("minLength", int))
+            ]
+
+        if any(meta_params):
+            field_type = f"Annotated[{field_type}, msgspec.Meta({self._stringify_field_params(meta_params)})]"
+
+        field_params = [
+            None if self._field.required else "default=None",
+            self._determ_msgspec_name(),
+        ]
+
+        if not field_params[1]:
+            return self._wrap_optional(field_type) + ("" if self._field.required else " = None")
+
+        return f"{self._wrap_optional(field_type)} = msgspec.field({self._stringify_field_params(field_params)})"
+
+    def _determ_msgspec_name(self) -> Optional[str]:
+        """Keeps the original property name when the field name differs from it."""
+        if self._field.name == self._field.key:
+            return None
+        return f"name={repr(self._field.key)}"
 
     def _stringify_field_params(self, field_params: List[Optional[str]]) -> str:
         """Converts the Pydantic field parameters into a list of parameters."""
@@ -72,14 +136,14 @@ class SchemaFieldBuilder(BuilderInterface):
 
     def _wrap_optional(self, resolved_type: str) -> str:
         """Adds Optional[...] if the field is not required."""
-        if self._is_required():
+        if self._field.required or resolved_type.startswith("Optional["):
             return resolved_type
 
         return f"Optional[{resolved_type}]"
 
     def _determ_default(self) -> str:
         """Determines the default for a field."""
-        return "default=..." if self._is_required() else "default=None"
+        return "default=..." if self._field.required else "default=None"
 
     def _determ_common_params(self) -> List[Optional[str]]:
         """
@@ -96,9 +160,9 @@ class SchemaFieldBuilder(BuilderInterface):
 
     def _determ_alias(self) -> Optional[str]:
         """Adds an alias if the default field name is not in snake_case."""
-        if self._field_key_snake_case == self._field_key:
+        if self._field.snake_name == self._field.key:
             return None
-        return f"alias={repr(self._field_key)}"
+        return f"alias={repr(self._field.key)}"
 
     def _read_optional_field_param(self, key: str, _key_type: Union[int, str]) -> Optional[str]:
         """
@@ -114,17 +178,16 @@ class SchemaFieldBuilder(BuilderInterface):
 
         return f"{pascal_to_snake(key)}={value_str}"
 
-    def _is_required(self) -> bool:
-        """Determines whether a field is required (based on schema_obj['required'])."""
-        required = (self._schema_obj or {}).get("required", []) or []
-        return self._field_key in required
-
     def _resolve_type(self, obj: Dict) -> str:
         """
         Determines the Python/Pydantic type as a string.
         Cases:
         - $ref               -> 'RefNameSchema'
+        - oneOf/anyOf        -> 'Union[<resolved member types>]'
+        - allOf              -> the single resolved member type
         - type == 'array'    -> 'List[<resolved item type>]'
+        - const              -> 'Literal[<value>]'
+        - enum               -> 'Literal[<values>]', or the shared enum for large enums
         - primitive          -> via mapping
         """
         if not isinstance(obj, Dict):
@@ -133,16 +196,108 @@ class SchemaFieldBuilder(BuilderInterface):
         if "$ref" in obj:
             return convert_ref_to_class_name(obj["$ref"])
 
+        union_key = next((key for key in UNION_KEYS if obj.get(key)), None)
+
+        if union_key:
+            return self._resolve_union_type(obj, obj[union_key])
+
+        if obj.get("allOf"):
+            return self._resolve_all_of_type(obj["allOf"])
+
+        if "const" in obj:
+            return f"Literal[{repr(obj['const'])}]"
+
         field_type = obj.get("type")
 
         if field_type == "array":
             return self._resolve_array_type(obj)
 
         if obj.get("enum"):
-            return convert_enum_to_literal(obj)
+            shared_enum = self._schema_enums.alias_of(obj) if self._schema_enums else None
+            return shared_enum or convert_enum_to_literal(obj)
 
         return map_primitive(field_type)
 
+    def _resolve_union_type(self, obj: Dict, members: List[Dict]) -> str:
+        """
+        Processes `oneOf` and `anyOf` into a Union of the member types.
+
+        Pydantic unions with a tag property are discriminated, so validation selects the member by
+        its tag instead of trying every member in turn. msgspec discriminates on the tags of the
+        member Structs, and on the tag subclasses of members with several tags, but can not decode
+        unions of several untagged object types, which fall back to Any. A `null` member makes the union Optional.
+        """
+        nullable = any(
+            isinstance(member, dict) and member.get("type") == "null" for member in members
+        )
+        member_types: List[str] = []
+
+        for member in members:
+            if isinstance(member, dict) and member.get("type") == "null":
+                continue
+
+            member_type = self._resolve_type(member)
+            if member_type not in member_types:
+                member_types.append(member_type)
+
+        if not member_types or "Any" in member_types:
+            return "Any"
+
+        if len(member_types) == 1:
+            union_type = member_types[0]
+        else:
+            union_type = f"Union[{', '.join(member_types)}]"
+            discriminator = (
+                self._schema_unions.discriminator_of(obj) if self._schema_unions else None
+            )
+
+            if self._schema_backend == SchemaBackendEnum.MSGSPEC:
+                if not discriminator and not self._is_msgspec_union(members):
+                    return "Any"
+                if discriminator:
+                    union_type = f"Union[{', '.join(self._create_tag_class_names(members))}]"
+            elif discriminator:
+                field_name = FieldNode(discriminator, {}).name
+                union_type = f"Annotated[{union_type}, Field(discriminator={repr(field_name)})]"
+
+        return f"Optional[{union_type}]" if nullable else union_type
+
+    def _create_tag_class_names(self, members: List[Dict]) -> List[str]:
+        """Lists the Structs of a discriminated msgspec union, including the tag subclasses."""
+        return [
+            class_name
+            for member in members
+            if isinstance(member, dict) and "$ref" in member
+            for class_name in self._schema_unions.tag_class_names(member["$ref"].split("/")[-1])
+        ]
+
+    def _resolve_all_of_type(self, members: List[Dict]) -> str:
+        """
+        Processes `allOf`, which is commonly used to attach a description or default to a `$ref`.
+
+        Returns:
+            The type of the only typed member, Any when several members have to be combined.
+        """
+        member_types = [self._resolve_type(member) for member in members]
+        typed_members = [member_type for member_type in member_types if member_type != "Any"]
+
+        return typed_members[0] if len(typed_members) == 1 else "Any"
+
+    def _is_msgspec_union(self, members: List[Dict]) -> bool:
+        """Returns True when msgspec can decode the union, which allows one object and one array type."""
+        object_members = [
+            member
+            for member in members
+            if isinstance(member, dict) and ("$ref" in member or member.get("type") == "object")
+        ]
+        array_members = [
+            member
+            for member in members
+            if isinstance(member, dict) and member.get("type") == "array"
+        ]
+
+        return len(object_members) <= 1 and len(array_members) <= 1
+
     def _resolve_array_type(self, obj: Dict) -> str:
         """Processes the field type array."""
         items = obj.get("items", {})
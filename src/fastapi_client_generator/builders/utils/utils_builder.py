@@ -12,16 +12,120 @@ class UtilsBuilder(BuilderInterface):
         Builds the utils for the given client by performing the following steps:
 
         1. Creating the request base.
+        2. Creating the upload helpers used for streaming request bodies.
+        3. Creating the download helpers used for streaming response bodies.
+        4. Creating the pagination helpers used by the generated `iter_all` methods.
+        5. Creating the rate limiter that can be passed to the client.
+        6. Creating the single-flight helper that coalesces identical concurrent requests.
+        7. Creating the warm-up helper that builds schema validators ahead of the first request.
+        8. Creating the hashed-set validator used by large enums.
+        9. Creating the transports that call an application in-process.
         """
         self._create_request_base()
+        self._create_upload()
+        self._create_download()
+        self._create_pagination()
+        self._create_rate_limit()
+        self._create_single_flight()
+        self._create_warmup()
+        self._create_enum_values()
+        self._create_transport()
 
     def _create_request_base(self) -> None:
         """Creates the the base request logic shared by all autogenerated endpoint clients."""
         request_base_template = self._config.jinja_env.get_template(
             name=TemplateEnum.UTIL_REQUEST_BASE.value
-        ).render()
+        ).render({"import_base": self._config.import_base})
 
         self._config.file_manager.save_python(
             file_path=self._config.root_path / "utils" / "request_base.py",
             code=request_base_template,
         )
+
+    def _create_upload(self) -> None:
+        """Creates the upload helpers that stream files and multipart bodies to the API."""
+        upload_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_UPLOAD.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "upload.py",
+            code=upload_template,
+        )
+
+    def _create_download(self) -> None:
+        """Creates the download helpers that stream file responses to disk or an iterator."""
+        download_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_DOWNLOAD.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "download.py",
+            code=download_template,
+        )
+
+    def _create_pagination(self) -> None:
+        """Creates the pagination helpers that iterate lazily over all pages of an endpoint."""
+        pagination_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_PAGINATION.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "pagination.py",
+            code=pagination_template,
+        )
+
+    def _create_rate_limit(self) -> None:
+        """Creates the rate limiter that throttles requests of the client or single endpoints."""
+        rate_limit_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_RATE_LIMIT.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "rate_limit.py",
+            code=rate_limit_template,
+        )
+
+    def _create_single_flight(self) -> None:
+        """Creates the helper that lets identical concurrent requests share one call."""
+        single_flight_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_SINGLE_FLIGHT.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "single_flight.py",
+            code=single_flight_template,
+        )
+
+    def _create_warmup(self) -> None:
+        """Creates the helper that builds the validators of schemas before they are first used."""
+        warmup_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_WARMUP.value
+        ).render({"schema_backend": self._config.schema_backend.value})
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "warmup.py",
+            code=warmup_template,
+        )
+
+    def _create_enum_values(self) -> None:
+        """Creates the hashed-set validator that checks the values of large enums."""
+        enum_values_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_ENUM_VALUES.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "enum_values.py",
+            code=enum_values_template,
+        )
+
+    def _create_transport(self) -> None:
+        """Creates the transports that call an ASGI or WSGI application without opening sockets."""
+        transport_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.UTIL_TRANSPORT.value
+        ).render()
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "utils" / "transport.py",
+            code=transport_template,
+        )
@@ -1,9 +1,75 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
 import typer
+from typing_extensions import Annotated
 
-from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.utils import download_api_spec_content
 
 cli = typer.Typer(no_args_is_help=True)
 
+# The generators, and the Jinja templates and processors they load, are imported by the commands
+# that use them, so `--help` and argument errors are answered without loading them.
+
+# The operation filters are shared by every command that generates a client.
+IncludeTagOption = Annotated[
+    Optional[List[str]],
+    typer.Option("--include-tag", help="Only generate operations with this tag (repeatable)"),
+]
+ExcludeTagOption = Annotated[
+    Optional[List[str]],
+    typer.Option("--exclude-tag", help="Leave out operations with this tag (repeatable)"),
+]
+IncludePathOption = Annotated[
+    Optional[List[str]],
+    typer.Option("--include-path", help="Only generate paths matching this glob (repeatable)"),
+]
+ExcludePathOption = Annotated[
+    Optional[List[str]],
+    typer.Option("--exclude-path", help="Leave out paths matching this glob (repeatable)"),
+]
+IncludeOperationIdOption = Annotated[
+    Optional[List[str]],
+    typer.Option(
+        "--include-operation-id",
+        help="Only generate operations whose operationId matches this glob (repeatable)",
+    ),
+]
+ExcludeOperationIdOption = Annotated[
+    Optional[List[str]],
+    typer.Option(
+        "--exclude-operation-id",
+        help="Leave out operations whose operationId matches this glob (repeatable)",
+    ),
+]
+
+
+def _create_generator(
+    client_name: str,
+    schema_backend: SchemaBackendEnum,
+    include_tag: Optional[List[str]],
+    exclude_tag: Optional[List[str]],
+    include_path: Optional[List[str]],
+    exclude_path: Optional[List[str]],
+    include_operation_id: Optional[List[str]],
+    exclude_operation_id: Optional[List[str]],
+):
+    """Creates the generator of a command from its client name, schema backend and filter options."""
+    from fastapi_client_generator.client import FastapiClientGenerator
+
+    return FastapiClientGenerator(
+        client_name=client_name,
+        schema_backend=schema_backend,
+        include_tags=include_tag,
+        exclude_tags=exclude_tag,
+        include_paths=include_path,
+        exclude_paths=exclude_path,
+        include_operation_ids=include_operation_id,
+        exclude_operation_ids=exclude_operation_id,
+    )
+
 
 @cli.command("from-url")
 def generate_from_url(
@@ -11,11 +77,41 @@ def generate_from_url(
         ..., "--client-name", "-c", help="Name of the generated client package"
     ),
     url: str = typer.Option(..., "--url", "-u", help="URL pointing to the OpenAPI specification"),
+    schema_backend: SchemaBackendEnum = typer.Option(
+        SchemaBackendEnum.PYDANTIC,
+        "--schema-backend",
+        help="Model backend of the generated schemas",
+    ),
+    include_tag: IncludeTagOption = None,
+    exclude_tag: ExcludeTagOption = None,
+    include_path: IncludePathOption = None,
+    exclude_path: ExcludePathOption = None,
+    include_operation_id: IncludeOperationIdOption = None,
+    exclude_operation_id: ExcludeOperationIdOption = None,
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Only check whether the generated client is up to date, exits with 1 when stale",
+    ),
 ):
     """
     Generate a client from a remote OpenAPI URL.
     """
-    FastapiClientGenerator(client_name=client_name).from_url(url)
+    generator = _create_generator(
+        client_name,
+        schema_backend,
+        include_tag,
+        exclude_tag,
+        include_path,
+        exclude_path,
+        include_operation_id,
+        exclude_operation_id,
+    )
+
+    if check:
+        return _check_client(client_name, generator.check(download_api_spec_content(url)))
+
+    generator.from_url(url)
     typer.echo(f"Client '{client_name}' generated from OpenAPI URL: {url}")
 
 
@@ -27,9 +123,185 @@ def generate_from_file(
     file_path: str = typer.Option(
         ..., "--file-path", "-f", help="Path to a local OpenAPI JSON/YAML file"
     ),
+    schema_backend: SchemaBackendEnum = typer.Option(
+        SchemaBackendEnum.PYDANTIC,
+        "--schema-backend",
+        help="Model backend of the generated schemas",
+    ),
+    include_tag: IncludeTagOption = None,
+    exclude_tag: ExcludeTagOption = None,
+    include_path: IncludePathOption = None,
+    exclude_path: ExcludePathOption = None,
+    include_operation_id: IncludeOperationIdOption = None,
+    exclude_operation_id: ExcludeOperationIdOption = None,
+    check: bool = typer.Option(
+        False,
+        "--check",
+        help="Only check whether the generated client is up to date, exits with 1 when stale",
+    ),
 ):
     """
     Generate a client from a local OpenAPI file.
     """
-    FastapiClientGenerator(client_name=client_name).from_file_path(file_path)
+    generator = _create_generator(
+        client_name,
+        schema_backend,
+        include_tag,
+        exclude_tag,
+        include_path,
+        exclude_path,
+        include_operation_id,
+        exclude_operation_id,
+    )
+
+    if check:
+        api_spec = json.loads(Path(file_path).expanduser().read_text())
+        return _check_client(client_name, generator.check(api_spec))
+
+    generator.from_file_path(file_path)
     typer.echo(f"Client '{client_name}' generated from file: {file_path}")
+
+
+def _check_client(client_name: str, stale_files: List[str]) -> None:
+    """Reports whether the client is up to date, exits with 1 and lists the stale files if not."""
+    if not stale_files:
+        typer.echo(f"Client '{client_name}' is up to date")
+        return
+
+    typer.echo(
+        f"Client '{client_name}' is stale, regenerating would update {len(stale_files)} files:"
+    )
+    for stale_file in stale_files:
+        typer.echo(f"  {stale_file}")
+
+    raise typer.Exit(code=1)
+
+
+@cli.command("watch")
+def watch(
+    client_name: str = typer.Option(
+        ..., "--client-name", "-c", help="Name of the generated client package"
+    ),
+    file_path: Optional[str] = typer.Option(
+        None, "--file-path", "-f", help="Path to a local OpenAPI JSON file to watch"
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", "-u", help="URL pointing to the OpenAPI specification to poll"
+    ),
+    schema_backend: SchemaBackendEnum = typer.Option(
+        SchemaBackendEnum.PYDANTIC,
+        "--schema-backend",
+        help="Model backend of the generated schemas",
+    ),
+    include_tag: IncludeTagOption = None,
+    exclude_tag: ExcludeTagOption = None,
+    include_path: IncludePathOption = None,
+    exclude_path: ExcludePathOption = None,
+    include_operation_id: IncludeOperationIdOption = None,
+    exclude_operation_id: ExcludeOperationIdOption = None,
+    interval: float = typer.Option(1.0, "--interval", help="Seconds between two checks"),
+    debounce: float = typer.Option(
+        0.5, "--debounce", help="Seconds a change has to settle before regenerating"
+    ),
+):
+    """
+    Generate a client and regenerate it whenever the OpenAPI specification changes.
+    """
+    if (file_path is None) == (url is None):
+        raise typer.BadParameter("Provide either --file-path or --url")
+
+    generator = _create_generator(
+        client_name,
+        schema_backend,
+        include_tag,
+        exclude_tag,
+        include_path,
+        exclude_path,
+        include_operation_id,
+        exclude_operation_id,
+    )
+    generator.watch(file_path or url, interval=interval, debounce=debounce)
+
+
+@cli.command("package")
+def package(
+    client_name: str = typer.Option(
+        ..., "--client-name", "-c", help="Name of the generated client package"
+    ),
+    file_path: Optional[str] = typer.Option(
+        None, "--file-path", "-f", help="Path to a local OpenAPI JSON file"
+    ),
+    url: Optional[str] = typer.Option(
+        None, "--url", "-u", help="URL pointing to the OpenAPI specification"
+    ),
+    schema_backend: SchemaBackendEnum = typer.Option(
+        SchemaBackendEnum.PYDANTIC,
+        "--schema-backend",
+        help="Model backend of the generated schemas",
+    ),
+    include_tag: IncludeTagOption = None,
+    exclude_tag: ExcludeTagOption = None,
+    include_path: IncludePathOption = None,
+    exclude_path: ExcludePathOption = None,
+    include_operation_id: IncludeOperationIdOption = None,
+    exclude_operation_id: ExcludeOperationIdOption = None,
+    zip_path: Optional[str] = typer.Option(
+        None, "--zip", help="Write the client sources to this zip file"
+    ),
+    wheel_dir: Optional[str] = typer.Option(
+        None, "--wheel-dir", help="Write the client as an installable wheel to this folder"
+    ),
+    version: str = typer.Option("0.1.0", "--version", help="Version of the client wheel"),
+):
+    """
+    Generate a client directly into a zip file or an installable wheel.
+    """
+    if (file_path is None) == (url is None):
+        raise typer.BadParameter("Provide either --file-path or --url")
+
+    if (zip_path is None) == (wheel_dir is None):
+        raise typer.BadParameter("Provide either --zip or --wheel-dir")
+
+    if url is not None:
+        api_spec = download_api_spec_content(url)
+    else:
+        api_spec = json.loads(Path(file_path).expanduser().read_text())
+
+    generator = _create_generator(
+        client_name,
+        schema_backend,
+        include_tag,
+        exclude_tag,
+        include_path,
+        exclude_path,
+        include_operation_id,
+        exclude_operation_id,
+    )
+
+    if zip_path is not None:
+        archive_path = generator.to_zip(api_spec, zip_path)
+    else:
+        archive_path = generator.to_wheel(api_spec, wheel_dir, version=version)
+
+    typer.echo(f"Client '{client_name}' packaged: {archive_path}")
+
+
+@cli.command("batch")
+def generate_batch(
+    manifest_path: str = typer.Option(
+        ...,
+        "--manifest",
+        "-m",
+        help="Path to a JSON manifest with a client_name and source per client",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", help="Number of specs that are fetched and clients generated at once"
+    ),
+):
+    """
+    Generate several clients from a manifest within a single process.
+    """
+    from fastapi_client_generator.batch import BatchGenerator
+
+    client_paths = BatchGenerator.from_manifest_file(manifest_path, max_workers=workers).run()
+    typer.echo(f"Generated {len(client_paths)} clients from manifest: {manifest_path}")
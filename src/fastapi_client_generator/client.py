@@ -1,30 +1,86 @@
 import json
 from pathlib import Path
-from typing import Union
-
-from fastapi import FastAPI
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from fastapi_client_generator.processors.endpoint_processor import EndpointProcessor
 from fastapi_client_generator.processors.post_processor import PostProcessor
 from fastapi_client_generator.processors.pre_processor import PreProcessor
 from fastapi_client_generator.processors.schema_processor import SchemaProcessor
 from fastapi_client_generator.processors.utils_processor import UtilsProcessor
+from fastapi_client_generator.shared.client_archive import ClientArchive
 from fastapi_client_generator.shared.config import Config
-from fastapi_client_generator.shared.utils import download_api_spec_content
+from fastapi_client_generator.shared.file_manager import FileManager
+from fastapi_client_generator.shared.memory_file_manager import MemoryFileManager
+from fastapi_client_generator.shared.operation_filter import OperationFilter
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.schema_enums import DEFAULT_ENUM_THRESHOLD
+from fastapi_client_generator.shared.spec_fingerprint import SpecFingerprint
+from fastapi_client_generator.shared.spec_watcher import SpecWatcher
+from fastapi_client_generator.shared.utils import download_api_spec_content, slugify
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
 class FastapiClientGenerator:
-    def __init__(self, client_name: str):
+    def __init__(
+        self,
+        client_name: str,
+        pagination_conventions: Optional[Dict[str, List[str]]] = None,
+        schema_backend: Union[SchemaBackendEnum, str] = SchemaBackendEnum.PYDANTIC,
+        enum_threshold: int = DEFAULT_ENUM_THRESHOLD,
+        deduplicate_schemas: bool = True,
+        include_tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        include_operation_ids: Optional[List[str]] = None,
+        exclude_operation_ids: Optional[List[str]] = None,
+        format_code: bool = True,
+    ):
         """
         FastAPI client generator
 
 
         Args:
             client_name: Name of the generated API client.
+            pagination_conventions: Overrides the parameter and field names that are recognised
+                as pagination, e.g. `{"cursor_params": ["after"]}`.
+            schema_backend: The model backend of the generated schemas, `pydantic` or `msgspec`.
+            enum_threshold: Enums with more values are generated once as a hashed-set validator
+                (a shared `Literal` for msgspec) instead of inline in every field.
+            deduplicate_schemas: Generates structurally identical schemas, such as `*Input` and
+                `*Output` pairs, as aliases of a single class.
+            include_tags: Only generates the operations with one of these tags.
+            exclude_tags: Leaves out the operations with one of these tags.
+            include_paths: Only generates the operations of paths matching one of these glob
+                patterns, e.g. `/pets/*`.
+            exclude_paths: Leaves out the operations of paths matching one of these glob patterns.
+            include_operation_ids: Only generates the operations whose `operationId` matches one of
+                these glob patterns.
+            exclude_operation_ids: Leaves out the operations whose `operationId` matches one of
+                these glob patterns.
+
+            Operations that match an include filter are generated, unless they match an exclude
+            filter. Only the schemas reachable from the generated operations are generated.
+            format_code: Runs Ruff on the generated client, turn off to format it yourself.
         """
         self._client_name = client_name
+        self._pagination_conventions = pagination_conventions
+        self._schema_backend = SchemaBackendEnum(schema_backend)
+        self._enum_threshold = enum_threshold
+        self._deduplicate_schemas = deduplicate_schemas
+        self._format_code = format_code
+        self._operation_filter = OperationFilter(
+            include_tags=include_tags,
+            exclude_tags=exclude_tags,
+            include_paths=include_paths,
+            exclude_paths=exclude_paths,
+            include_operation_ids=include_operation_ids,
+            exclude_operation_ids=exclude_operation_ids,
+        )
 
-    def from_fastapi(self, fastapi: FastAPI) -> None:
+    def from_fastapi(self, fastapi: "FastAPI") -> None:
         """
         Generates the API client based on the OpenAPI-spec extracted from a FastAPI instance.
 
@@ -33,7 +89,7 @@ class FastapiClientGenerator:
         """
         api_spec = fastapi.openapi()
 
-        config = Config(api_spec=api_spec, client_name=self._client_name)
+        config = self.create_config(api_spec)
         return self._generate(config)
 
     def from_file_path(self, api_spec_file_path: Union[str, Path]) -> None:
@@ -46,7 +102,7 @@ class FastapiClientGenerator:
         path = Path(api_spec_file_path).expanduser().resolve()
         api_spec = json.loads(path.read_text())
 
-        config = Config(api_spec=api_spec, client_name=self._client_name)
+        config = self.create_config(api_spec)
         return self._generate(config)
 
     def from_url(self, api_spec_url: str) -> None:
@@ -58,18 +114,228 @@ class FastapiClientGenerator:
         """
         api_spec = download_api_spec_content(api_spec_url)
 
-        config = Config(api_spec=api_spec, client_name=self._client_name)
+        config = self.create_config(api_spec)
+        return self._generate(config)
+
+    def from_api_spec(self, api_spec: Dict) -> None:
+        """
+        Generates the API client from an OpenAPI-spec that is already loaded.
+
+        Args:
+            api_spec: The OpenAPI-spec as dictionary.
+        """
+        config = self.create_config(api_spec)
         return self._generate(config)
 
+    def to_memory(self, api_spec: Dict) -> Dict[str, str]:
+        """
+        Generates the API client in memory, without writing the API-client folder.
+
+        Args:
+            api_spec: The OpenAPI-spec as dictionary.
+
+        Returns:
+            The source of every generated file, by its path relative to the current working
+            directory, e.g. `my_client/schemas/item_schema.py`.
+        """
+        file_manager = MemoryFileManager()
+        config = self.create_config(api_spec, file_manager=file_manager)
+        self._generate(config)
+
+        return {
+            file_path.relative_to(config.root_path.parent).as_posix(): code
+            for file_path, code in file_manager.files.items()
+        }
+
+    def to_zip(self, api_spec: Dict, zip_path: Union[str, Path]) -> Path:
+        """
+        Generates the API client directly into a zip file.
+
+        Args:
+            api_spec: The OpenAPI-spec as dictionary.
+            zip_path: Path of the zip file to write.
+
+        Returns:
+            The path of the written zip file.
+        """
+        return ClientArchive(self.to_memory(api_spec)).write_zip(zip_path)
+
+    def to_wheel(self, api_spec: Dict, wheel_dir: Union[str, Path], version: str = "0.1.0") -> Path:
+        """
+        Generates the API client directly into an installable wheel with precompiled bytecode.
+
+        Args:
+            api_spec: The OpenAPI-spec as dictionary.
+            wheel_dir: Folder to write the wheel to.
+            version: Version of the client distribution.
+
+        Returns:
+            The path of the written wheel.
+        """
+        return ClientArchive(self.to_memory(api_spec)).write_wheel(
+            wheel_dir,
+            name=slugify(self._client_name),
+            version=version,
+            requires=self._schema_backend.requirements,
+        )
+
+    def check(self, api_spec: Dict) -> List[str]:
+        """
+        Checks whether the generated API client is up to date with an OpenAPI-spec.
+
+        The fingerprint embedded in the client is compared with the hashes of the generator and the
+        spec first, an unchanged client is reported without rendering it. Otherwise the client is
+        rendered in memory, without formatting, and compared with the hashes of the rendered code.
+
+        Args:
+            api_spec: The OpenAPI-spec as dictionary.
+
+        Returns:
+            The stale files, relative to the API-client folder: the files that regenerating would
+            write and the files that are no longer generated. Empty when the client is up to date.
+        """
+        config = self.create_config(api_spec)
+        fingerprint = SpecFingerprint(config, config.operation_filter.apply(api_spec))
+        embedded_fingerprint = None
+
+        if config.fingerprint_path.is_file():
+            embedded_fingerprint = json.loads(config.fingerprint_path.read_text(encoding="utf-8"))
+
+        if fingerprint.is_up_to_date(embedded_fingerprint):
+            return []
+
+        return fingerprint.find_stale_files(
+            embedded_fingerprint, self._render_code_digests(api_spec)
+        )
+
+    def watch(
+        self,
+        api_spec_source: Union[str, Path],
+        interval: float = 1.0,
+        debounce: float = 0.5,
+        runs: Optional[int] = None,
+    ) -> None:
+        """
+        Generates the API client, and regenerates it every time the OpenAPI-spec changes.
+
+        The generator stays warm between runs: the configuration, including the loaded templates,
+        is reused and an unchanged spec is not parsed again. Only the files of which the generated
+        code changed are written and formatted by Ruff, files that are no longer generated are
+        removed. A spec that is briefly unreadable, or a failed generation, is logged and the
+        spec is watched further; the client folder keeps the last generated client.
+
+        Args:
+            api_spec_source: Path of a local OpenAPI-spec file, or the URL of an OpenAPI-spec that
+                is polled with conditional requests.
+            interval: Seconds between two checks of the spec.
+            debounce: Seconds a changed spec has to stay the same before regenerating.
+            runs: Stops after the given number of generations, watches until interrupted when None.
+        """
+        config = None
+        watcher = SpecWatcher(
+            str(api_spec_source),
+            interval=interval,
+            debounce=debounce,
+            log=lambda action: config.log_action(action),
+        )
+
+        for run, api_spec in enumerate(watcher.changes(), start=1):
+            if config is None:
+                config = self.create_config(api_spec, incremental=True)
+            else:
+                config.api_spec = api_spec
+
+            config.file_manager.start_run()
+
+            try:
+                self._generate(config)
+            except Exception as error:
+                config.file_manager.discard_run()
+                config.log_action(
+                    f"Could not generate client: {error!r}. Watching '{api_spec_source}' for changes"
+                )
+            else:
+                config.log_action(
+                    f"Generated client, {len(config.file_manager.written_files)} files changed. "
+                    f"Watching '{api_spec_source}' for changes"
+                )
+
+            if runs is not None and run >= runs:
+                return
+
+    def create_config(
+        self,
+        api_spec: Dict,
+        incremental: bool = False,
+        file_manager: Optional[FileManager] = None,
+    ) -> Config:
+        """
+        Creates the configuration for the provided OpenAPI-spec.
+
+        Together with `stage`, this lets a caller run the generation in steps, like the
+        `BatchGenerator` does to format several clients at once.
+
+        Args:
+            api_spec: The OpenAPI-spec to generate the client for.
+            incremental: Whether the client is regenerated in the same process.
+            file_manager: Where the generated files are written to, the API-client folder when
+                omitted.
+
+        Returns:
+            The configuration the client is staged with.
+        """
+        return Config(
+            api_spec=api_spec,
+            client_name=self._client_name,
+            pagination_conventions=self._pagination_conventions,
+            schema_backend=self._schema_backend,
+            enum_threshold=self._enum_threshold,
+            deduplicate_schemas=self._deduplicate_schemas,
+            operation_filter=self._operation_filter,
+            incremental=incremental,
+            format_code=self._format_code,
+            file_manager=file_manager,
+        )
+
+    def _render_code_digests(self, api_spec: Dict) -> Dict[Path, str]:
+        """Renders the client in memory, without formatting, and hashes the code of every file."""
+        config = self.create_config(api_spec, file_manager=MemoryFileManager())
+        config.log_actions = False
+
+        try:
+            self.stage(config)
+        finally:
+            config.file_manager.discard_staging()
+
+        return config.file_manager.code_digests
+
     def _generate(self, config: Config):
         """
         Runs the generation pipeline for the provided configuration.
 
+        The client is generated in a staging folder, the client folder is only replaced once the
+        pipeline completed. The staging folder is removed when the pipeline fails.
+
         Args:
             config: Configuration object containing the OpenAPI-spec.
         """
+        try:
+            self.stage(config)
+            PostProcessor(config).run()
+        finally:
+            config.file_manager.discard_staging()
+
+    def stage(self, config: Config) -> None:
+        """
+        Generates the client in its staging folder, without formatting and committing it.
+
+        The caller completes the client by running the `PostProcessor` on the configuration, and
+        removes the staging folder with `config.file_manager.discard_staging()` in any case.
+
+        Args:
+            config: Configuration object created by `create_config`.
+        """
         PreProcessor(config).run()
         SchemaProcessor(config).run()
         UtilsProcessor(config).run()
         EndpointProcessor(config).run()
-        PostProcessor(config).run()
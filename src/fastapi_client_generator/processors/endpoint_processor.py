@@ -4,6 +4,7 @@ from fastapi_client_generator.builders.endpoints.client_base_builder import Clie
 from fastapi_client_generator.builders.endpoints.endpoint_builder import EndpointBuilder
 from fastapi_client_generator.interfaces.processor_interface import ProcessorInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.spec_ir import EndpointNode
 from fastapi_client_generator.shared.utils import pascal_to_snake, snake_to_pascal
 
 
@@ -39,6 +40,8 @@ class EndpointProcessor(ProcessorInterface):
         action = "Generating endpoints"
         self._config.log_action(action)
 
+        schemas = (self._config.api_spec.get("components", {}) or {}).get("schemas", {}) or {}
+
         for endpoint_path, endpoint_data in self._read_endpoint_data().items():
             endpoint_path_normalized = self._create_endpoint_path_normalized(endpoint_path)
             endpoint_attribute_name = self._create_endpoint_attribute_name(endpoint_path_normalized)
@@ -55,8 +58,7 @@ class EndpointProcessor(ProcessorInterface):
                 config=self._config,
                 endpoint_class_name=endpoint_class_name,
                 endpoint_file_name=endpoint_file_name,
-                endpoint_path=endpoint_path,
-                endpoint_data=endpoint_data,
+                endpoint=EndpointNode(endpoint_path, endpoint_data, schemas),
             ).build()
 
     def _create_client_base(self) -> None:
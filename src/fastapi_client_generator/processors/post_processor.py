@@ -1,7 +1,10 @@
 import subprocess
+from pathlib import Path
+from typing import List
 
 from fastapi_client_generator.interfaces.processor_interface import ProcessorInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.spec_fingerprint import SpecFingerprint
 
 
 class PostProcessor(ProcessorInterface):
@@ -12,33 +15,88 @@ class PostProcessor(ProcessorInterface):
         """
         Postprocessing the API-client by executing the following steps:
 
-        1. Performs `ruff check [TARGET_PATH] --fix` to fix by Ruff standards.
-        2. Performs `ruff format [TARGET_PATH]` to format by Ruff standards.
-        3. Removes API-spec from API-client folder.
+        1. Performs `ruff format [TARGET_PATH]` to format by Ruff standards.
+        2. Removes the files that are no longer generated (incremental only).
+        3. Adds the fingerprint of the spec and of the code rendered for every file.
+        4. Removes API-spec from API-client folder.
+        5. Replaces the API-client folder by the staged one, keeping the unchanged files.
+
+        The builders plan the imports of every module, so no `ruff check --fix` pass is needed to
+        remove unused imports or to sort them. Ruff runs on the staged API-client folder, so the
+        API-client folder is only replaced once it is complete. When regenerating incrementally,
+        Ruff only runs on the files that were written. Ruff is skipped when `format_code` is turned
+        off.
         """
-        self._ruff_check_api_client_folder()
-        self._ruff_format_api_client_folder()
+        if self._config.format_code:
+            self._format_api_client_folder()
+
+        self._remove_stale_files()
+        self._create_fingerprint()
         self._remove_api_spec()
+        self._commit_api_client_folder()
 
-    def _ruff_check_api_client_folder(self) -> None:
-        """Performs `ruff check --fix` on the API-client folder."""
-        action = f"Running 'ruff check' on API-client folder: '{self._config.root_path}'"
-        self._config.log_action(action)
+    def _format_api_client_folder(self) -> None:
+        """Runs Ruff on the staged files, which in-memory clients write to disk for it first."""
+        self._config.file_manager.prepare_formatting()
+        ruff_targets = self._create_ruff_targets()
 
-        args = ["ruff", "check", self._config.root_path, "--fix"]
-        return subprocess.run(args, check=False)
+        if ruff_targets:
+            self._ruff_format_api_client_folder(ruff_targets)
+
+        self._config.file_manager.finish_formatting()
+
+    def _create_ruff_targets(self) -> List[Path]:
+        """
+        Determines the paths Ruff runs on.
+
+        Returns:
+            The written files when regenerating incrementally, the API-client folder otherwise.
+        """
+        if self._config.incremental:
+            return list(self._config.file_manager.saved_files)
+
+        return [self._config.file_manager.staged_path(self._config.root_path)]
 
-    def _ruff_format_api_client_folder(self) -> None:
+    def _ruff_format_api_client_folder(self, ruff_targets: List[Path]) -> None:
         """Performs `ruff format` on the API-client folder."""
         action = f"Running 'ruff format' on API-client folder: '{self._config.root_path}'"
         self._config.log_action(action)
 
-        args = ["ruff", "format", self._config.root_path]
+        args = ["ruff", "format", *ruff_targets, "--no-cache"]
         return subprocess.run(args, check=False)
 
+    def _remove_stale_files(self) -> None:
+        """Removes the files of schemas and endpoints that are no longer in the API-spec."""
+        for file_path in self._config.file_manager.remove_stale_files():
+            self._config.log_action(f"Removed file that is no longer generated: '{file_path}'")
+
+    def _create_fingerprint(self) -> None:
+        """Creates `fingerprint.json`, which `FastapiClientGenerator.check` compares with a spec."""
+        api_spec = self._config.file_manager.load_json(self._config.api_spec_path)
+        fingerprint = SpecFingerprint(self._config, api_spec).create_fingerprint(
+            self._config.file_manager.code_digests
+        )
+
+        self._config.file_manager.save_json(
+            file_path=self._config.fingerprint_path,
+            data=fingerprint,
+        )
+
     def _remove_api_spec(self) -> None:
         """Removes the API-spec file from the client."""
         action = f"Removing API-spec file from API-client folder: '{self._config.api_spec_path}'"
         self._config.log_action(action)
 
         self._config.file_manager.remove_file(file_path=self._config.api_spec_path)
+
+    def _commit_api_client_folder(self) -> None:
+        """Swaps the staged API-client folder in, only the changed files are written."""
+        file_manager = self._config.file_manager
+        file_manager.commit_staging()
+
+        action = (
+            f"Updated API-client folder: '{self._config.root_path}', "
+            f"{len(file_manager.written_files)} files written, "
+            f"{len(file_manager.unchanged_files)} unchanged files skipped"
+        )
+        self._config.log_action(action)
@@ -1,5 +1,6 @@
 from fastapi_client_generator.interfaces.processor_interface import ProcessorInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.operation_filter import HTTP_METHODS
 
 
 class PreProcessor(ProcessorInterface):
@@ -10,8 +11,9 @@ class PreProcessor(ProcessorInterface):
         """
         Preprocesses the API-client by performing the following steps:
 
-        1. Creating the API-client folder.
-        2. Ads the OpenAPI-spec (dict) to the API-client folder.
+        1. Creating the API-client folder, staged in a temporary folder until postprocessing.
+        2. Ads the OpenAPI-spec (dict) to the API-client folder, with the selected operations and
+           the schemas they reach only.
         """
         self._create_api_client_folder()
         self._create_api_spec_file()
@@ -21,11 +23,33 @@ class PreProcessor(ProcessorInterface):
         action = "Creating API-client folder. (ignored when existing)"
         self._config.log_action(action)
 
+        self._config.file_manager.start_staging(self._config.root_path)
         return self._config.file_manager.create_folder(self._config.root_path)
 
     def _create_api_spec_file(self) -> None:
-        """Creates a API-spec file called `api-spec.json` within the API-client folder."""
+        """
+        Creates a API-spec file called `api-spec.json` within the API-client folder.
+
+        The schema and endpoint processors read this file, so the operation filter is applied here.
+        """
+        api_spec = self._config.operation_filter.apply(self._config.api_spec)
+
+        if self._config.operation_filter.is_active:
+            action = (
+                f"Selecting {self._count_operations(api_spec)} of "
+                f"{self._count_operations(self._config.api_spec)} operations"
+            )
+            self._config.log_action(action)
+
         self._config.file_manager.save_json(
             file_path=self._config.api_spec_path,
-            data=self._config.api_spec,
+            data=api_spec,
+        )
+
+    def _count_operations(self, api_spec: dict) -> int:
+        """Counts the operations of all paths within the API-spec."""
+        return sum(
+            method in HTTP_METHODS
+            for path_item in (api_spec.get("paths", {}) or {}).values()
+            for method in (path_item or {})
         )
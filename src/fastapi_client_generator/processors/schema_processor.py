@@ -1,7 +1,14 @@
 from fastapi_client_generator.builders.schema.schema_builder import SchemaBuilder
 from fastapi_client_generator.interfaces.processor_interface import ProcessorInterface
 from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.schema_duplicates import SchemaDuplicates
+from fastapi_client_generator.shared.schema_enums import SchemaEnums
+from fastapi_client_generator.shared.schema_graph import SchemaGraph
+from fastapi_client_generator.shared.schema_unions import SchemaUnions
+from fastapi_client_generator.shared.spec_ir import SchemaNode
 from fastapi_client_generator.shared.template_enum import TemplateEnum
+from fastapi_client_generator.shared.utils import convert_ref_to_import_path, pascal_to_snake
 
 
 class SchemaProcessor(ProcessorInterface):
@@ -14,11 +21,27 @@ class SchemaProcessor(ProcessorInterface):
 
         1. Creates the `/schemas` folder when non existing.
         2. Generates a BaseSchema which is inherited by every autogenerated Pydantic schema.
-        3. Generates each schema file.
+        3. Generates each schema file, structurally identical schemas are generated once.
+        4. Generates the duplicate schemas as aliases of the generated schema.
+        5. Generates the shared enums, used by multiple fields.
+        6. Generates the schema graph with the cycle-aware rebuild step (Pydantic only).
         """
+        schema_data = self._read_schema_data()
+        schema_unions = SchemaUnions(schema_data)
+        schema_duplicates = SchemaDuplicates(schema_data, schema_unions)
+
+        if self._config.deduplicate_schemas:
+            schema_data = schema_duplicates.canonical_schemas
+
+        schema_graph = SchemaGraph(schema_data)
+        schema_enums = SchemaEnums(schema_data, self._config.enum_threshold)
+
         self._create_schema_folder()
         self._create_base_schema()
-        self._create_schemas()
+        self._create_schemas(schema_data, schema_graph, schema_unions, schema_enums)
+        self._create_schema_aliases(schema_duplicates)
+        self._create_shared_enums(schema_enums)
+        self._create_schema_graph(schema_graph)
 
     def _create_schema_folder(self) -> None:
         """Creates a schema folder if it's not existing yet."""
@@ -28,10 +51,13 @@ class SchemaProcessor(ProcessorInterface):
         self._config.file_manager.create_folder(self._config.root_path / "schemas")
 
     def _create_base_schema(self) -> None:
-        """Creates the Pydantic base schema that will be used by all generated pydantic schema's."""
-        base_schema_template = self._config.jinja_env.get_template(
-            name=TemplateEnum.SCHEMA_BASE_TEMPLATE.value
-        ).render()
+        """Creates the base schema that will be used by all generated schema's of the backend."""
+        template = (
+            TemplateEnum.SCHEMA_BASE_MSGSPEC_TEMPLATE
+            if self._config.schema_backend == SchemaBackendEnum.MSGSPEC
+            else TemplateEnum.SCHEMA_BASE_TEMPLATE
+        )
+        base_schema_template = self._config.jinja_env.get_template(name=template.value).render()
 
         self._config.file_manager.save_python(
             file_path=self._config.root_path / "schemas" / "base_schema.py",
@@ -39,17 +65,115 @@ class SchemaProcessor(ProcessorInterface):
             overwrite=False,
         )
 
-    def _create_schemas(self) -> None:
+    def _create_schemas(
+        self,
+        schemas: dict,
+        schema_graph: SchemaGraph,
+        schema_unions: SchemaUnions,
+        schema_enums: SchemaEnums,
+    ) -> None:
         """Collects all schemas from the API-spec and converts them to pydantic schemas."""
 
         action = "Generating schemas"
         self._config.log_action(action)
 
-        for schema_name, schema_data in self._read_schema_data().items():
+        for schema_name, schema_data in schemas.items():
             SchemaBuilder(
-                config=self._config, schema_name=schema_name, schema_data=schema_data
+                config=self._config,
+                schema=SchemaNode(schema_name, schema_data),
+                schema_cycle=schema_graph.cycle_of(schema_name),
+                schema_unions=schema_unions,
+                schema_enums=schema_enums,
             ).build()
 
+    def _create_schema_aliases(self, schema_duplicates: SchemaDuplicates) -> None:
+        """
+        Creates a module for every duplicate schema that aliases the generated schema.
+
+        The modules keep the original schema names importable, while only one class is defined.
+        """
+        if not self._config.deduplicate_schemas or not schema_duplicates.aliases:
+            return
+
+        action = f"Generating {len(schema_duplicates.aliases)} duplicate schemas as alias"
+        self._config.log_action(action)
+
+        template = self._config.jinja_env.get_template(
+            name=TemplateEnum.SCHEMA_ALIAS_TEMPLATE.value
+        )
+
+        for alias_name, schema_name in schema_duplicates.aliases.items():
+            schema_alias_template = template.render(
+                {
+                    "import": convert_ref_to_import_path(
+                        import_base=self._config.import_base, ref=schema_name
+                    ),
+                    "alias_name": f"{alias_name}Schema",
+                    "schema_name": f"{schema_name}Schema",
+                }
+            )
+
+            self._config.file_manager.save_python(
+                file_path=self._config.root_path
+                / "schemas"
+                / f"{pascal_to_snake(alias_name)}_schema.py",
+                code=schema_alias_template,
+            )
+
+    def _create_shared_enums(self, schema_enums: SchemaEnums) -> None:
+        """Creates `shared_enums.py` with the large inline enums, when the schemas contain any."""
+        if not schema_enums.shared_enums:
+            return
+
+        shared_enums_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.SCHEMA_ENUM_TEMPLATE.value
+        ).render(
+            {
+                "import_block": schema_enums.create_import_block(
+                    schema_enums.shared_enums, self._config.import_base, self._config.schema_backend
+                ),
+                "schema_backend": self._config.schema_backend.value,
+                "enums": schema_enums.shared_enums,
+            }
+        )
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "schemas" / "shared_enums.py",
+            code=shared_enums_template,
+        )
+
+    def _create_schema_graph(self, schema_graph: SchemaGraph) -> None:
+        """
+        Creates `schema_graph.py` that can build all Pydantic validators in dependency order.
+
+        msgspec resolves its types lazily on first decode, so no rebuild step is generated for it.
+        """
+        if self._config.schema_backend != SchemaBackendEnum.PYDANTIC:
+            return
+
+        schema_components = [
+            [
+                (f"{pascal_to_snake(schema_name)}_schema", f"{schema_name}Schema")
+                for schema_name in component
+                if schema_graph.is_model(schema_name)
+            ]
+            for component in schema_graph.components
+        ]
+
+        schema_graph_template = self._config.jinja_env.get_template(
+            name=TemplateEnum.SCHEMA_GRAPH_TEMPLATE.value
+        ).render(
+            {
+                "import_base": self._config.import_base,
+                "schema_components": [component for component in schema_components if component],
+            }
+        )
+
+        self._config.file_manager.save_python(
+            file_path=self._config.root_path / "schemas" / "schema_graph.py",
+            code=schema_graph_template,
+        )
+
     def _read_schema_data(self) -> dict:
         """Reads all schemas from the `api-spec.json`."""
         api_spec = self._config.file_manager.load_json(self._config.api_spec_path)
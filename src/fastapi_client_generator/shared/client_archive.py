@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import importlib.util
+import marshal
+import re
+import sys
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+# Fixed timestamp of every archive entry, so the same client always results in the same archive.
+ARCHIVE_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+# Checked hash-based pyc (PEP 552): the bytecode stays valid as long as the source is unchanged.
+PYC_FLAGS = 0b11
+
+
+class ClientArchive:
+    def __init__(self, files: Dict[str, str]):
+        """
+        Packs a generated API-client into a zip file or an installable wheel.
+
+        Args:
+            files: The source of every file of the client, by its path relative to the folder
+                containing the package, e.g. `my_client/schemas/item_schema.py`. As returned by
+                `FastapiClientGenerator.to_memory`.
+        """
+        self._files = dict(sorted(files.items()))
+
+    def write_zip(self, zip_path: Union[str, Path]) -> Path:
+        """
+        Writes the sources of the client to a zip file.
+
+        Args:
+            zip_path: Path of the zip file to write.
+
+        Returns:
+            The path of the written zip file.
+        """
+        path = Path(zip_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for file_path, source in self._files.items():
+                self._write_entry(archive, file_path, source.encode("utf-8"))
+
+        return path
+
+    def write_wheel(
+        self,
+        wheel_dir: Union[str, Path],
+        name: str,
+        version: str,
+        requires: Optional[List[str]] = None,
+    ) -> Path:
+        """
+        Writes the client as a pure Python wheel, including bytecode of the running interpreter.
+
+        Args:
+            wheel_dir: Folder to write the wheel to.
+            name: Name of the distribution.
+            version: Version of the distribution.
+            requires: Requirements of the distribution, e.g. `["requests>=2.32.4"]`.
+
+        Returns:
+            The path of the written wheel.
+        """
+        distribution = re.sub(r"[-_.]+", "_", name)
+        dist_info = f"{distribution}-{version}.dist-info"
+        path = Path(wheel_dir) / f"{distribution}-{version}-py3-none-any.whl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entries: Dict[str, bytes] = {}
+
+        for file_path, source in self._files.items():
+            entries[file_path] = source.encode("utf-8")
+
+            if file_path.endswith(".py") and sys.implementation.cache_tag:
+                pyc_path, pyc = self._compile(file_path, entries[file_path])
+                entries[pyc_path] = pyc
+
+        entries[f"{dist_info}/METADATA"] = self._create_metadata(name, version, requires or [])
+        entries[f"{dist_info}/WHEEL"] = self._create_wheel_file()
+
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for file_path, data in entries.items():
+                self._write_entry(archive, file_path, data)
+
+            records = [self._create_record(file_path, data) for file_path, data in entries.items()]
+            records.append(f"{dist_info}/RECORD,,")
+            self._write_entry(archive, f"{dist_info}/RECORD", "\n".join(records).encode() + b"\n")
+
+        return path
+
+    def _compile(self, file_path: str, source: bytes) -> Tuple[str, bytes]:
+        """Compiles the source to a checked hash-based pyc at its `__pycache__` path."""
+        code = compile(source, file_path, "exec", dont_inherit=True)
+        pyc = (
+            importlib.util.MAGIC_NUMBER
+            + PYC_FLAGS.to_bytes(4, "little")
+            + importlib.util.source_hash(source)
+            + marshal.dumps(code)
+        )
+
+        return Path(importlib.util.cache_from_source(file_path)).as_posix(), pyc
+
+    def _create_metadata(self, name: str, version: str, requires: List[str]) -> bytes:
+        """Creates the core metadata of the distribution."""
+        lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+        lines.extend(f"Requires-Dist: {requirement}" for requirement in requires)
+        return ("\n".join(lines) + "\n").encode()
+
+    def _create_wheel_file(self) -> bytes:
+        """Creates the `WHEEL` file of a pure Python wheel."""
+        lines = [
+            "Wheel-Version: 1.0",
+            "Generator: fastapi-client-generator",
+            "Root-Is-Purelib: true",
+            "Tag: py3-none-any",
+        ]
+        return ("\n".join(lines) + "\n").encode()
+
+    def _create_record(self, file_path: str, data: bytes) -> str:
+        """Creates the `RECORD` line of a file, with its urlsafe base64 SHA-256 hash and size."""
+        digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+        return f"{file_path},sha256={digest},{len(data)}"
+
+    def _write_entry(self, archive: zipfile.ZipFile, file_path: str, data: bytes) -> None:
+        """Writes a file to the archive with a fixed timestamp and read permissions."""
+        info = zipfile.ZipInfo(file_path, date_time=ARCHIVE_DATE_TIME)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        archive.writestr(info, data)
@@ -1,15 +1,46 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 import typer
 from jinja2 import Environment, FileSystemLoader
 
 from fastapi_client_generator.shared.file_manager import FileManager
+from fastapi_client_generator.shared.operation_filter import OperationFilter
+from fastapi_client_generator.shared.pagination_conventions import DEFAULT_PAGINATION_CONVENTIONS
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.schema_enums import DEFAULT_ENUM_THRESHOLD
 from fastapi_client_generator.shared.utils import slugify
 
 
+@lru_cache(maxsize=None)
+def create_jinja_env(templates_path: Path) -> Environment:
+    """
+    Creates the Jinja environment for the templates folder.
+
+    The environment is shared by every configuration within the process, so templates are only
+    loaded and compiled once when several clients are generated.
+    """
+    return Environment(
+        loader=FileSystemLoader(templates_path),
+    )
+
+
 class Config:
-    def __init__(self, api_spec: Dict, client_name: str):
+    def __init__(
+        self,
+        api_spec: Dict,
+        client_name: str,
+        pagination_conventions: Optional[Dict[str, List[str]]] = None,
+        schema_backend: SchemaBackendEnum = SchemaBackendEnum.PYDANTIC,
+        enum_threshold: int = DEFAULT_ENUM_THRESHOLD,
+        deduplicate_schemas: bool = True,
+        operation_filter: Optional[OperationFilter] = None,
+        incremental: bool = False,
+        format_code: bool = True,
+        file_manager: Optional[FileManager] = None,
+        log_actions: bool = True,
+    ):
         """
         Base class that stores imports information.
 
@@ -19,22 +50,53 @@ class Config:
         Args:
             - api_spec (Dict): Contains the OpenAPI specification containing all API-information.
             - client_name (string): The name that the client will have.
+            - pagination_conventions (Dict): Overrides the parameter and field names that are
+              recognised as pagination. See `DEFAULT_PAGINATION_CONVENTIONS`.
+            - schema_backend (SchemaBackendEnum): The model backend the schemas are generated for.
+            - enum_threshold (int): Enums with more values are generated as shared hashed-set
+              validators instead of inline `Literal[...]` types.
+            - deduplicate_schemas (bool): Generates structurally identical schemas as aliases of
+              a single class.
+            - operation_filter (OperationFilter): Selects the operations the client is generated
+              for, only the schemas they reach are generated. Generates everything when omitted.
+            - incremental (bool): Regenerates the client in the same process, only the files of
+              which the generated code changed are written and formatted.
+            - format_code (bool): Runs Ruff on the generated client. Turned off when several clients
+              are formatted in one pass afterwards.
+            - file_manager (FileManager): Where the generated files are written to, e.g. a
+              `MemoryFileManager`. Writes to the API-client folder when omitted.
+            - log_actions (bool): Logs the generation steps. Turned off when the client is only
+              rendered to be compared with its fingerprint.
         """
         # Params
         self.api_spec = api_spec
         self.client_name = client_name
+        self.pagination_conventions = {
+            **DEFAULT_PAGINATION_CONVENTIONS,
+            **(pagination_conventions or {}),
+        }
+        self.schema_backend = SchemaBackendEnum(schema_backend)
+        self.enum_threshold = enum_threshold
+        self.deduplicate_schemas = deduplicate_schemas
+        self.operation_filter = operation_filter or OperationFilter()
+        self.incremental = incremental
+        self.format_code = format_code
+        self.log_actions = log_actions
 
         # Depends
-        self.file_manager = FileManager()
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.templates_path),
-        )
+        self.file_manager = file_manager or FileManager(skip_unchanged=incremental)
+        self.jinja_env = create_jinja_env(self.templates_path)
 
     @property
     def api_spec_path(self) -> Path:
         """Determines the path of the API-spec file."""
         return self.root_path / "api-spec.json"
 
+    @property
+    def fingerprint_path(self) -> Path:
+        """Determines the path of the fingerprint file, see `SpecFingerprint`."""
+        return self.root_path / "fingerprint.json"
+
     @property
     def root_path(self) -> Path:
         """
@@ -72,4 +134,7 @@ class Config:
         Args:
             action: The action that will be logged.
         """
+        if not self.log_actions:
+            return
+
         typer.echo(f"{action} \n")
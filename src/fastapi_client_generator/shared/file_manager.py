@@ -1,13 +1,118 @@
+import hashlib
 import json
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Iterable, List, Optional, Set, Union
 
 
 class FileManager:
     """
     Contains functions that make it easier to manage files and directories.
+
+    While staging, the files of the API-client folder are written to a temporary sibling folder
+    instead. Committing compares the staged files with the existing ones by content hash, keeps
+    the unchanged files as they are and swaps the staged folder in with a rename.
+
+    The hash of the code of every Python file generated in the current run is kept in
+    `code_digests`, before the file is formatted.
     """
 
+    def __init__(self, skip_unchanged: bool = False) -> None:
+        """
+        Args:
+            skip_unchanged: Remembers the code of every saved Python file and skips saving it again
+                when the code did not change. Used to regenerate a client in the same process.
+        """
+        self._skip_unchanged = skip_unchanged
+        self._saved_code: Dict[Path, str] = {}
+        self._run_files: Set[Path] = set()
+        self._stale_files: Set[Path] = set()
+        self._target_path: Optional[Path] = None
+        self._staging_path: Optional[Path] = None
+        self.saved_files: List[Path] = []
+        self.written_files: List[Path] = []
+        self.unchanged_files: List[Path] = []
+        self.code_digests: Dict[Path, str] = {}
+
+    def start_staging(self, target_path: Path) -> None:
+        """
+        Stages the files of the target folder in a temporary folder next to it, until committed.
+
+        Args:
+            target_path: The folder that is replaced by the staged folder on commit.
+        """
+        self.discard_staging()
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_folder = tempfile.mkdtemp(prefix=f".{target_path.name}-", dir=target_path.parent)
+
+        self._target_path = target_path
+        self._staging_path = Path(staging_folder) / target_path.name
+        self._staging_path.mkdir()
+
+    def staged_path(self, path: Path) -> Path:
+        """
+        Determines where a path of the target folder is written to while staging.
+
+        Args:
+            path: Path within the target folder.
+
+        Returns:
+            The path within the staging folder, or the path itself when not staging.
+        """
+        if self._staging_path is None or self._target_path is None:
+            return path
+
+        try:
+            return self._staging_path / path.relative_to(self._target_path)
+        except ValueError:
+            return path
+
+    def commit_staging(self) -> None:
+        """
+        Replaces the target folder by the staged folder.
+
+        Staged files with the same content as the existing file are replaced by a hard link to
+        the existing file, so they keep their modification time. Existing files that were not
+        generated, such as user files and caches, are carried over. The completed staging folder
+        is swapped in with a rename, so the target folder is never partially written.
+        """
+        if self._staging_path is None or self._target_path is None:
+            return
+
+        staging_path, target_path = self._staging_path, self._target_path
+        self.written_files = []
+        self.unchanged_files = []
+
+        for staged_file in sorted(path for path in staging_path.rglob("*") if path.is_file()):
+            target_file = target_path / staged_file.relative_to(staging_path)
+
+            if self._has_same_content(staged_file, target_file):
+                staged_file.unlink()
+                self._link_file(target_file, staged_file)
+                self.unchanged_files.append(target_file)
+            else:
+                self.written_files.append(target_file)
+
+        self._carry_over_files(target_path, staging_path)
+        self._swap_folder(staging_path, target_path)
+        self.discard_staging()
+
+    def discard_staging(self) -> None:
+        """Removes the staging folder, leaving the target folder untouched."""
+        if self._staging_path is not None:
+            shutil.rmtree(self._staging_path.parent, ignore_errors=True)
+
+        self._target_path = None
+        self._staging_path = None
+
+    def prepare_formatting(self) -> None:
+        """Called before Ruff formats the staged files, which are already on disk."""
+
+    def finish_formatting(self) -> None:
+        """Called after Ruff formatted the staged files."""
+
     def create_folder(self, folder_path: Path) -> None:
         """
         Creates a new folder based on the provided path. Creates
@@ -16,7 +121,7 @@ class FileManager:
         Args:
             file_path: Path of the folder
         """
-        folder_path.mkdir(parents=True, exist_ok=True)
+        self.staged_path(folder_path).mkdir(parents=True, exist_ok=True)
 
     def load_json(self, file_path: Path) -> Union[dict, list]:
         """
@@ -28,7 +133,7 @@ class FileManager:
         Returns:
             dict | list: The content that the JSON contains
         """
-        with file_path.open(encoding="utf-8") as f:
+        with self.staged_path(file_path).open(encoding="utf-8") as f:
             return json.load(f)
 
     def save_json(self, file_path: Path, data: Union[dict, list], indent: int = 2) -> None:
@@ -40,7 +145,9 @@ class FileManager:
             data: Data to store within the JSON
             indent: Indent of the JSON file
         """
-        file_path.write_text(json.dumps(data, indent=indent, ensure_ascii=False), encoding="utf-8")
+        self.staged_path(file_path).write_text(
+            json.dumps(data, indent=indent, ensure_ascii=False), encoding="utf-8"
+        )
 
     def save_python(
         self, file_path: Path, code: str, encoding: str = "utf-8", overwrite: Optional[bool] = True
@@ -48,15 +155,87 @@ class FileManager:
         """
         Writes the given code as Python to the given file path.
 
+        The hash of the code is added to `code_digests`, also when the file is not written.
+
         Args:
             file_path: Path where to write the Python file to
             code: The code to write to the Python file
             encoding: The text encoding (Default: 'utf-8')
         """
+        self._run_files.add(file_path)
+        self.code_digests[file_path] = hashlib.sha256(code.encode("utf-8")).hexdigest()
+
         if file_path.exists() and not overwrite:
             return
 
-        file_path.write_text(code, encoding=encoding)
+        if self._skip_unchanged and self._saved_code.get(file_path) == code and file_path.exists():
+            return
+
+        staged_path = self.staged_path(file_path)
+        staged_path.write_text(code, encoding=encoding)
+        self.saved_files.append(staged_path)
+
+        if self._skip_unchanged:
+            self._saved_code[file_path] = code
+
+    def stream_python(
+        self, file_path: Path, chunks: Iterable[str], encoding: str = "utf-8"
+    ) -> None:
+        """
+        Writes the code chunks to the given file path as they are rendered.
+
+        The chunks are written to the open file one by one, so the code of the whole file is never
+        held in memory. When unchanged files are skipped, the code has to be compared with the
+        previous code, so the chunks are joined and saved with `save_python` instead.
+
+        Args:
+            file_path: Path where to write the Python file to
+            chunks: The code of the Python file, in rendered chunks
+            encoding: The text encoding (Default: 'utf-8')
+        """
+        if self._skip_unchanged:
+            return self.save_python(file_path, "".join(chunks), encoding=encoding)
+
+        self._run_files.add(file_path)
+        staged_path = self.staged_path(file_path)
+        code_digest = hashlib.sha256()
+
+        with staged_path.open("w", encoding=encoding) as f:
+            for chunk in chunks:
+                f.write(chunk)
+                code_digest.update(chunk.encode("utf-8"))
+
+        self.saved_files.append(staged_path)
+        self.code_digests[file_path] = code_digest.hexdigest()
+
+    def start_run(self) -> None:
+        """Starts a new generation run, the saved files of the previous run are forgotten."""
+        self._run_files = set()
+        self._stale_files = set()
+        self.saved_files = []
+        self.code_digests = {}
+
+    def discard_run(self) -> None:
+        """Forgets the code saved in a failed run, so the next run saves every file again."""
+        self._saved_code = {}
+
+    def remove_stale_files(self) -> List[Path]:
+        """
+        Removes the Python files that were saved in a previous run, but not in the current one.
+
+        While staging, the stale files are left out when the target folder is committed.
+
+        Returns:
+            The removed paths.
+        """
+        stale_files = sorted(set(self._saved_code) - self._run_files)
+
+        for file_path in stale_files:
+            self.remove_file(file_path)
+            self._stale_files.add(file_path)
+            del self._saved_code[file_path]
+
+        return stale_files
 
     def remove_file(self, file_path: Path) -> None:
         """
@@ -65,4 +244,48 @@ class FileManager:
         Args:
             file_path: Path to remove
         """
-        file_path.unlink(missing_ok=True)
+        self.staged_path(file_path).unlink(missing_ok=True)
+
+    def _carry_over_files(self, target_path: Path, staging_path: Path) -> None:
+        """Links the existing files that were not staged, nor removed as stale, into the staging."""
+        if not target_path.is_dir():
+            return
+
+        for target_file in sorted(path for path in target_path.rglob("*") if path.is_file()):
+            staged_file = staging_path / target_file.relative_to(target_path)
+
+            if staged_file.exists() or target_file in self._stale_files:
+                continue
+
+            if target_file in self._run_files:
+                self.unchanged_files.append(target_file)
+
+            staged_file.parent.mkdir(parents=True, exist_ok=True)
+            self._link_file(target_file, staged_file)
+
+    def _swap_folder(self, staging_path: Path, target_path: Path) -> None:
+        """Moves the target folder aside and renames the staging folder to the target folder."""
+        previous_path = staging_path.parent / f"{target_path.name}.previous"
+
+        if target_path.exists():
+            os.replace(target_path, previous_path)
+
+        os.replace(staging_path, target_path)
+
+    def _link_file(self, source_path: Path, link_path: Path) -> None:
+        """Hard links the file, copies it with its modification time when linking is unsupported."""
+        try:
+            os.link(source_path, link_path)
+        except OSError:
+            shutil.copy2(source_path, link_path)
+
+    def _has_same_content(self, staged_file: Path, target_file: Path) -> bool:
+        """Compares the sizes of both files first, and their content hashes when equal."""
+        if not target_file.is_file() or target_file.stat().st_size != staged_file.stat().st_size:
+            return False
+
+        return self._hash_file(staged_file) == self._hash_file(target_file)
+
+    def _hash_file(self, file_path: Path) -> str:
+        """Determines the SHA-256 hash of the file content."""
+        return hashlib.sha256(file_path.read_bytes()).hexdigest()
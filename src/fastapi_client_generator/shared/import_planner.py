@@ -0,0 +1,190 @@
+import io
+import re
+import tokenize
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+FUTURE_MODULE = "__future__"
+STANDARD_LIBRARY_MODULES = ("typing",)
+
+TYPING_IMPORT = "from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union"
+"""The `typing` names the generated code uses, the planner only imports the used ones."""
+
+
+class ImportPlanner:
+    """
+    Plans the import block of a single generated module.
+
+    The builders register the imports a module may need, and the code the module is rendered from.
+    Only the registered names the code refers to are imported, so the block holds no unused or
+    duplicate imports. It is split into the sections and sorted the way Ruff's isort rules do it:
+    `__future__`, standard library, third-party and the client package itself. `__future__`
+    imports are always kept, as they change how the module is compiled instead of binding a name.
+    """
+
+    def __init__(self, import_base: str) -> None:
+        """
+        Args:
+            import_base: The package of the generated client, its modules are imported last.
+        """
+        self._import_base = import_base
+        self._candidates: Dict[str, Tuple[str, Optional[str]]] = {}
+        self._used_names: Set[str] = set()
+
+    def add(self, *statements: str) -> None:
+        """
+        Registers the names that the given import statements bind as candidates.
+
+        A name that is already registered keeps its first import.
+
+        Args:
+            statements: Statements in the form `import module` or `from module import A, B`.
+        """
+        for statement in statements:
+            for name, module, member in self._parse_statement(statement):
+                self._candidates.setdefault(name, (module, member))
+
+    def require(self, *statements: str) -> None:
+        """
+        Registers imports that are always kept, such as the imports of the static template code.
+
+        Args:
+            statements: Statements in the form `import module` or `from module import A, B`.
+        """
+        for statement in statements:
+            self.add(statement)
+            self._used_names.update(name for name, _, _ in self._parse_statement(statement))
+
+    def use(self, *code: str) -> None:
+        """
+        Records the names the given code refers to.
+
+        Names within strings, comments and docstrings, and attributes such as `.items` are not
+        references, so they are left out.
+
+        Args:
+            code: Pieces of generated Python code, each tokenized on its own.
+        """
+        for piece in code:
+            self._used_names.update(self._read_names(piece))
+
+    def create_import_block(self) -> str:
+        """
+        Creates the import statements of the used candidates, grouped and sorted by section.
+
+        Returns:
+            The sections separated by a blank line, an empty string when nothing is imported.
+        """
+        sections: Dict[int, Dict[str, List[Optional[str]]]] = {}
+
+        for name, (module, member) in self._candidates.items():
+            if name not in self._used_names and module != FUTURE_MODULE:
+                continue
+
+            section = sections.setdefault(self._determ_section(module), {})
+            section.setdefault(module, []).append(member)
+
+        return "\n\n".join(
+            "\n".join(self._create_section(sections[section])) for section in sorted(sections)
+        )
+
+    def _create_section(self, modules: Dict[str, List[Optional[str]]]) -> List[str]:
+        """Creates the `import module` statements first, the `from` statements afterwards."""
+        straight_imports = [module for module, members in modules.items() if None in members]
+        from_imports = {
+            module: sorted({member for member in members if member}, key=self._member_key)
+            for module, members in modules.items()
+        }
+
+        return [
+            *(f"import {module}" for module in sorted(straight_imports, key=self._natural_key)),
+            *(
+                f"from {module} import {', '.join(from_imports[module])}"
+                for module in sorted(from_imports, key=self._natural_key)
+                if from_imports[module]
+            ),
+        ]
+
+    def _parse_statement(self, statement: str) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Parses an import statement.
+
+        Returns:
+            The bound name, the module and the imported member of every name the statement binds.
+            The member is None for `import module`.
+        """
+        head, _, members = statement.strip().partition(" import ")
+
+        if not head.startswith("from "):
+            module = statement.strip()[len("import ") :].strip()
+            return [(module, module, None)]
+
+        module = head[len("from ") :].strip()
+        names = [name.strip() for name in members.strip().strip("()").split(",")]
+        return [(name, module, name) for name in names if name]
+
+    def _determ_section(self, module: str) -> int:
+        """Determines the position of the section the module is imported in."""
+        top_level = module.split(".")[0]
+
+        if top_level == FUTURE_MODULE:
+            return 0
+
+        if top_level in STANDARD_LIBRARY_MODULES:
+            return 1
+
+        if top_level == self._import_base.split(".")[0]:
+            return 3
+
+        return 2
+
+    def _member_key(self, name: str) -> Tuple:
+        """Sorts constants before classes, and classes before functions and variables."""
+        if len(name) > 1 and name.isupper():
+            member_type = 0
+        elif name[0].isupper():
+            member_type = 1
+        else:
+            member_type = 2
+
+        return (member_type, self._natural_key(name))
+
+    def _natural_key(self, value: str) -> Tuple:
+        """Compares case-insensitively and numbers by value, so `item2` comes before `item10`."""
+        parts = re.split(r"(\d+)", value.lower())
+        return tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in parts)
+
+    def _read_names(self, code: str) -> Set[str]:
+        """Reads the names that are referenced, not accessed as attribute, within the code."""
+        names: Set[str] = set()
+        previous = ""
+
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(code).readline):
+                if token.type == tokenize.NAME and previous != ".":
+                    names.add(token.string)
+
+                if token.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT):
+                    previous = token.string
+        except (tokenize.TokenError, IndentationError):
+            # A piece may end within brackets, the names read until then are complete.
+            pass
+
+        return names
+
+
+def plan_imports(import_base: str, statements: Iterable[str], code: Iterable[str]) -> str:
+    """
+    Creates the import block of a module from its candidate imports and its code.
+
+    Args:
+        import_base: The package of the generated client.
+        statements: The import statements the module may need.
+        code: The pieces of code the module is rendered from.
+
+    Returns:
+        The sorted import block with the used imports only.
+    """
+    import_planner = ImportPlanner(import_base)
+    import_planner.add(*statements)
+    import_planner.use(*code)
+    return import_planner.create_import_block()
@@ -0,0 +1,123 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from fastapi_client_generator.shared.file_manager import FileManager
+
+
+class MemoryFileManager(FileManager):
+    """
+    Keeps the generated files in memory instead of writing them to the API-client folder.
+
+    Ruff only formats files on disk, so the Python files are written to a temporary staging folder
+    before formatting and read back afterwards. Without formatting nothing is written to disk.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.files: Dict[Path, str] = {}
+        self._client_path: Optional[Path] = None
+
+    def start_staging(self, target_path: Path) -> None:
+        """
+        Remembers the API-client folder, the files stay in memory until formatted.
+
+        Args:
+            target_path: The API-client folder the file paths are within.
+        """
+        self._client_path = target_path
+
+    def commit_staging(self) -> None:
+        """Reports every file in memory as written."""
+        self.written_files = sorted(self.files)
+        self.unchanged_files = []
+
+    def prepare_formatting(self) -> None:
+        """Writes the Python files to a temporary staging folder for Ruff."""
+        if self._client_path is None:
+            return
+
+        super().start_staging(self._client_path)
+
+        for file_path, code in self.files.items():
+            if file_path.suffix == ".py":
+                staged_path = self.staged_path(file_path)
+                staged_path.parent.mkdir(parents=True, exist_ok=True)
+                staged_path.write_text(code, encoding="utf-8")
+
+    def finish_formatting(self) -> None:
+        """Reads the formatted Python files back and removes the staging folder."""
+        for file_path in self.files:
+            if file_path.suffix == ".py":
+                self.files[file_path] = self.staged_path(file_path).read_text(encoding="utf-8")
+
+        self.discard_staging()
+
+    def create_folder(self, folder_path: Path) -> None:
+        """Folders are implied by the paths of the files in memory."""
+
+    def load_json(self, file_path: Path) -> Union[dict, list]:
+        """
+        Loads JSON from the file in memory.
+
+        Args:
+            file_path: Path of the JSON file
+
+        Returns:
+            dict | list: The content that the JSON contains
+        """
+        return json.loads(self.files[file_path])
+
+    def save_json(self, file_path: Path, data: Union[dict, list], indent: int = 2) -> None:
+        """
+        Keeps any data as JSON in memory.
+
+        Args:
+            file_path: Path of the JSON file
+            data: Data to store within the JSON
+            indent: Indent of the JSON file
+        """
+        self.files[file_path] = json.dumps(data, indent=indent, ensure_ascii=False)
+
+    def save_python(
+        self, file_path: Path, code: str, encoding: str = "utf-8", overwrite: Optional[bool] = True
+    ) -> None:
+        """
+        Keeps the given code in memory.
+
+        Args:
+            file_path: Path of the Python file
+            code: The code of the Python file
+            encoding: Unused, the code is kept as text
+        """
+        self._run_files.add(file_path)
+        self.code_digests[file_path] = hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+        if file_path in self.files and not overwrite:
+            return
+
+        self.files[file_path] = code
+        self.saved_files.append(file_path)
+
+    def stream_python(
+        self, file_path: Path, chunks: Iterable[str], encoding: str = "utf-8"
+    ) -> None:
+        """
+        Keeps the joined code chunks in memory.
+
+        Args:
+            file_path: Path of the Python file
+            chunks: The code of the Python file, in rendered chunks
+            encoding: Unused, the code is kept as text
+        """
+        self.save_python(file_path, "".join(chunks))
+
+    def remove_file(self, file_path: Path) -> None:
+        """
+        Removes the file from memory.
+
+        Args:
+            file_path: Path to remove
+        """
+        self.files.pop(file_path, None)
@@ -0,0 +1,167 @@
+import copy
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Set, Union
+
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+COMPONENTS_PREFIX = "#/components/"
+
+
+class OperationFilter:
+    """
+    Selects the operations of an OpenAPI-spec that a client is generated for.
+
+    An operation is selected when it matches one of the include filters, or when there are none, and
+    matches none of the exclude filters. Operations match by one of their tags, by a glob pattern of
+    their path (`/pets/*`) or by a glob pattern of their `operationId`.
+
+    Only the component schemas that are reachable from the selected operations are kept. They are
+    found by following every `$ref` through the parameters, request bodies and responses of the
+    operations, the components they reference and the nested schemas, including the `mapping` of
+    discriminators.
+    """
+
+    def __init__(
+        self,
+        include_tags: Optional[List[str]] = None,
+        exclude_tags: Optional[List[str]] = None,
+        include_paths: Optional[List[str]] = None,
+        exclude_paths: Optional[List[str]] = None,
+        include_operation_ids: Optional[List[str]] = None,
+        exclude_operation_ids: Optional[List[str]] = None,
+    ) -> None:
+        self._include_tags = list(include_tags or [])
+        self._exclude_tags = list(exclude_tags or [])
+        self._include_paths = list(include_paths or [])
+        self._exclude_paths = list(exclude_paths or [])
+        self._include_operation_ids = list(include_operation_ids or [])
+        self._exclude_operation_ids = list(exclude_operation_ids or [])
+
+    @property
+    def is_active(self) -> bool:
+        """Whether any filter is set, without filters every operation and schema is generated."""
+        return any(
+            (
+                self._include_tags,
+                self._exclude_tags,
+                self._include_paths,
+                self._exclude_paths,
+                self._include_operation_ids,
+                self._exclude_operation_ids,
+            )
+        )
+
+    def is_selected(self, path: str, operation: Dict) -> bool:
+        """Determines whether the operation on the given path is generated."""
+        has_include = self._include_tags or self._include_paths or self._include_operation_ids
+
+        if has_include and not self._matches(
+            path, operation, self._include_tags, self._include_paths, self._include_operation_ids
+        ):
+            return False
+
+        return not self._matches(
+            path, operation, self._exclude_tags, self._exclude_paths, self._exclude_operation_ids
+        )
+
+    def apply(self, api_spec: Dict) -> Dict:
+        """
+        Creates a copy of the OpenAPI-spec with the selected operations and their schemas only.
+
+        Returns:
+            The filtered OpenAPI-spec, the spec itself when no filter is set.
+        """
+        if not self.is_active:
+            return api_spec
+
+        filtered_spec = copy.copy(api_spec)
+        filtered_spec["paths"] = self._select_paths(api_spec.get("paths", {}) or {})
+
+        components = dict(api_spec.get("components", {}) or {})
+        schemas = components.get("schemas", {}) or {}
+
+        if schemas:
+            reachable = self._collect_reachable_schemas(api_spec, filtered_spec["paths"])
+            components["schemas"] = {
+                name: schema_data for name, schema_data in schemas.items() if name in reachable
+            }
+            filtered_spec["components"] = components
+
+        return filtered_spec
+
+    def _matches(
+        self,
+        path: str,
+        operation: Dict,
+        tags: List[str],
+        path_patterns: List[str],
+        operation_id_patterns: List[str],
+    ) -> bool:
+        """Determines whether the operation matches one of the given tags or patterns."""
+        operation_id = operation.get("operationId")
+
+        return (
+            any(tag in tags for tag in operation.get("tags", []) or [])
+            or any(fnmatchcase(path, pattern) for pattern in path_patterns)
+            or (
+                isinstance(operation_id, str)
+                and any(fnmatchcase(operation_id, pattern) for pattern in operation_id_patterns)
+            )
+        )
+
+    def _select_paths(self, paths: Dict) -> Dict:
+        """Returns the paths with the selected operations, paths without any are left out."""
+        selected_paths = {}
+
+        for path, path_item in paths.items():
+            operations = {
+                method: operation
+                for method, operation in (path_item or {}).items()
+                if method in HTTP_METHODS and self.is_selected(path, operation or {})
+            }
+
+            if operations:
+                selected_paths[path] = {
+                    key: value
+                    for key, value in path_item.items()
+                    if key not in HTTP_METHODS or key in operations
+                }
+
+        return selected_paths
+
+    def _collect_reachable_schemas(self, api_spec: Dict, paths: Dict) -> Set[str]:
+        """Collects the names of all component schemas that are referenced by the given paths."""
+        components = api_spec.get("components", {}) or {}
+        visited: Set[str] = set()
+        nodes: List[Union[Dict, List, None]] = [paths]
+
+        while nodes:
+            node = nodes.pop()
+
+            if isinstance(node, list):
+                nodes.extend(node)
+                continue
+
+            if not isinstance(node, dict):
+                continue
+
+            refs = [node.get("$ref")]
+            if isinstance(node.get("mapping"), dict):
+                refs.extend(node["mapping"].values())
+
+            for ref in refs:
+                if (
+                    not isinstance(ref, str)
+                    or not ref.startswith(COMPONENTS_PREFIX)
+                    or ref in visited
+                ):
+                    continue
+
+                visited.add(ref)
+                section, _, name = ref[len(COMPONENTS_PREFIX) :].partition("/")
+                nodes.append((components.get(section, {}) or {}).get(name))
+
+            nodes.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+        schemas_prefix = f"{COMPONENTS_PREFIX}schemas/"
+        return {ref[len(schemas_prefix) :] for ref in visited if ref.startswith(schemas_prefix)}
@@ -0,0 +1,38 @@
+from typing import Dict, List
+
+PAGINATION_EXTENSION = "x-pagination"
+"""
+Vendor extension that can be added to an OpenAPI operation to describe its pagination explicitly.
+
+Example:
+    "x-pagination": {
+        "style": "cursor",
+        "cursor_param": "after",
+        "limit_param": "first",
+        "items_field": "edges",
+        "next_cursor_field": "endCursor"
+    }
+
+Setting the extension to `false` disables pagination detection for the operation.
+"""
+
+DEFAULT_PAGINATION_CONVENTIONS: Dict[str, List[str]] = {
+    "limit_params": ["limit", "page_size", "pageSize", "per_page", "perPage", "max_results"],
+    "offset_params": ["offset", "skip", "start"],
+    "page_params": ["page", "page_number", "pageNumber"],
+    "cursor_params": ["cursor", "page_token", "pageToken", "next_token", "after"],
+    "items_fields": ["items", "results", "data", "records", "entries"],
+    "next_cursor_fields": [
+        "next_cursor",
+        "nextCursor",
+        "next_page_token",
+        "nextPageToken",
+        "next_token",
+        "cursor",
+    ],
+    "total_fields": ["total", "total_count", "totalCount", "count"],
+}
+"""
+Parameter and field names that are recognised as pagination when an operation does not contain the
+`x-pagination` extension. Names are matched in the listed order.
+"""
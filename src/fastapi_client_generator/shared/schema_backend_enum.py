@@ -0,0 +1,23 @@
+from enum import Enum
+from typing import List
+
+
+class SchemaBackendEnum(str, Enum):
+    """
+    Contains the model backends that schemas can be generated for.
+
+    - `pydantic`: Pydantic models with validation on construction (default).
+    - `msgspec`: Slot based `msgspec.Struct` classes that are decoded and encoded by msgspec, for
+      high-throughput consumers where model construction dominates the CPU time.
+    """
+
+    PYDANTIC = "pydantic"
+    MSGSPEC = "msgspec"
+
+    @property
+    def requirements(self) -> List[str]:
+        """The distributions that clients generated for this backend depend on."""
+        if self is SchemaBackendEnum.MSGSPEC:
+            return ["msgspec>=0.18.6", "requests>=2.32.4", "typing_extensions>=4"]
+
+        return ["pydantic>=2.10.6", "requests>=2.32.4", "typing_extensions>=4"]
@@ -0,0 +1,123 @@
+import hashlib
+import json
+from typing import Dict, List, Optional, Union
+
+from fastapi_client_generator.shared.schema_unions import SchemaUnions
+from fastapi_client_generator.shared.utils import is_primitive_type
+
+REF_PREFIX = "#/components/schemas/"
+
+IGNORED_OBJECT_KEYS = ("title", "description", "example", "examples")
+"""Keys of an object schema that are not part of the generated class."""
+
+
+class SchemaDuplicates:
+    """
+    Structurally identical component schemas of an OpenAPI-spec.
+
+    FastAPI specs often contain the same schema under different names, such as `*Input`/`*Output`
+    pairs and `Body_*` wrappers of a model. Schemas are compared by a hash of their normalised body,
+    in which the references to duplicates point to the same schema. Schemas that only differ in
+    references to duplicates, also within reference cycles, are therefore duplicates as well.
+
+    The first schema of every group is generated as class, the others become aliases of it. Members
+    of a discriminated union keep their own class, as their tag belongs to the schema name.
+    """
+
+    def __init__(
+        self, schemas: Dict[str, Dict], schema_unions: Optional[SchemaUnions] = None
+    ) -> None:
+        self._schemas = schemas
+        self._schema_unions = schema_unions
+        self._canonical_of = self._find_canonical_names()
+
+    @property
+    def aliases(self) -> Dict[str, str]:
+        """The names of the duplicate schemas, mapped to the name of the schema they alias."""
+        return {
+            name: canonical_name
+            for name, canonical_name in self._canonical_of.items()
+            if name != canonical_name
+        }
+
+    @property
+    def canonical_schemas(self) -> Dict[str, Dict]:
+        """The schemas without duplicates, of which the references to duplicates are replaced."""
+        return {
+            name: self._replace_refs(schema_data, self._canonical_of)
+            for name, schema_data in self._schemas.items()
+            if self._canonical_of[name] == name
+        }
+
+    def canonical_of(self, schema_name: str) -> str:
+        """Returns the name of the schema that is generated for the given schema."""
+        return self._canonical_of.get(schema_name, schema_name)
+
+    def _find_canonical_names(self) -> Dict[str, str]:
+        """
+        Splits the schemas into groups by the hash of their normalised body, until no group splits.
+
+        All schemas start in one group. Every round hashes the schemas with their references replaced
+        by the groups of the previous round, so schemas end up in the same group when their bodies
+        and the schemas they reference, including reference cycles, are identical.
+
+        Returns:
+            The name of every schema mapped to the name of the first schema of its group.
+        """
+        canonical_of = dict.fromkeys(self._schemas, "")
+
+        while True:
+            groups: Dict[str, str] = {}
+            next_canonical_of: Dict[str, str] = {}
+
+            for name, schema_data in self._schemas.items():
+                if self._schema_unions and self._schema_unions.tag_of(name):
+                    next_canonical_of[name] = name
+                    continue
+
+                digest = self._create_digest(schema_data, canonical_of)
+                next_canonical_of[name] = groups.setdefault(digest, name)
+
+            if next_canonical_of == canonical_of:
+                return canonical_of
+
+            canonical_of = next_canonical_of
+
+    def _create_digest(self, schema_data: Optional[Dict], canonical_of: Dict[str, str]) -> str:
+        """Creates the hash of the normalised schema body."""
+        normalised = dict(schema_data or {})
+
+        if not is_primitive_type(normalised.get("type")):
+            for key in IGNORED_OBJECT_KEYS:
+                normalised.pop(key, None)
+        else:
+            normalised.pop("title", None)
+
+        body = json.dumps(self._replace_refs(normalised, canonical_of), sort_keys=True, default=str)
+        return hashlib.sha256(body.encode()).hexdigest()
+
+    def _replace_refs(
+        self, node: Union[Dict, List, None], canonical_of: Dict[str, str]
+    ) -> Union[Dict, List, None]:
+        """
+        Returns a copy of the node where every reference points to the schema of its group.
+
+        Only the dicts and lists are copied while walking the node, which is considerably faster
+        than a deep copy followed by a second walk.
+        """
+        if isinstance(node, list):
+            return [self._replace_refs(item, canonical_of) for item in node]
+
+        if not isinstance(node, dict):
+            return node
+
+        replaced = {}
+
+        for key, value in node.items():
+            if key == "$ref" and isinstance(value, str) and value.startswith(REF_PREFIX):
+                ref_name = value[len(REF_PREFIX) :]
+                replaced[key] = REF_PREFIX + canonical_of.get(ref_name, ref_name)
+            else:
+                replaced[key] = self._replace_refs(value, canonical_of)
+
+        return replaced
@@ -0,0 +1,156 @@
+import json
+from typing import Dict, List, Optional, Set, Union
+
+from fastapi_client_generator.shared.import_planner import TYPING_IMPORT, plan_imports
+from fastapi_client_generator.shared.schema_backend_enum import SchemaBackendEnum
+from fastapi_client_generator.shared.utils import map_primitive, pascal_to_snake, snake_to_pascal
+
+DEFAULT_ENUM_THRESHOLD = 50
+"""
+Enums with more values than the threshold are generated as hashed-set validators instead of an
+inline `Literal[...]`.
+"""
+
+
+class SchemaEnums:
+    """
+    Large enums within the component schemas of an OpenAPI-spec.
+
+    Inline `Literal[...]` types are repeated in every field that uses them, which makes the generated
+    source large and its import slow for enums with thousands of values (country, currency or SKU
+    codes). Inline enums above the threshold are generated once in `schemas/shared_enums.py`, fields
+    with the same values share one definition. Named enum schemas above the threshold are generated
+    the same way in their own module and are referenced by the fields that use them.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict], threshold: int = DEFAULT_ENUM_THRESHOLD) -> None:
+        self._threshold = threshold
+        self._shared_enums: Dict[str, Dict] = {}
+        self._used_by: Dict[str, Set[str]] = {}
+
+        for schema_name, schema_data in schemas.items():
+            properties = (schema_data or {}).get("properties", {}) or {}
+            for field_key, field_obj in properties.items():
+                self._collect_shared_enums(schema_name, field_key, field_obj)
+
+    @property
+    def shared_enums(self) -> List[Dict]:
+        """The definitions of the shared enums, see `create_definition`."""
+        return list(self._shared_enums.values())
+
+    def is_large(self, enum_obj: Dict) -> bool:
+        """Returns True when the enum has more values than the threshold."""
+        return len(enum_obj.get("enum", []) or []) > self._threshold
+
+    def alias_of(self, enum_obj: Dict) -> Optional[str]:
+        """
+        Returns the name of the shared enum with the values of the given inline enum.
+
+        Returns:
+            The name of the shared enum, None when the enum is small enough to be inlined.
+        """
+        shared_enum = self._shared_enums.get(self._create_key(enum_obj))
+        return shared_enum["name"] if shared_enum else None
+
+    def used_by(self, schema_name: str) -> List[str]:
+        """Returns the names of the shared enums used by the fields of a schema."""
+        return sorted(self._used_by.get(schema_name, set()))
+
+    def create_definition(self, name: str, enum_obj: Dict) -> Dict:
+        """
+        Creates the definition of an enum type.
+
+        The base type is taken from the schema type, or inferred from the values when it is missing.
+
+        Returns:
+            A dict containing the `name`, `base_type`, `values` and `value_literals` of the enum and
+            the `values_name` of the set with its values.
+        """
+        values = list(enum_obj.get("enum", []) or [])
+        base_type = map_primitive(enum_obj.get("type"))
+
+        if base_type == "Any":
+            value_types = {type(value) for value in values if value is not None}
+            base_type = {str: "str", int: "int", float: "float", bool: "bool"}.get(
+                value_types.pop() if len(value_types) == 1 else None, "Any"
+            )
+
+        if None in values and base_type != "Any":
+            base_type = f"Optional[{base_type}]"
+
+        return {
+            "name": name,
+            "base_type": base_type,
+            "values": values,
+            "value_literals": [repr(value) for value in values],
+            "values_name": f"{pascal_to_snake(name).upper()}_VALUES",
+        }
+
+    def create_import_block(
+        self, enums: List[Dict], import_base: str, schema_backend: SchemaBackendEnum
+    ) -> str:
+        """
+        Creates the imports of a module that declares the given enum definitions.
+
+        Returns:
+            The import block with the names the enum types refer to.
+        """
+        if schema_backend == SchemaBackendEnum.MSGSPEC:
+            enum_code = ["Literal"]
+        else:
+            enum_code = [
+                f"Annotated[{enum['base_type']}, AfterValidator(EnumValues)]" for enum in enums
+            ]
+
+        return plan_imports(
+            import_base,
+            [
+                TYPING_IMPORT,
+                "from pydantic import AfterValidator",
+                "from typing_extensions import Annotated",
+                f"from {import_base}.utils.enum_values import EnumValues",
+            ],
+            enum_code,
+        )
+
+    def _collect_shared_enums(
+        self, schema_name: str, field_key: str, node: Union[Dict, List, None]
+    ) -> None:
+        """Registers every large inline enum within a property, including array items and unions."""
+        nodes = [node]
+
+        while nodes:
+            node = nodes.pop()
+
+            if isinstance(node, list):
+                nodes.extend(node)
+                continue
+
+            if not isinstance(node, dict) or "$ref" in node:
+                continue
+
+            if self.is_large(node):
+                key = self._create_key(node)
+
+                if key not in self._shared_enums:
+                    name = self._create_name(schema_name, field_key)
+                    self._shared_enums[key] = self.create_definition(name, node)
+
+                self._used_by.setdefault(schema_name, set()).add(self._shared_enums[key]["name"])
+
+            nodes.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+    def _create_name(self, schema_name: str, field_key: str) -> str:
+        """Creates a unique name for a shared enum based on its first usage."""
+        base_name = f"{schema_name}{snake_to_pascal(pascal_to_snake(field_key))}Enum"
+        names = {shared_enum["name"] for shared_enum in self._shared_enums.values()}
+        name, suffix = base_name, 2
+
+        while name in names:
+            name, suffix = f"{base_name}{suffix}", suffix + 1
+
+        return name
+
+    def _create_key(self, enum_obj: Dict) -> str:
+        """Creates the key that identifies enums with the same type and values."""
+        return json.dumps([enum_obj.get("type"), enum_obj.get("enum", [])], default=str)
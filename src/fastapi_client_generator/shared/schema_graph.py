@@ -0,0 +1,132 @@
+from typing import Dict, List, Set
+
+from fastapi_client_generator.shared.utils import collect_refs, is_primitive_type
+
+
+class SchemaGraph:
+    """
+    Reference graph of the component schemas of an OpenAPI-spec.
+
+    A schema references every schema that is used by one of its properties. Schemas that reference
+    each other, directly or through other schemas, form a cycle. Generated modules of a cycle can not
+    import each other at the top of the module, and their models can only be built once all members
+    of the cycle are defined.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict], properties_only: bool = True) -> None:
+        """
+        Args:
+            schemas: The component schemas by name.
+            properties_only: Only follows the references within the properties of a schema, which
+                are the ones its generated module imports. Follows every reference otherwise.
+        """
+        self._schemas = schemas
+        self._properties_only = properties_only
+        self._refs: Dict[str, Set[str]] = {
+            name: self._collect_refs(schema_data) for name, schema_data in schemas.items()
+        }
+        self._components = self._find_strongly_connected_components()
+        self._component_of: Dict[str, int] = {
+            name: index for index, component in enumerate(self._components) for name in component
+        }
+
+    @property
+    def components(self) -> List[List[str]]:
+        """
+        The schemas grouped by cycle, schemas without a cycle form a group on their own.
+
+        Groups are ordered so that the schemas a group references come before the group itself.
+        """
+        return self._components
+
+    def refs(self, schema_name: str) -> Set[str]:
+        """Returns the names of all schemas that are referenced by the given schema."""
+        return self._refs.get(schema_name, set())
+
+    def cycle_of(self, schema_name: str) -> Set[str]:
+        """
+        Returns the schemas that are part of the same reference cycle as the given schema.
+
+        Returns:
+            The names of all members of the cycle, including the schema itself. An empty set when
+            the schema is not part of a cycle.
+        """
+        if schema_name not in self._component_of:
+            return set()
+
+        component = set(self._components[self._component_of[schema_name]])
+
+        if len(component) > 1 or schema_name in self.refs(schema_name):
+            return component
+
+        return set()
+
+    def is_model(self, schema_name: str) -> bool:
+        """Determines whether a schema is generated as a model class instead of a type alias."""
+        schema_data = self._schemas.get(schema_name) or {}
+        return not is_primitive_type(schema_data.get("type"))
+
+    def _collect_refs(self, schema_data: Dict) -> Set[str]:
+        """Collects the names of all schemas referenced within the properties of the schema."""
+        node = (
+            list(((schema_data or {}).get("properties", {}) or {}).values())
+            if self._properties_only
+            else schema_data
+        )
+        refs = {ref.split("/")[-1] for ref in collect_refs(node)}
+
+        return {ref for ref in refs if ref in self._schemas}
+
+    def _find_strongly_connected_components(self) -> List[List[str]]:
+        """
+        Finds the reference cycles using Tarjan's algorithm.
+
+        The algorithm is implemented iteratively, so long reference chains in large specs do not
+        hit the recursion limit. Components are emitted after all components they reference.
+        """
+        index: Dict[str, int] = {}
+        low_link: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        components: List[List[str]] = []
+
+        for root in self._schemas:
+            if root in index:
+                continue
+
+            work = [(root, iter(sorted(self.refs(root))))]
+            index[root] = low_link[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, refs = work[-1]
+                ref = next(refs, None)
+
+                if ref is not None:
+                    if ref not in index:
+                        index[ref] = low_link[ref] = len(index)
+                        stack.append(ref)
+                        on_stack.add(ref)
+                        work.append((ref, iter(sorted(self.refs(ref)))))
+                    elif ref in on_stack:
+                        low_link[node] = min(low_link[node], index[ref])
+                    continue
+
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[node])
+
+                if low_link[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+        return components
@@ -0,0 +1,202 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+UNION_KEYS = ("oneOf", "anyOf")
+
+
+class SchemaUnions:
+    """
+    Discriminators of the `oneOf`/`anyOf` unions within the component schemas of an OpenAPI-spec.
+
+    A union is discriminated when every member, apart from `null`, is a referenced object schema
+    that can be told apart by a tag property. The tag property is either given by the
+    `discriminator` of the union, or inferred when every member requires the same property with a
+    `const` or `enum` value that no other member uses. Validation can then dispatch on the tag
+    directly instead of trying every member in turn.
+
+    Every member schema gets one tag. A schema that is a member of unions with different tag
+    properties keeps the tag of the first union, the other unions are not discriminated.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict]) -> None:
+        self._schemas = schemas
+        self._tags: Dict[str, Tuple[str, List[Any]]] = {}
+
+        for schema_data in schemas.values():
+            self._collect_tags(schema_data)
+
+    def discriminator_of(self, union_obj: Dict) -> Optional[str]:
+        """
+        Returns the tag property of a union.
+
+        Returns:
+            The original name of the tag property. None when the union is not discriminated.
+        """
+        candidate = self._find_discriminator(union_obj)
+
+        if candidate is None:
+            return None
+
+        property_name, tags = candidate
+        if all(self._tags.get(member, (None,))[0] == property_name for member in tags):
+            return property_name
+
+        return None
+
+    def tag_of(self, schema_name: str) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Returns the tag of a schema that is a member of a discriminated union.
+
+        Returns:
+            The original name of the tag property and the values that select the schema. None
+            when the schema is no member of a discriminated union.
+        """
+        return self._tags.get(schema_name)
+
+    def tag_class_names(self, schema_name: str) -> List[str]:
+        """
+        Returns the msgspec Struct names of a schema, one for every tag value of the schema.
+
+        msgspec selects a Struct by a single tag value, so a member that is selected by several tag
+        values gets a subclass for every further value, numbered by the position of the value.
+
+        Returns:
+            The class name of the schema, followed by the names of its tag subclasses.
+        """
+        _, tag_values = self._tags.get(schema_name, (None, []))
+        class_name = f"{schema_name}Schema"
+        return [class_name, *(f"{class_name}{index}" for index in range(1, len(tag_values)))]
+
+    def _collect_tags(self, node: Union[Dict, List, None]) -> None:
+        """Walks through a schema and registers the member tags of every discriminated union."""
+        nodes = [node]
+
+        while nodes:
+            node = nodes.pop()
+
+            if isinstance(node, list):
+                nodes.extend(node)
+                continue
+
+            if not isinstance(node, dict):
+                continue
+
+            candidate = self._find_discriminator(node)
+
+            if candidate is not None:
+                property_name, tags = candidate
+                for member, values in tags.items():
+                    self._tags.setdefault(member, (property_name, values))
+
+            nodes.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+    def _find_discriminator(self, union_obj: Dict) -> Optional[Tuple[str, Dict[str, List[Any]]]]:
+        """
+        Finds the tag property of a union and the tag values of its members.
+
+        Returns:
+            The tag property and the tag values keyed by member schema name. None when the node is no
+            union of referenced object schemas, or when its members can not be told apart.
+        """
+        members = next((union_obj[key] for key in UNION_KEYS if union_obj.get(key)), None)
+
+        if not isinstance(members, list):
+            return None
+
+        member_names = [
+            self._read_member_name(member)
+            for member in members
+            if not (isinstance(member, dict) and member.get("type") == "null")
+        ]
+
+        if (
+            len(member_names) < 2
+            or not all(member_names)
+            or len(set(member_names)) != len(member_names)
+        ):
+            return None
+
+        discriminator = union_obj.get("discriminator")
+
+        if isinstance(discriminator, dict) and discriminator.get("propertyName"):
+            return self._read_explicit_tags(discriminator, member_names)
+
+        return self._infer_tags(member_names)
+
+    def _read_explicit_tags(
+        self, discriminator: Dict, member_names: List[str]
+    ) -> Tuple[str, Dict[str, List[Any]]]:
+        """
+        Reads the member tags of a union with a `discriminator`.
+
+        Tags are taken from the `mapping`, from a `const`/`enum` of the tag property, or default to
+        the schema name as defined by the OpenAPI specification.
+        """
+        property_name = discriminator["propertyName"]
+        mapping: Dict[str, str] = discriminator.get("mapping", {}) or {}
+        tags: Dict[str, List[Any]] = {}
+
+        for member_name in member_names:
+            mapped = [tag for tag, ref in mapping.items() if ref.split("/")[-1] == member_name]
+            literal = self._read_literal_values(member_name, property_name)
+            tags[member_name] = mapped or literal or [member_name]
+
+        return property_name, tags
+
+    def _infer_tags(self, member_names: List[str]) -> Optional[Tuple[str, Dict[str, List[Any]]]]:
+        """
+        Infers the tag property of a union without `discriminator`.
+
+        Returns:
+            The first property that every member requires with distinct `const`/`enum` values. None
+            when no such property exists.
+        """
+        first_member = self._schemas[member_names[0]]
+
+        for property_name in (first_member.get("properties", {}) or {}).keys():
+            tags = {
+                member_name: self._read_literal_values(member_name, property_name, required=True)
+                for member_name in member_names
+            }
+            values = [value for member_values in tags.values() for value in member_values]
+
+            if all(tags.values()) and len(values) == len(set(map(repr, values))):
+                return property_name, tags
+
+        return None
+
+    def _read_member_name(self, member: Any) -> Optional[str]:
+        """Returns the name of a union member that references an object schema."""
+        if not isinstance(member, dict) or not isinstance(member.get("$ref"), str):
+            return None
+
+        name = member["$ref"].split("/")[-1]
+        schema_data = self._schemas.get(name) or {}
+
+        if schema_data.get("type", "object") != "object" or "properties" not in schema_data:
+            return None
+
+        return name
+
+    def _read_literal_values(
+        self, schema_name: str, property_name: str, required: bool = False
+    ) -> List[Any]:
+        """
+        Reads the `const` or `enum` values of a property of a schema.
+
+        Returns:
+            The values of the property, empty when the property has no fixed values or is not
+            required while `required` is set.
+        """
+        schema_data = self._schemas.get(schema_name) or {}
+        prop = (schema_data.get("properties", {}) or {}).get(property_name)
+
+        if not isinstance(prop, dict):
+            return []
+
+        if required and property_name not in (schema_data.get("required", []) or []):
+            return []
+
+        if "const" in prop:
+            return [prop["const"]]
+
+        return list(prop.get("enum", []) or [])
@@ -0,0 +1,132 @@
+import hashlib
+import json
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from fastapi_client_generator.shared.config import Config
+
+# The spec is hashed with the selected operations only, the other attributes change how the files
+# are written, formatted or logged, not the code that is rendered.
+UNRENDERED_CONFIG_ATTRIBUTES = (
+    "api_spec",
+    "operation_filter",
+    "incremental",
+    "format_code",
+    "file_manager",
+    "log_actions",
+    "jinja_env",
+)
+
+
+class SpecFingerprint:
+    """
+    Hashes of the inputs a client is generated from, and of the code rendered for every file.
+
+    The generator digest covers the generator version, its templates and every option of the
+    configuration, the spec digest the spec with the selected operations. The file digests are the
+    hashes of the code the builders rendered, before formatting, so they cover every part of the
+    spec a builder reads.
+
+    The fingerprint is embedded in the client when it is generated. When the generator and the
+    spec are the same, the client is up to date without rendering anything. Otherwise the client is
+    rendered in memory, without formatting, and the files of which the code changed are stale.
+    """
+
+    def __init__(self, config: Config, api_spec: Dict) -> None:
+        """
+        Args:
+            config: Configuration of the client, its options and templates are part of the hash.
+            api_spec: The OpenAPI-spec with the selected operations only, see `OperationFilter`.
+        """
+        self._config = config
+        self.generator_digest = self._create_generator_digest()
+        self.spec_digest = self._create_digest(api_spec)
+
+    def create_fingerprint(self, code_digests: Dict[Path, str]) -> Dict[str, Any]:
+        """
+        Creates the fingerprint that is embedded in the generated client.
+
+        Args:
+            code_digests: The hash of the rendered code of every generated file, see
+                `FileManager.code_digests`.
+        """
+        return {
+            "generator": self.generator_digest,
+            "spec": self.spec_digest,
+            "files": dict(sorted(self._relate_code_digests(code_digests).items())),
+        }
+
+    def is_up_to_date(self, fingerprint: Optional[Dict[str, Any]]) -> bool:
+        """
+        Compares the digests of the generator and the spec with the fingerprint embedded in a client.
+
+        Args:
+            fingerprint: The embedded fingerprint, None when the client has none.
+        """
+        return bool(fingerprint) and (
+            fingerprint.get("generator") == self.generator_digest
+            and fingerprint.get("spec") == self.spec_digest
+        )
+
+    def find_stale_files(
+        self, fingerprint: Optional[Dict[str, Any]], code_digests: Dict[Path, str]
+    ) -> List[str]:
+        """
+        Compares the fingerprint embedded in a client with the code rendered for the spec.
+
+        Args:
+            fingerprint: The embedded fingerprint, None when the client has none.
+            code_digests: The hash of the code of every file, rendered for the spec.
+
+        Returns:
+            The files that regenerating would write and the files that are no longer generated,
+            relative to the API-client folder. Every file when the client has no fingerprint.
+        """
+        file_digests = self._relate_code_digests(code_digests)
+        embedded_digests: Dict[str, str] = (fingerprint or {}).get("files", {})
+
+        return sorted(
+            file_path
+            for file_path in set(embedded_digests) | set(file_digests)
+            if embedded_digests.get(file_path) != file_digests.get(file_path)
+        )
+
+    def _relate_code_digests(self, code_digests: Dict[Path, str]) -> Dict[str, str]:
+        """Keys the code digests by their path relative to the API-client folder."""
+        return {
+            file_path.relative_to(self._config.root_path).as_posix(): code_digest
+            for file_path, code_digest in code_digests.items()
+        }
+
+    def _create_generator_digest(self) -> str:
+        """Hashes the generator version, its templates and the options of the configuration."""
+        templates = {
+            template_path.name: template_path.read_text(encoding="utf-8")
+            for template_path in sorted(self._config.templates_path.glob("*.jinja"))
+        }
+        options = {
+            name: value
+            for name, value in vars(self._config).items()
+            if name not in UNRENDERED_CONFIG_ATTRIBUTES
+        }
+
+        return self._create_digest(
+            {
+                "version": self._read_generator_version(),
+                "templates": templates,
+                "options": options,
+            }
+        )
+
+    def _read_generator_version(self) -> Optional[str]:
+        """Reads the installed version of the generator, None when running from source."""
+        try:
+            return metadata.version("fastapi-client-generator")
+        except metadata.PackageNotFoundError:
+            return None
+
+    def _create_digest(self, fragments: Any) -> str:
+        """Hashes JSON-serialisable fragments independently of the order of their keys."""
+        data = json.dumps(fragments, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
@@ -0,0 +1,247 @@
+from typing import Any, Dict, List, Optional
+
+from fastapi_client_generator.shared.pagination_conventions import PAGINATION_EXTENSION
+from fastapi_client_generator.shared.utils import collect_refs, pascal_to_snake
+
+JSON_BODY = "json"
+BINARY_BODY = "binary"
+MULTIPART_BODY = "multipart"
+
+RESERVED_FIELD_NAMES = ("from",)
+
+
+class FieldNode:
+    """
+    A property of a schema, with the attribute name it is generated as.
+
+    The attribute name is the snake_case property name, suffixed with `_` when it is a reserved
+    Python word.
+    """
+
+    __slots__ = ("key", "snake_name", "name", "required", "data")
+
+    def __init__(self, key: str, data: Optional[Dict], required: bool = False) -> None:
+        self.key = key
+        self.snake_name = pascal_to_snake(key)
+        self.name = (
+            f"{self.snake_name}_" if self.snake_name in RESERVED_FIELD_NAMES else self.snake_name
+        )
+        self.required = required
+        self.data: Dict = data or {}
+
+
+class SchemaNode:
+    """A component schema with its fields and the names of the schemas its fields reference."""
+
+    __slots__ = ("name", "data", "type", "required", "fields", "refs")
+
+    def __init__(self, name: str, data: Optional[Dict]) -> None:
+        self.name = name
+        self.data: Dict = data or {}
+        self.type: Optional[str] = self.data.get("type")
+
+        properties: Dict = self.data.get("properties", {}) or {}
+
+        self.required: List[str] = self.data.get("required", []) or []
+        self.fields = [FieldNode(key, obj, key in self.required) for key, obj in properties.items()]
+        self.refs = {ref.split("/")[-1] for ref in collect_refs(list(properties.values()))}
+
+
+class ParameterNode:
+    """A parameter of an operation, with the argument name and type it is generated as."""
+
+    __slots__ = ("name", "argument", "location", "required", "description", "schema", "ref")
+
+    def __init__(self, data: Dict) -> None:
+        self.name: str = data.get("name")
+        self.argument = pascal_to_snake(self.name)
+        self.location: Optional[str] = data.get("in")
+        self.required = bool(data.get("required", False))
+        self.description: str = data.get("description", "")
+        self.schema: Dict = data.get("schema", {}) or {}
+        self.ref: Optional[str] = self.schema.get("$ref") or None
+
+
+class RequestBodyNode:
+    """
+    The request body of an operation.
+
+    The kind and the type of the body are determined by its first content type. The references of
+    all content types are kept, as every referenced schema is imported.
+    """
+
+    __slots__ = ("content_types", "kind", "ref", "refs", "file_fields")
+
+    def __init__(self, data: Dict, schemas: Dict[str, Dict]) -> None:
+        content: Dict = (data or {}).get("content", {})
+        first_schema: Dict = next(iter(content.values()), {}).get("schema", {})
+
+        self.content_types = list(content)
+        self.kind = self._determ_kind(content)
+        self.ref: Optional[str] = first_schema.get("$ref")
+        self.refs = [
+            content_data["schema"]["$ref"]
+            for content_data in content.values()
+            if "$ref" in content_data.get("schema", {})
+        ]
+        self.file_fields = (
+            self._read_file_fields(first_schema, schemas) if self.kind == MULTIPART_BODY else []
+        )
+
+    def _determ_kind(self, content: Dict) -> Optional[str]:
+        """
+        Determines how the request body is sent, based on the first content type.
+
+        Returns:
+            `multipart` for form uploads, `binary` for raw file uploads, `json` otherwise. None
+            when the request body has no content.
+        """
+        for content_type, content_data in content.items():
+            media_type = content_type.split(";")[0].strip().lower()
+
+            if media_type == "multipart/form-data":
+                return MULTIPART_BODY
+
+            if media_type == "application/octet-stream" or is_binary_schema(
+                content_data.get("schema", {})
+            ):
+                return BINARY_BODY
+
+            return JSON_BODY
+
+        return None
+
+    def _read_file_fields(self, schema: Dict, schemas: Dict[str, Dict]) -> List[str]:
+        """Reads the names of the multipart properties that are declared as binary."""
+        file_fields = []
+        schema = resolve_schema(schema, schemas)
+
+        for name, prop in (schema.get("properties", {}) or {}).items():
+            prop = resolve_schema(prop or {}, schemas)
+            items = resolve_schema(prop.get("items", {}) or {}, schemas)
+
+            if is_binary_schema(prop) or is_binary_schema(items):
+                file_fields.append(name)
+
+        return file_fields
+
+
+class ResponseNode:
+    """
+    The successful response of an operation.
+
+    The schema is the first JSON schema of the 2xx responses. A response that declares content,
+    but no JSON content, is a file download.
+    """
+
+    __slots__ = ("is_download", "schema", "type", "ref", "item_ref", "properties")
+
+    def __init__(self, data: Dict, schemas: Dict[str, Dict]) -> None:
+        success_responses = [
+            status_info or {}
+            for status, status_info in (data or {}).items()
+            if 200 <= int(status) <= 299
+        ]
+        media_types = [
+            media_type
+            for status_info in success_responses
+            for media_type in status_info.get("content", {}) or {}
+        ]
+
+        self.is_download = bool(media_types) and not any(map(is_json_media_type, media_types))
+        self.schema = self._read_schema(success_responses)
+        self.type: Optional[str] = self.schema.get("type") if self.schema else None
+
+        items: Dict = (self.schema or {}).get("items", {}) or {}
+        self.item_ref: Optional[str] = items.get("$ref") if self.type == "array" else None
+
+        if not self.schema:
+            self.ref = None
+        elif "$ref" in self.schema:
+            self.ref = self.schema["$ref"]
+        else:
+            self.ref = self.item_ref
+
+        resolved_schema = resolve_schema(self.schema or {}, schemas)
+        self.properties: Dict = resolved_schema.get("properties", {}) or {}
+
+    def _read_schema(self, success_responses: List[Dict]) -> Optional[Dict]:
+        """Reads the schema of the first JSON content type of the first 2xx response with one."""
+        for status_info in success_responses:
+            for media_type, content_data in (status_info.get("content", {}) or {}).items():
+                if is_json_media_type(media_type):
+                    schema = content_data.get("schema", {})
+
+                    if schema:
+                        return schema
+
+                    break
+
+        return None
+
+
+class OperationNode:
+    """An operation of an endpoint, compiled once from the method data of the spec."""
+
+    __slots__ = (
+        "path",
+        "method",
+        "summary",
+        "description",
+        "pagination",
+        "parameters",
+        "request_body",
+        "response",
+    )
+
+    def __init__(self, path: str, method: str, data: Dict, schemas: Dict[str, Dict]) -> None:
+        self.path = path
+        self.method = method
+        self.summary: Optional[str] = data.get("summary")
+        self.description: Optional[str] = data.get("description")
+        self.pagination: Any = data.get(PAGINATION_EXTENSION, {})
+        self.parameters = [ParameterNode(param) for param in data.get("parameters", [])]
+        self.request_body = (
+            RequestBodyNode(data["requestBody"], schemas) if "requestBody" in data else None
+        )
+        self.response = ResponseNode(data.get("responses", {}), schemas)
+
+
+class EndpointNode:
+    """
+    A path of the spec with its operations.
+
+    Typed intermediate representation the endpoint builders render from. The spec is read in one
+    pass, so facts such as the response schema or the argument names are derived once per
+    operation instead of once per builder that uses them.
+    """
+
+    __slots__ = ("path", "operations")
+
+    def __init__(self, path: str, data: Dict, schemas: Dict[str, Dict]) -> None:
+        self.path = path
+        self.operations = [
+            OperationNode(path, method, method_data, schemas)
+            for method, method_data in data.items()
+        ]
+
+
+def resolve_schema(schema: Dict, schemas: Dict[str, Dict]) -> Dict:
+    """Resolves a `$ref` to the referenced component schema."""
+    if "$ref" not in schema:
+        return schema
+
+    return schemas.get(schema["$ref"].split("/")[-1], {}) or {}
+
+
+def is_binary_schema(schema: Dict) -> bool:
+    """Returns True if the schema describes binary file content."""
+    return schema.get("type") == "string" and (
+        schema.get("format") == "binary" or "contentMediaType" in schema
+    )
+
+
+def is_json_media_type(media_type: str) -> bool:
+    """Returns True for `application/json` and structured `+json` media types."""
+    media_type = media_type.split(";")[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+
+class SpecWatcher:
+    """
+    Watches a local OpenAPI-spec file, or polls an OpenAPI-spec URL, for changes.
+
+    Files are polled by their modification time and size, and only read when either changed. URLs
+    are polled with conditional requests (`If-None-Match`/`If-Modified-Since`), so an unchanged spec
+    is answered with `304 Not Modified` and is not downloaded or parsed again. A change is debounced:
+    the spec is read again until it stays the same for `debounce` seconds, so a spec that is written
+    in several steps triggers a single regeneration. Once the first spec was read, a spec that can
+    not be read or parsed is logged and polled again, the last spec stays in use until then.
+    """
+
+    def __init__(
+        self,
+        source: str,
+        interval: float = 1.0,
+        debounce: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+        log: Callable[[str], None] = print,
+    ) -> None:
+        """
+        Args:
+            source: Path of a local OpenAPI-spec file, or an `http(s)://` URL of an OpenAPI-spec.
+            interval: Seconds between two polls of the spec.
+            debounce: Seconds a changed spec has to stay the same before it is returned.
+            sleep: Waits between polls, replaceable for testing.
+            log: Logs the polls that failed.
+        """
+        self._source = source
+        self._interval = interval
+        self._debounce = debounce
+        self._sleep = sleep
+        self._log = log
+        self._is_url = source.startswith(("http://", "https://"))
+        self._session = self._create_session() if self._is_url else None
+        self._validators: Dict[str, str] = {}
+        self._file_stat: Optional[tuple] = None
+        self._digest: Optional[str] = None
+        self._content: Optional[bytes] = None
+
+    def changes(self) -> Iterator[Dict]:
+        """
+        Yields the parsed OpenAPI-spec once at the start, and again every time it changed.
+
+        Polls until the caller stops iterating. A spec that can not be read at the start raises, a
+        spec that can not be read or parsed later on is logged and skipped.
+        """
+        self._read_changed()
+        yield json.loads(self._content)
+
+        changed = False
+
+        while True:
+            self._sleep(self._interval)
+
+            try:
+                changed = self._read_changed() or changed
+                if not changed:
+                    continue
+
+                self._wait_until_stable()
+                changed = False
+                api_spec = json.loads(self._content)
+            except OSError as error:
+                self._log(f"Could not read '{self._source}', polling again: {error}")
+                continue
+            except ValueError as error:
+                self._log(f"'{self._source}' is not valid JSON, waiting for a change: {error}")
+                continue
+
+            yield api_spec
+
+    def _wait_until_stable(self) -> None:
+        """Reads the spec again until it stopped changing for `debounce` seconds."""
+        while True:
+            self._sleep(self._debounce)
+
+            if not self._read_changed():
+                return
+
+    def _read_changed(self) -> bool:
+        """
+        Reads the spec when it was modified since the previous read.
+
+        Returns:
+            True when the content of the spec changed.
+        """
+        content = self._read_url() if self._is_url else self._read_file()
+
+        if content is None:
+            return False
+
+        digest = hashlib.sha256(content).hexdigest()
+        if digest == self._digest:
+            return False
+
+        self._digest, self._content = digest, content
+        return True
+
+    def _read_file(self) -> Optional[bytes]:
+        """Reads the spec file, returns None when its modification time and size did not change."""
+        path = Path(self._source).expanduser()
+        stat = path.stat()
+        file_stat = (stat.st_mtime_ns, stat.st_size)
+
+        if file_stat == self._file_stat:
+            return None
+
+        content = path.read_bytes()
+        self._file_stat = file_stat
+        return content
+
+    def _create_session(self) -> "requests.Session":
+        """Creates the session that polls the spec URL, `requests` is only imported for URLs."""
+        import requests
+
+        return requests.Session()
+
+    def _read_url(self) -> Optional[bytes]:
+        """Downloads the spec, returns None when the server answers `304 Not Modified`."""
+        headers = {}
+        if "etag" in self._validators:
+            headers["If-None-Match"] = self._validators["etag"]
+        if "last-modified" in self._validators:
+            headers["If-Modified-Since"] = self._validators["last-modified"]
+
+        response = self._session.get(self._source, headers=headers, timeout=30)
+
+        if response.status_code == 304:
+            return None
+
+        response.raise_for_status()
+        self._validators = {
+            key: response.headers[key]
+            for key in ("etag", "last-modified")
+            if key in response.headers
+        }
+        return response.content
@@ -8,7 +8,21 @@ class TemplateEnum(str, Enum):
     CLIENT_BASE_TEMPLATE = "client_base_template.jinja"
     ENDPOINT_TEMPLATE = "endpoint_template.jinja"
     ENDPOINT_METHOD_TEMPLATE = "endpoint_method_template.jinja"
+    ENDPOINT_METHOD_PAGINATION_TEMPLATE = "endpoint_method_pagination_template.jinja"
+    SCHEMA_ALIAS_TEMPLATE = "schema_alias_template.jinja"
     SCHEMA_BASE_TEMPLATE = "schema_base_template.jinja"
+    SCHEMA_BASE_MSGSPEC_TEMPLATE = "schema_base_msgspec_template.jinja"
     SCHEMA_OBJECT_TEMPLATE = "schema_object_template.jinja"
+    SCHEMA_OBJECT_MSGSPEC_TEMPLATE = "schema_object_msgspec_template.jinja"
+    SCHEMA_ENUM_TEMPLATE = "schema_enum_template.jinja"
+    SCHEMA_GRAPH_TEMPLATE = "schema_graph_template.jinja"
     SCHEMA_PRIMITIVE_TEMPLATE = "schema_primitive_template.jinja"
+    UTIL_DOWNLOAD = "util_download.jinja"
+    UTIL_ENUM_VALUES = "util_enum_values.jinja"
+    UTIL_PAGINATION = "util_pagination.jinja"
+    UTIL_RATE_LIMIT = "util_rate_limit.jinja"
+    UTIL_SINGLE_FLIGHT = "util_single_flight.jinja"
     UTIL_REQUEST_BASE = "util_request_base.jinja"
+    UTIL_TRANSPORT = "util_transport.jinja"
+    UTIL_UPLOAD = "util_upload.jinja"
+    UTIL_WARMUP = "util_warmup.jinja"
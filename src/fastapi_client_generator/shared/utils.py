@@ -1,7 +1,5 @@
 import re
-from typing import Dict, Optional
-
-import requests
+from typing import Any, Dict, Optional, Set
 
 
 def slugify(value: str) -> str:
@@ -87,6 +85,34 @@ def convert_ref_to_import_path(import_base: str, ref: str) -> str:
     return f"from {import_base}.schemas.{module} import {symbol}"
 
 
+def collect_refs(node: Any) -> Set[str]:
+    """
+    Collects the `$ref` values anywhere within a node of an OpenAPI-spec.
+
+    The node is walked iteratively, so deeply nested schemas do not hit the recursion limit.
+
+    Args:
+        node: A schema, a list of schemas or any other fragment of the OpenAPI-spec.
+
+    Returns:
+        The references as written in the spec, e.g. '#/components/schemas/Item'.
+    """
+    refs: Set[str] = set()
+    nodes = [node]
+
+    while nodes:
+        node = nodes.pop()
+
+        if isinstance(node, list):
+            nodes.extend(node)
+        elif isinstance(node, dict):
+            if isinstance(node.get("$ref"), str):
+                refs.add(node["$ref"])
+            nodes.extend(value for value in node.values() if isinstance(value, (dict, list)))
+
+    return refs
+
+
 def convert_enum_to_literal(obj: Dict):
     """
     Converts an OpenAPI enum definition into a Python Literal type.
@@ -114,6 +140,8 @@ def download_api_spec_content(api_spec_url: str) -> dict:
     Returns:
         The API-spec content as dict
     """
+    import requests
+
     response = requests.get(url=api_spec_url, timeout=15)
     response.raise_for_status()
     return response.json()
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fastapi_client_generator.cli import cli
+from fastapi_client_generator.shared.config import Config
+from tests.http_server import MockApiHandler
+
+runner = CliRunner()
+
+
+def test_batch_generates_clients_from_manifest(
+    local_openapi_spec_path: Path,
+    mock_api_url: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that the clients of a manifest are generated from files and URLs and formatted once."""
+    monkeypatch.chdir(tmp_path)
+    spec_path = tmp_path / "specs" / "openapi.json"
+    spec_path.parent.mkdir()
+    spec_path.write_text(local_openapi_spec_path.read_text())
+    MockApiHandler.api_spec = json.loads(local_openapi_spec_path.read_text())
+
+    manifest_path = spec_path.parent / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "clients": [
+                    {"client_name": "orders", "source": "openapi.json"},
+                    {
+                        "client_name": "billing",
+                        "source": "openapi.json",
+                        "schema_backend": "msgspec",
+                        "include_paths": ["/items"],
+                    },
+                    {"client_name": "users", "source": f"{mock_api_url}/openapi.json"},
+                ]
+            }
+        )
+    )
+
+    result = runner.invoke(cli, ["batch", "--manifest", str(manifest_path), "--workers", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Generated 3 clients from manifest" in result.stdout
+    assert result.stdout.count("Running 'ruff format' on 3 API-clients") == 1
+    assert result.stdout.count("Running 'ruff") == 1
+
+    for client_name in ("orders", "billing", "users"):
+        item_schema = (tmp_path / client_name / "schemas" / "item_schema.py").read_text()
+
+        assert not (tmp_path / client_name / "api-spec.json").exists()
+        assert "from typing import Optional, List, Any, Literal" not in item_schema
+
+    assert "msgspec" in (tmp_path / "billing" / "schemas" / "base_schema.py").read_text()
+    assert [path.name for path in (tmp_path / "billing" / "endpoints").glob("*_endpoint.py")] == [
+        "items_endpoint.py"
+    ]
+
+
+def test_configs_share_the_template_environment():
+    """Test that every configuration in the process reuses the loaded templates."""
+    assert Config({}, "first").jinja_env is Config({}, "second").jinja_env
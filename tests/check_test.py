@@ -0,0 +1,187 @@
+import copy
+import inspect
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+from typer.testing import CliRunner
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.cli import cli
+
+runner = CliRunner()
+
+
+def _modification_times(client_path: Path) -> Dict[str, int]:
+    return {
+        str(path.relative_to(client_path)): path.stat().st_mtime_ns
+        for path in client_path.rglob("*.py")
+    }
+
+
+def _rendered_changes(generator: FastapiClientGenerator, api_spec: Dict, base: Dict) -> set:
+    """Renders the client for a spec and returns the files of which the code differs from base."""
+    code_digests = generator._render_code_digests(api_spec)
+    client_path = Path.cwd() / "checked_client"
+    return {
+        path.relative_to(client_path).as_posix()
+        for path in set(code_digests) | set(base)
+        if code_digests.get(path) != base.get(path)
+    }
+
+
+def _mutated_leaves(node: Any, path: Tuple = ()) -> Iterator[Tuple[Tuple, Any]]:
+    """Yields the path of every leaf of the spec with a changed value, once per key name."""
+    seen_keys = set()
+    nodes = [(path, node)]
+
+    while nodes:
+        path, node = nodes.pop()
+
+        if isinstance(node, dict):
+            nodes.extend((path + (key,), value) for key, value in node.items())
+        elif isinstance(node, list):
+            nodes.extend((path + (index,), value) for index, value in enumerate(node))
+        elif isinstance(node, (str, bool, int, float)):
+            key = next(part for part in reversed(path) if isinstance(part, str))
+
+            if key in seen_keys:
+                continue
+
+            seen_keys.add(key)
+            if isinstance(node, bool):
+                yield path, not node
+            elif isinstance(node, str):
+                yield path, f"{node}Changed"
+            else:
+                yield path, node + 1
+
+
+def test_check_reports_stale_files(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that `--check` passes for a generated client and lists the files of a changed schema."""
+    monkeypatch.chdir(tmp_path)
+    spec_path = tmp_path / "openapi.json"
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    spec_path.write_text(json.dumps(api_spec))
+    args = ["from-file", "-c", "checked_client", "-f", str(spec_path)]
+
+    assert runner.invoke(cli, args).exit_code == 0
+    before = _modification_times(tmp_path / "checked_client")
+
+    result = runner.invoke(cli, [*args, "--check"])
+
+    assert result.exit_code == 0, result.stdout
+    assert "Client 'checked_client' is up to date" in result.stdout
+
+    api_spec["components"]["schemas"]["Dog"]["properties"]["age"] = {"type": "integer"}
+    spec_path.write_text(json.dumps(api_spec))
+
+    result = runner.invoke(cli, [*args, "--check"])
+
+    assert result.exit_code == 1
+    assert "  schemas/dog_schema.py" in result.stdout
+    assert "schemas/cat_schema.py" not in result.stdout
+    assert _modification_times(tmp_path / "checked_client") == before
+
+
+def test_check_covers_regenerated_files(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that every file that a regeneration writes or removes is reported as stale first."""
+    monkeypatch.chdir(tmp_path)
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    generator = FastapiClientGenerator(client_name="checked_client")
+    client_path = tmp_path / "checked_client"
+    generator.from_api_spec(api_spec)
+
+    schemas = api_spec["components"]["schemas"]
+    schemas["ItemOutput"]["properties"]["rating"] = {"type": "number"}
+    schemas["ItemCopy"] = dict(schemas["ItemInput"])
+    del schemas["EmptyProperty"]
+    api_spec["paths"]["/items"]["get"]["summary"] = "List every item"
+
+    stale_files = generator.check(api_spec)
+    before = _modification_times(client_path)
+    generator.from_api_spec(api_spec)
+    after = _modification_times(client_path)
+
+    changed_files = {
+        name for name in set(before) | set(after) if before.get(name) != after.get(name)
+    }
+
+    assert changed_files <= set(stale_files)
+    assert {
+        "endpoints/items_endpoint.py",
+        "schemas/item_copy_schema.py",
+        "schemas/item_output_schema.py",
+    } <= changed_files
+    assert "schemas/empty_property_schema.py" in stale_files
+    assert generator.check(api_spec) == []
+
+
+def test_check_covers_every_spec_field(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a change of any field the generator renders from is reported, and nothing else."""
+    monkeypatch.chdir(tmp_path)
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    generator = FastapiClientGenerator(client_name="checked_client", format_code=False)
+    generator.from_api_spec(api_spec)
+    base = generator._render_code_digests(api_spec)
+    covered_fields = 0
+
+    for path, value in _mutated_leaves(api_spec):
+        mutated_spec = copy.deepcopy(api_spec)
+        node = mutated_spec
+        for key in path[:-1]:
+            node = node[key]
+        node[path[-1]] = value
+
+        try:
+            changed_files = _rendered_changes(generator, mutated_spec, base)
+        except Exception:
+            # Changes such as a non-numeric status code are no valid spec.
+            continue
+
+        assert set(generator.check(mutated_spec)) == changed_files, path
+        covered_fields += bool(changed_files)
+
+    assert covered_fields >= 10
+
+
+def test_check_covers_every_option(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a changed generator option is reported for the files of which the code changes."""
+    monkeypatch.chdir(tmp_path)
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    generator = FastapiClientGenerator(client_name="checked_client", format_code=False)
+    generator.from_api_spec(api_spec)
+    base = generator._render_code_digests(api_spec)
+    options = {
+        "pagination_conventions": {"offset_params": ["start"]},
+        "schema_backend": "msgspec",
+        "enum_threshold": 1,
+        "deduplicate_schemas": False,
+        "include_tags": ["items"],
+        "exclude_tags": ["items"],
+        "include_paths": ["/items*"],
+        "exclude_paths": ["/items*"],
+        "include_operation_ids": ["read_item*"],
+        "exclude_operation_ids": ["read_item*"],
+        "format_code": True,
+    }
+    parameters = inspect.signature(FastapiClientGenerator).parameters
+
+    for name in parameters:
+        if name == "client_name":
+            continue
+
+        option_generator = FastapiClientGenerator(
+            **{"client_name": "checked_client", "format_code": False, name: options[name]}
+        )
+        changed_files = _rendered_changes(option_generator, api_spec, base)
+        assert set(option_generator.check(api_spec)) == changed_files, name
@@ -1,11 +1,19 @@
+import importlib
 import shutil
 from pathlib import Path
+from types import ModuleType
 
 import pytest
 
 from fastapi_client_generator import FastapiClientGenerator
+from tests.fastapi_instance import fastapi_instance
+from tests.http2_server import start_http2_server
+from tests.http_server import start_mock_api
 
 MOCK_CLIENT_NAME = "mock_client"
+RUNTIME_CLIENT_NAME = "runtime_client"
+MSGSPEC_CLIENT_NAME = "msgspec_client"
+FASTAPI_CLIENT_NAME = "fastapi_client"
 
 
 @pytest.fixture
@@ -25,7 +33,57 @@ def fastapi_client_generator() -> FastapiClientGenerator:
     )
 
 
+@pytest.fixture(scope="session")
+def runtime_client() -> ModuleType:
+    """
+    Generates a client from the local mock OpenAPI spec and imports the generated package, so
+    tests can call the generated code.
+    """
+    local_spec_path = Path(__file__).parents[1] / "assets" / "openapi-mock.json"
+    FastapiClientGenerator(client_name=RUNTIME_CLIENT_NAME).from_file_path(local_spec_path)
+
+    return importlib.import_module(RUNTIME_CLIENT_NAME)
+
+
+@pytest.fixture(scope="session")
+def msgspec_client() -> ModuleType:
+    """Generates and imports a client from the local mock OpenAPI spec using the msgspec backend."""
+    local_spec_path = Path(__file__).parents[1] / "assets" / "openapi-mock.json"
+    FastapiClientGenerator(
+        client_name=MSGSPEC_CLIENT_NAME, schema_backend="msgspec"
+    ).from_file_path(local_spec_path)
+
+    return importlib.import_module(MSGSPEC_CLIENT_NAME)
+
+
+@pytest.fixture(scope="session")
+def fastapi_client() -> ModuleType:
+    """Generates and imports a client from the FastAPI instance that the tests can call in-process."""
+    FastapiClientGenerator(client_name=FASTAPI_CLIENT_NAME).from_fastapi(fastapi_instance)
+
+    return importlib.import_module(FASTAPI_CLIENT_NAME)
+
+
+@pytest.fixture(scope="session")
+def mock_api_url():
+    """Runs a local mock API for the duration of the test session and returns its base URL."""
+    server = start_mock_api()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.fixture(scope="session")
+def http2_api_url() -> str:
+    """Runs a local HTTP/2 server without TLS that answers after 0.2 seconds, returns its base URL."""
+    return f"http://127.0.0.1:{start_http2_server(delay=0.2)}"
+
+
 def pytest_unconfigure():
-    """Removes the generated client after running tests."""
-    mock_client_path = Path(__file__).parents[1] / MOCK_CLIENT_NAME
-    shutil.rmtree(mock_client_path)
+    """Removes the generated clients after running tests."""
+    for client_name in (
+        MOCK_CLIENT_NAME,
+        RUNTIME_CLIENT_NAME,
+        MSGSPEC_CLIENT_NAME,
+        FASTAPI_CLIENT_NAME,
+    ):
+        shutil.rmtree(Path(__file__).parents[1] / client_name, ignore_errors=True)
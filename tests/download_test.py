@@ -0,0 +1,60 @@
+import os
+import resource
+from pathlib import Path
+from types import ModuleType
+
+from tests.http_server import download_content
+
+DOWNLOAD_SIZE = 2 * 1024**3
+MEMORY_BUDGET = 64 * 1024**2
+
+
+def test_download_returns_iterator_of_chunks(runtime_client: ModuleType, mock_api_url: str):
+    """Test that a download without destination yields the file in chunks."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    chunks = list(client.download_report.get(size=100_000, chunk_size=4096))
+
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    assert b"".join(chunks) == download_content(0, 100_000)
+
+
+def test_download_writes_to_path(runtime_client: ModuleType, mock_api_url: str, tmp_path: Path):
+    """Test that a download is written to the given path."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    destination = tmp_path / "report.csv"
+
+    written = client.download_report.get(size=100_000, destination=destination)
+
+    assert written == 100_000
+    assert destination.read_bytes() == download_content(0, 100_000)
+
+
+def test_download_resumes_partial_file(
+    runtime_client: ModuleType, mock_api_url: str, tmp_path: Path
+):
+    """Test that a partial download only requests and appends the missing bytes."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    destination = tmp_path / "report.csv"
+    destination.write_bytes(download_content(0, 30_001))
+
+    written = client.download_report.get(size=100_000, destination=destination, resume=True)
+
+    assert written == 100_000 - 30_001
+    assert destination.read_bytes() == download_content(0, 100_000)
+    assert client.download_report.get(size=100_000, destination=destination, resume=True) == 0
+
+
+def test_download_streams_multi_gb_file_with_constant_memory(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that a multi-GB download is streamed to a file object instead of being buffered."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    peak_memory_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    with open(os.devnull, "wb") as destination:
+        written = client.download_report.get(size=DOWNLOAD_SIZE, destination=destination)
+    peak_memory_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    assert written == DOWNLOAD_SIZE
+    assert peak_memory_after - peak_memory_before < MEMORY_BUDGET
@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+import pytest
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.processors.endpoint_processor import EndpointProcessor
+from fastapi_client_generator.shared.file_manager import FileManager
+
+
+def _file_states(client_path: Path) -> Dict[str, Tuple[int, int]]:
+    return {
+        str(path.relative_to(client_path)): (path.stat().st_ino, path.stat().st_mtime_ns)
+        for path in client_path.rglob("*.py")
+    }
+
+
+def test_unchanged_regeneration_writes_no_files(
+    local_openapi_spec_path: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+):
+    """Test that regenerating an unchanged spec keeps every file and the files of the user."""
+    monkeypatch.chdir(tmp_path)
+    generator = FastapiClientGenerator(client_name="staged_client")
+    client_path = tmp_path / "staged_client"
+
+    generator.from_file_path(local_openapi_spec_path)
+    base_schema_path = client_path / "schemas" / "base_schema.py"
+    base_schema_path.write_text(base_schema_path.read_text() + "\n# Customised\n")
+    (client_path / "notes.txt").write_text("Kept between generations")
+    before = _file_states(client_path)
+    capsys.readouterr()
+
+    generator.from_file_path(local_openapi_spec_path)
+
+    assert "0 files written, " in capsys.readouterr().out
+    assert _file_states(client_path) == before
+    assert base_schema_path.read_text().endswith("# Customised\n")
+    assert (client_path / "notes.txt").read_text() == "Kept between generations"
+    assert [path.name for path in tmp_path.iterdir()] == ["staged_client"]
+
+
+def test_failed_generation_keeps_client_folder(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a failing generation leaves the client folder untouched and removes the staging."""
+    monkeypatch.chdir(tmp_path)
+    generator = FastapiClientGenerator(client_name="staged_client")
+    client_path = tmp_path / "staged_client"
+    generator.from_file_path(local_openapi_spec_path)
+    before = _file_states(client_path)
+
+    def fail(self: EndpointProcessor) -> None:
+        raise RuntimeError("Generation failed")
+
+    monkeypatch.setattr(EndpointProcessor, "run", fail)
+
+    with pytest.raises(RuntimeError):
+        generator.from_file_path(local_openapi_spec_path)
+
+    assert _file_states(client_path) == before
+    assert [path.name for path in tmp_path.iterdir()] == ["staged_client"]
+
+
+def test_endpoint_files_are_streamed(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that endpoint files are written chunk by chunk instead of as one rendered string."""
+    monkeypatch.chdir(tmp_path)
+    stream_python = FileManager.stream_python
+    chunk_counts: Dict[str, int] = {}
+
+    def count_chunks(self: FileManager, file_path: Path, chunks: Iterable[str], **kwargs) -> None:
+        chunks = list(chunks)
+        chunk_counts[file_path.name] = len(chunks)
+        stream_python(self, file_path, iter(chunks), **kwargs)
+
+    monkeypatch.setattr(FileManager, "stream_python", count_chunks)
+    FastapiClientGenerator(client_name="streamed_client").from_file_path(local_openapi_spec_path)
+    endpoint_files = (tmp_path / "streamed_client" / "endpoints").glob("*.py")
+
+    assert sorted(chunk_counts) == sorted(path.name for path in endpoint_files)
+    assert min(chunk_counts.values()) > 1
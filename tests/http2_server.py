@@ -0,0 +1,83 @@
+import asyncio
+import json
+from threading import Thread
+from typing import Dict, List, Optional
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import DataReceived, RequestReceived, StreamEnded
+
+
+class Http2Protocol(asyncio.Protocol):
+    """
+    Minimal HTTP/2 server without TLS, used to call generated clients over multiplexed streams.
+
+    Every request is answered after `delay` seconds with an item whose `name` describes the request,
+    so concurrent requests are in flight on the same connection at the same time.
+    """
+
+    delay = 0.0
+    opened_connections = 0
+    max_in_flight = 0
+    in_flight = 0
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        type(self).opened_connections += 1
+        self._transport = transport
+        self._connection = H2Connection(H2Configuration(client_side=False))
+        self._requests: Dict[int, Dict] = {}
+        self._connection.initiate_connection()
+        transport.write(self._connection.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self._connection.receive_data(data):
+            if isinstance(event, RequestReceived):
+                headers = {name.decode(): value.decode() for name, value in event.headers}
+                self._requests[event.stream_id] = {"headers": headers, "body": b""}
+            elif isinstance(event, DataReceived):
+                self._requests[event.stream_id]["body"] += event.data
+                self._connection.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+
+        self._transport.write(self._connection.data_to_send())
+
+    async def _respond(self, stream_id: int) -> None:
+        request = self._requests.pop(stream_id)
+        type(self).in_flight += 1
+        type(self).max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        type(self).in_flight -= 1
+
+        headers = request["headers"]
+        item_id = headers[":path"].rsplit("/", 1)[-1]
+        name = f"{headers[':method']} {headers[':path']} {len(request['body'])}"
+        body = json.dumps({"id": item_id, "name": name}).encode()
+
+        self._connection.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(body))),
+            ],
+        )
+        self._connection.send_data(stream_id, body, end_stream=True)
+        self._transport.write(self._connection.data_to_send())
+
+
+def start_http2_server(delay: float = 0.0) -> int:
+    """Runs the HTTP/2 server in a background thread and returns its port."""
+    loop = asyncio.new_event_loop()
+    ports: List[Optional[int]] = []
+    Http2Protocol.delay = delay
+
+    async def serve() -> None:
+        server = await loop.create_server(Http2Protocol, "127.0.0.1", 0)
+        ports.append(server.sockets[0].getsockname()[1])
+
+    loop.run_until_complete(serve())
+    Thread(target=loop.run_forever, daemon=True).start()
+    return ports[0]
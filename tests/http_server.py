@@ -0,0 +1,236 @@
+import hashlib
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_PATTERN = b"0123456789" * (CHUNK_SIZE // 10 + 2)
+PAGINATED_ITEMS = [{"id": f"item_{index}", "name": f"Item {index}"} for index in range(120)]
+
+
+def download_content(start: int, end: int) -> bytes:
+    """Returns the bytes between `start` and `end` of the deterministic download content."""
+    return (DOWNLOAD_PATTERN * ((end - start) // len(DOWNLOAD_PATTERN) + 2))[
+        start % 10 : start % 10 + end - start
+    ]
+
+
+class MockApiHandler(BaseHTTPRequestHandler):
+    """
+    Minimal HTTP handler that is used to call generated clients against.
+
+    Request bodies are consumed in chunks and only counted, so uploads of any size can be received
+    without buffering them in memory.
+    """
+
+    protocol_version = "HTTP/1.1"
+    received_paths: List[str] = []
+    throttled_responses = 0
+    in_flight = 0
+    max_in_flight = 0
+    opened_connections = 0
+    api_spec: Dict = {"openapi": "3.1.0", "paths": {}}
+    api_spec_statuses: List[int] = []
+    api_spec_errors = 0
+    _lock = Lock()
+
+    def setup(self):
+        """Counts the accepted connections, a handler is created for every connection."""
+        super().setup()
+        with self._lock:
+            type(self).opened_connections += 1
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.received_paths.append(self.path)
+
+        if url.path.startswith("/download/"):
+            return self._respond_download(int(query["size"]))
+
+        if url.path.startswith("/paginated/"):
+            return self._respond_page(url.path, query)
+
+        if url.path == "/throttled":
+            return self._respond_throttled(float(query.get("delay", 0)))
+
+        if url.path == "/openapi.json":
+            return self._respond_api_spec()
+
+        if url.path == "/cookies":
+            cookie = {"cookie": self.headers.get("Cookie")}
+            return self._respond_json(cookie, headers={"Set-Cookie": "session=secret; Path=/"})
+
+        self._respond_json(self._request_info())
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_PUT(self):
+        self._respond_json({"received": self._consume_body(), **self._request_info()})
+
+    def do_POST(self):
+        if self.path == "/items":
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            return self._respond_json({"id": "item_1", **json.loads(body)}, status=201)
+
+        received = self._consume_body()
+
+        if self._take_throttled():
+            return self._respond_json({"detail": "Too many requests"}, 429, {"Retry-After": "0.2"})
+
+        self._respond_json({"received": received, **self._request_info()})
+
+    def log_message(self, format, *args):
+        """Silences the request logging of the base handler."""
+
+    def _request_info(self) -> Dict:
+        return {"path": self.path, "content_type": self.headers.get("Content-Type")}
+
+    def _consume_body(self) -> int:
+        """Reads the request body in chunks and returns the number of received bytes."""
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            return self._consume_chunked_body()
+
+        remaining = int(self.headers.get("Content-Length", 0))
+        received = 0
+
+        while remaining:
+            chunk = self.rfile.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            received += len(chunk)
+            remaining -= len(chunk)
+
+        return received
+
+    def _consume_chunked_body(self) -> int:
+        received = 0
+
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                self.rfile.readline()
+                return received
+
+            while size:
+                chunk = self.rfile.read(min(CHUNK_SIZE, size))
+                received += len(chunk)
+                size -= len(chunk)
+
+            self.rfile.readline()
+
+    def _respond_download(self, size: int) -> None:
+        """Streams `size` bytes of download content, honouring `Range: bytes=<start>-` headers."""
+        range_header = self.headers.get("Range")
+        start = int(range_header.split("=")[1].split("-")[0]) if range_header else 0
+
+        if start >= size and range_header:
+            return self._respond_json({"detail": "Range not satisfiable"}, status=416)
+
+        self.send_response(206 if range_header else 200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(size - start))
+        if range_header:
+            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+        self.end_headers()
+
+        for position in range(start, size, CHUNK_SIZE):
+            offset = position % 10
+            self.wfile.write(DOWNLOAD_PATTERN[offset : offset + min(CHUNK_SIZE, size - position)])
+
+    def _respond_page(self, path: str, query: Dict[str, str]) -> None:
+        """Responds with a page of `PAGINATED_ITEMS` using offset, page number or cursor pagination."""
+        if path == "/paginated/offset":
+            offset, limit = int(query.get("offset", 0)), int(query.get("limit", 10))
+            page = PAGINATED_ITEMS[offset : offset + limit]
+            return self._respond_json({"items": page, "total": len(PAGINATED_ITEMS)})
+
+        if path == "/paginated/pages":
+            size = int(query.get("page_size", 20))
+            start = (int(query.get("page", 1)) - 1) * size
+            return self._respond_json(PAGINATED_ITEMS[start : start + size])
+
+        if path == "/paginated/zero-based-pages":
+            size = int(query.get("page_size", 20))
+            start = int(query.get("page", 0)) * size
+            return self._respond_json(PAGINATED_ITEMS[start : start + size])
+
+        start, limit = int(query.get("cursor", 0)), int(query.get("limit", 10))
+        next_cursor = str(start + limit) if start + limit < len(PAGINATED_ITEMS) else None
+        self._respond_json(
+            {"data": PAGINATED_ITEMS[start : start + limit], "next_cursor": next_cursor}
+        )
+
+    def _respond_throttled(self, delay: float) -> None:
+        """Answers `429` while `throttled_responses` is positive and tracks concurrent requests."""
+        with self._lock:
+            cls = type(self)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+
+        throttled = self._take_throttled()
+        time.sleep(delay)
+
+        with self._lock:
+            type(self).in_flight -= 1
+
+        if throttled:
+            return self._respond_json({"detail": "Too many requests"}, 429, {"Retry-After": "0.2"})
+
+        self._respond_json(self._request_info())
+
+    def _take_throttled(self) -> bool:
+        """Counts down `throttled_responses`, returns True while it was positive."""
+        with self._lock:
+            cls = type(self)
+            throttled = cls.throttled_responses > 0
+            cls.throttled_responses -= int(throttled)
+
+        return throttled
+
+    def _respond_api_spec(self) -> None:
+        """
+        Answers the current `api_spec`, or `304` when the `If-None-Match` ETag still matches.
+
+        Answers `503` while `api_spec_errors` is positive.
+        """
+        if self.api_spec_errors > 0:
+            type(self).api_spec_errors -= 1
+            self.api_spec_statuses.append(503)
+            return self._respond_json({"detail": "Service unavailable"}, 503)
+
+        etag = f'"{hashlib.sha256(json.dumps(self.api_spec).encode()).hexdigest()}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.api_spec_statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            return self.end_headers()
+
+        self.api_spec_statuses.append(200)
+        self._respond_json(self.api_spec, headers={"ETag": etag})
+
+    def _respond_json(self, data: Dict, status: int = 200, headers: Dict[str, str] = {}) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_mock_api() -> ThreadingHTTPServer:
+    """Starts the mock API on a free local port within a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockApiHandler)
+    server.daemon_threads = True
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,139 @@
+import ast
+import builtins
+import json
+import subprocess
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.builders.endpoints.endpoint_method_builder import (
+    EndpointMethodBuilder,
+)
+from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.import_planner import (
+    TYPING_IMPORT,
+    ImportPlanner,
+    plan_imports,
+)
+from fastapi_client_generator.shared.spec_ir import EndpointNode
+
+
+def _read_free_names(function_code: str) -> Set[str]:
+    """Reads the names a rendered method refers to that are neither bound within it, nor builtins."""
+    nodes = list(ast.walk(ast.parse(f"class Endpoint:\n{function_code}")))
+    arguments = [node for node in nodes if isinstance(node, ast.arguments)]
+    bound = {
+        argument.arg
+        for node in arguments
+        for argument in [*node.args, *node.kwonlyargs, node.vararg, node.kwarg]
+        if argument is not None
+    }
+    names = [node for node in nodes if isinstance(node, ast.Name)]
+    bound.update(node.id for node in names if isinstance(node.ctx, ast.Store))
+    used = {node.id for node in names if isinstance(node.ctx, ast.Load)}
+
+    return used - bound - set(dir(builtins))
+
+
+def test_import_planner_keeps_used_names_only():
+    """Test that unused names, attribute accesses and names within strings are not imported."""
+    import_block = plan_imports(
+        "demo",
+        [
+            TYPING_IMPORT,
+            "import msgspec",
+            "from demo.schemas.item_schema import ItemSchema",
+            "from demo.schemas.page_schema import PageSchema",
+        ],
+        ['def read(self) -> Optional[List[ItemSchema]]:\n    """Reads a PageSchema"""', "x.Any"],
+    )
+
+    assert import_block == (
+        "from typing import List, Optional\n\nfrom demo.schemas.item_schema import ItemSchema"
+    )
+
+
+def test_import_planner_sorts_sections_like_isort():
+    """Test that sections, modules and members are ordered the way Ruff's isort rules do."""
+    import_planner = ImportPlanner("demo")
+    import_planner.add(
+        "from demo.schemas.item10_schema import Item10Schema",
+        "from demo.schemas.item2_schema import Item2Schema",
+        "from demo.utils.download import write_response, DownloadTarget, CHUNK_SIZE",
+        "from pydantic import Field",
+        "import msgspec",
+    )
+    import_planner.require("from __future__ import annotations")
+    import_planner.use(
+        "Item10Schema | Item2Schema",
+        "msgspec.Struct",
+        "Field(default=CHUNK_SIZE)",
+        "write_response(DownloadTarget)",
+    )
+
+    assert import_planner.create_import_block().split("\n") == [
+        "from __future__ import annotations",
+        "",
+        "import msgspec",
+        "from pydantic import Field",
+        "",
+        "from demo.schemas.item2_schema import Item2Schema",
+        "from demo.schemas.item10_schema import Item10Schema",
+        "from demo.utils.download import CHUNK_SIZE, DownloadTarget, write_response",
+    ]
+
+
+@pytest.mark.parametrize("schema_backend", ["pydantic", "msgspec"])
+def test_method_code_covers_the_names_of_the_method_templates(
+    local_openapi_spec_path: Path, schema_backend: str
+):
+    """Test that every name a rendered endpoint method imports is in the code it is planned from."""
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    config = Config(api_spec, client_name="demo", schema_backend=schema_backend)
+    schemas = api_spec["components"]["schemas"]
+    import_planner = ImportPlanner(config.import_base)
+
+    for path, path_data in api_spec["paths"].items():
+        for operation in EndpointNode(path, path_data, schemas).operations:
+            method = EndpointMethodBuilder(config, operation).build()
+            planned_names = set().union(
+                *(import_planner._read_names(code) for code in method["method_code"])
+            )
+            free_names = _read_free_names("".join(method["method_function"]))
+
+            assert free_names <= planned_names, f"{operation.method} {path}"
+
+
+@pytest.mark.parametrize("schema_backend", ["pydantic", "msgspec"])
+def test_generated_imports_pass_ruff_check(
+    local_openapi_spec_path: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    schema_backend: str,
+):
+    """Test that the generated imports are used and sorted without running `ruff check --fix`."""
+    monkeypatch.chdir(tmp_path)
+    FastapiClientGenerator(
+        client_name="planned_client", schema_backend=schema_backend
+    ).from_file_path(local_openapi_spec_path)
+
+    result = subprocess.run(
+        [
+            "ruff",
+            "check",
+            "planned_client",
+            "--isolated",
+            "--no-cache",
+            "--select",
+            "F,I",
+            "--config",
+            "lint.isort.known-first-party = ['planned_client']",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stdout
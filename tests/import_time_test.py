@@ -0,0 +1,60 @@
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Importing the CLI took about 650 ms when it loaded FastAPI, Pydantic, requests and Jinja, and
+# takes about 60 ms without them. The budget leaves room for slower CI machines.
+CLI_IMPORT_BUDGET_MS = 300
+HEAVY_MODULES = ["fastapi", "pydantic", "requests", "jinja2"]
+
+LIST_MODULES_SCRIPT = """
+import json, sys
+from fastapi_client_generator.cli import cli
+
+try:
+    cli(sys.argv[1:])
+except SystemExit:
+    pass
+
+print(json.dumps(sorted(name for name in {heavy_modules} if name in sys.modules)))
+"""
+
+
+def _run_cli(*args: str, cwd: Path) -> list:
+    """Runs the CLI in a fresh interpreter and returns the heavy modules it imported."""
+    script = LIST_MODULES_SCRIPT.format(heavy_modules=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_cli_import_stays_within_budget():
+    """Test that a cold import of the CLI loads none of the heavy modules and stays within budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import fastapi_client_generator.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = re.findall(r"\|\s+(\d+) \|\s+([\w.]+)$", result.stderr, re.MULTILINE)
+    cumulative_us = {name: int(microseconds) for microseconds, name in imported}
+    cli_import_ms = cumulative_us.pop("fastapi_client_generator.cli") / 1000
+    slowest = sorted(cumulative_us.items(), key=lambda item: -item[1])[:8]
+
+    assert not [name for name in HEAVY_MODULES if name in cumulative_us]
+    assert cli_import_ms < CLI_IMPORT_BUDGET_MS, "\n".join(
+        [f"CLI import took {cli_import_ms:.1f} ms, slowest imports (cumulative ms):"]
+        + [f"{name}: {microseconds / 1000:.1f}" for name, microseconds in slowest]
+    )
+
+
+def test_cli_loads_modules_on_demand(local_openapi_spec_path: Path, tmp_path: Path):
+    """Test that `--help` loads no heavy modules and generating from a file only loads Jinja."""
+    assert _run_cli("--help", cwd=tmp_path) == []
+    assert _run_cli(
+        "from-file", "-c", "startup_client", "-f", str(local_openapi_spec_path), cwd=tmp_path
+    ) == ["jinja2"]
+    assert (tmp_path / "startup_client" / "client.py").exists()
@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fastapi_client_generator.cli import cli
+from fastapi_client_generator.shared.operation_filter import OperationFilter
+
+runner = CliRunner()
+
+
+def _operation(operation_id: str, tag: str, schema_ref: str) -> dict:
+    return {
+        "operationId": operation_id,
+        "tags": [tag],
+        "responses": {
+            "200": {
+                "description": "OK",
+                "content": {"application/json": {"schema": {"$ref": schema_ref}}},
+            }
+        },
+    }
+
+
+@pytest.fixture
+def api_spec() -> dict:
+    """A spec with operations in several tags that reach schemas through other components."""
+    return {
+        "openapi": "3.1.0",
+        "paths": {
+            "/pets": {
+                "get": _operation("listPets", "pets", "#/components/schemas/PetList"),
+                "post": {
+                    "operationId": "createPet",
+                    "tags": ["pets"],
+                    "requestBody": {"$ref": "#/components/requestBodies/PetBody"},
+                    "responses": {"201": {"description": "Created"}},
+                },
+            },
+            "/pets/{pet_id}": {
+                "delete": {
+                    "operationId": "deletePet",
+                    "tags": ["pets", "admin"],
+                    "parameters": [{"$ref": "#/components/parameters/PetId"}],
+                    "responses": {"204": {"description": "Deleted"}},
+                }
+            },
+            "/store/orders": {
+                "get": _operation("listOrders", "store", "#/components/schemas/Order"),
+            },
+        },
+        "components": {
+            "parameters": {
+                "PetId": {
+                    "name": "pet_id",
+                    "in": "path",
+                    "schema": {"$ref": "#/components/schemas/PetId"},
+                }
+            },
+            "requestBodies": {
+                "PetBody": {
+                    "content": {
+                        "application/json": {"schema": {"$ref": "#/components/schemas/Pet"}}
+                    }
+                }
+            },
+            "schemas": {
+                "PetId": {"type": "string"},
+                "PetList": {"type": "array", "items": {"$ref": "#/components/schemas/Pet"}},
+                "Pet": {
+                    "oneOf": [{"$ref": "#/components/schemas/Cat"}],
+                    "discriminator": {
+                        "propertyName": "kind",
+                        "mapping": {"dog": "#/components/schemas/Dog"},
+                    },
+                },
+                "Cat": {"type": "object", "properties": {"kind": {"const": "cat"}}},
+                "Dog": {"type": "object", "properties": {"kind": {"const": "dog"}}},
+                "Order": {
+                    "type": "object",
+                    "properties": {"pet": {"$ref": "#/components/schemas/Pet"}},
+                },
+                "Unused": {"type": "object"},
+            },
+        },
+    }
+
+
+def _selection(api_spec: dict, operation_filter: OperationFilter) -> tuple:
+    filtered_spec = operation_filter.apply(api_spec)
+    operations = {
+        operation["operationId"]
+        for path_item in filtered_spec["paths"].values()
+        for operation in path_item.values()
+    }
+    return operations, set(filtered_spec["components"]["schemas"])
+
+
+def test_filters_select_operations(api_spec: dict):
+    """Test that operations are selected by tag, path glob and operationId, minus the excludes."""
+    by_tag = OperationFilter(include_tags=["pets"], exclude_tags=["admin"])
+    by_path = OperationFilter(include_paths=["/store/*", "/pets/{pet_id}"])
+    by_operation_id = OperationFilter(include_operation_ids=["list*"], exclude_paths=["/store/*"])
+
+    assert _selection(api_spec, by_tag)[0] == {"listPets", "createPet"}
+    assert _selection(api_spec, by_path)[0] == {"listOrders", "deletePet"}
+    assert _selection(api_spec, by_operation_id)[0] == {"listPets"}
+    assert OperationFilter().apply(api_spec) is api_spec
+
+
+def test_only_reachable_schemas_are_kept(api_spec: dict):
+    """Test that schemas are reached through components, nested schemas and discriminators."""
+    assert _selection(api_spec, OperationFilter(include_operation_ids=["createPet"]))[1] == {
+        "Pet",
+        "Cat",
+        "Dog",
+    }
+    assert _selection(api_spec, OperationFilter(include_operation_ids=["deletePet"]))[1] == {
+        "PetId"
+    }
+    assert _selection(api_spec, OperationFilter(exclude_tags=["pets"]))[1] == {
+        "Order",
+        "Pet",
+        "Cat",
+        "Dog",
+    }
+
+
+def test_generate_selected_operations(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the CLI generates the endpoints and schemas of the selected paths only."""
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        cli,
+        [
+            "from-file",
+            "--client-name",
+            "filtered_client",
+            "--file-path",
+            str(local_openapi_spec_path),
+            "--include-path",
+            "/items*",
+            "--exclude-path",
+            "/items/{item_id}",
+        ],
+    )
+    client_path = tmp_path / "filtered_client"
+
+    assert result.exit_code == 0, result.stdout
+    assert "Selecting 2 of" in result.stdout
+    assert sorted(path.name for path in (client_path / "endpoints").glob("*_endpoint.py")) == [
+        "items_endpoint.py"
+    ]
+    assert sorted(path.name for path in (client_path / "schemas").glob("*_schema.py")) == [
+        "base_schema.py",
+        "item_create_schema.py",
+        "item_list_response_schema.py",
+        "item_schema.py",
+    ]
@@ -0,0 +1,98 @@
+import base64
+import csv
+import hashlib
+import importlib
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.cli import cli
+
+runner = CliRunner()
+
+
+def test_to_memory_writes_no_client_folder(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that an in-memory client is formatted like a client folder, without writing one."""
+    monkeypatch.chdir(tmp_path)
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+
+    files = FastapiClientGenerator(client_name="memory_client").to_memory(api_spec)
+
+    assert list(tmp_path.iterdir()) == []
+    assert "memory_client/api-spec.json" not in files
+    assert "memory_client/schemas/base_schema.py" in files
+    assert (
+        "from memory_client.utils.request_base import RequestBase"
+        in files["memory_client/client.py"]
+    )
+    assert (
+        "from typing import Optional, List, Any, Literal"
+        not in (files["memory_client/schemas/item_schema.py"])
+    )
+
+
+def test_package_writes_installable_wheel(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the wheel has a valid record and bytecode that is used as is when imported."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ruff.toml").write_text('target-version = "py38"\n')
+    args = ["package", "-c", "wheel_client", "-f", str(local_openapi_spec_path)]
+
+    result = runner.invoke(cli, [*args, "--wheel-dir", "dist", "--version", "1.2.0"])
+
+    assert result.exit_code == 0, result.stdout
+    assert not (tmp_path / "wheel_client").exists()
+
+    site_path = tmp_path / "site"
+    with zipfile.ZipFile(tmp_path / "dist" / "wheel_client-1.2.0-py3-none-any.whl") as wheel:
+        wheel.extractall(site_path)
+
+    record_path = site_path / "wheel_client-1.2.0.dist-info" / "RECORD"
+    for file_path, digest, size in csv.reader(record_path.read_text().splitlines()):
+        if digest:
+            data = (site_path / file_path).read_bytes()
+            expected = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+            assert (digest, int(size)) == (f"sha256={expected.decode()}", len(data))
+
+    module_path = site_path / "wheel_client" / "schemas" / "item_schema.py"
+    pyc_path = Path(importlib.util.cache_from_source(str(module_path)))
+    pyc = pyc_path.read_bytes()
+    monkeypatch.syspath_prepend(str(site_path))
+
+    assert importlib.import_module("wheel_client.schemas.item_schema").ItemSchema
+    assert pyc_path.read_bytes() == pyc
+
+    result = runner.invoke(cli, [*args, "--zip", "wheel_client.zip"])
+
+    assert result.exit_code == 0, result.stdout
+    with zipfile.ZipFile(tmp_path / "wheel_client.zip") as archive:
+        assert "wheel_client/schemas/item_schema.py" in archive.namelist()
+        assert not [name for name in archive.namelist() if name.endswith(".pyc")]
+
+
+def test_package_applies_operation_filters(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the package command takes the same operation filters as the other commands."""
+    monkeypatch.chdir(tmp_path)
+    args = ["package", "-c", "filtered_client", "-f", str(local_openapi_spec_path)]
+
+    result = runner.invoke(
+        cli, [*args, "--include-path", "/items*", "--exclude-tag", "admin", "--zip", "client.zip"]
+    )
+
+    assert result.exit_code == 0, result.stdout
+    with zipfile.ZipFile(tmp_path / "client.zip") as archive:
+        sources = "".join(
+            archive.read(name).decode() for name in archive.namelist() if name.endswith(".py")
+        )
+
+    assert "/items" in sources
+    assert "/paginated/offset" not in sources
@@ -0,0 +1,71 @@
+import time
+from types import ModuleType
+from typing import List
+
+from tests.http_server import PAGINATED_ITEMS, MockApiHandler
+
+
+def _wait_for_paths(prefix: str, count: int, timeout: float = 2.0) -> List[str]:
+    """Waits until the mock API received `count` requests for paths starting with `prefix`."""
+    deadline = time.monotonic() + timeout
+
+    while True:
+        paths = [path for path in MockApiHandler.received_paths if path.startswith(prefix)]
+        if len(paths) >= count or time.monotonic() > deadline:
+            return paths
+        time.sleep(0.01)
+
+
+def test_iter_all_offset_pagination(runtime_client: ModuleType, mock_api_url: str):
+    """Test that `iter_all` follows `limit`/`offset` pages using the maximum page size."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    MockApiHandler.received_paths.clear()
+
+    items = list(client.paginated_offset.iter_all(category="books"))
+
+    assert [item.id for item in items] == [item["id"] for item in PAGINATED_ITEMS]
+    paths = _wait_for_paths("/paginated/offset", 5)
+    assert len(paths) == 5
+    assert all("limit=25" in path and "category=books" in path for path in paths)
+
+
+def test_iter_all_page_pagination(runtime_client: ModuleType, mock_api_url: str):
+    """Test that `iter_all` follows numbered pages until a page is not full."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    items = list(client.paginated_pages.iter_all(page_size=50))
+
+    assert [item.id for item in items] == [item["id"] for item in PAGINATED_ITEMS]
+
+
+def test_iter_all_zero_based_page_pagination(runtime_client: ModuleType, mock_api_url: str):
+    """Test that `iter_all` starts at a declared first page of `0` instead of skipping it."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    MockApiHandler.received_paths.clear()
+
+    items = list(client.paginated_zero_based_pages.iter_all(page_size=50, prefetch=False))
+
+    assert [item.id for item in items] == [item["id"] for item in PAGINATED_ITEMS]
+    assert MockApiHandler.received_paths[0] == "/paginated/zero-based-pages?page=0&page_size=50"
+
+
+def test_iter_all_cursor_pagination(runtime_client: ModuleType, mock_api_url: str):
+    """Test that `iter_all` follows the next cursor until it is empty."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    items = list(client.paginated_cursor.iter_all(prefetch=False))
+
+    assert items == PAGINATED_ITEMS
+
+
+def test_iter_all_prefetches_next_page(runtime_client: ModuleType, mock_api_url: str):
+    """Test that the next page is requested while the current page is still consumed."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    MockApiHandler.received_paths.clear()
+    next(client.paginated_offset.iter_all(prefetch=False))
+    assert len(_wait_for_paths("/paginated/offset", 2, timeout=0.2)) == 1
+
+    MockApiHandler.received_paths.clear()
+    next(client.paginated_offset.iter_all())
+    assert len(_wait_for_paths("/paginated/offset", 2)) == 2
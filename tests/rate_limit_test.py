@@ -0,0 +1,164 @@
+import asyncio
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+
+from tests.http_server import MockApiHandler
+
+
+def test_rate_limiter_limits_requests_per_second(runtime_client: ModuleType, mock_api_url: str):
+    """Test that requests are spread out according to the configured rate."""
+    rate_limiter = runtime_client.RateLimiter(requests_per_second=20, burst=1)
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=rate_limiter
+    )
+
+    started_at = time.monotonic()
+    for _ in range(6):
+        client.throttled.get()
+
+    assert time.monotonic() - started_at >= 5 / 20
+
+
+def test_rate_limiter_limits_requests_in_flight(runtime_client: ModuleType, mock_api_url: str):
+    """Test that concurrent threads never exceed the maximum number of requests in flight."""
+    rate_limiter = runtime_client.RateLimiter(max_in_flight=2)
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=rate_limiter
+    )
+    MockApiHandler.max_in_flight = 0
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: client.throttled.get(delay=0.05), range(8)))
+
+    assert MockApiHandler.max_in_flight == 2
+
+
+def test_rate_limiter_retries_after_too_many_requests(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that a `429` pauses for `Retry-After`, lowers the rate and retries the request."""
+    rate_limiter = runtime_client.RateLimiter(requests_per_second=100)
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=rate_limiter
+    )
+    MockApiHandler.throttled_responses = 2
+
+    started_at = time.monotonic()
+    response = client.throttled.get()
+
+    assert response["path"] == "/throttled"
+    assert time.monotonic() - started_at >= 0.4
+    assert rate_limiter._bucket.rate < 100
+
+
+def test_rate_limiter_retries_multipart_upload(
+    runtime_client: ModuleType, mock_api_url: str, tmp_path: Path
+):
+    """Test that an upload answered with `429` is sent again from the start of its files."""
+    file_path = tmp_path / "report.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=runtime_client.RateLimiter()
+    )
+    request_body = {"file": file_path, "description": "Report"}
+    expected = client.upload_multipart.post(
+        request_body={**request_body, "attachment": io.BytesIO(b"abcd")}
+    )["received"]
+    MockApiHandler.throttled_responses = 1
+
+    response = client.upload_multipart.post(
+        request_body={**request_body, "attachment": io.BytesIO(b"abcd")}
+    )
+
+    assert response["received"] == expected
+    assert MockApiHandler.throttled_responses == 0
+
+
+def test_rate_limiter_does_not_retry_unseekable_upload(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that an upload of a file object that can only be read once is not sent again."""
+    read_end, write_end = os.pipe()
+    os.write(write_end, b"abcd")
+    os.close(write_end)
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=runtime_client.RateLimiter()
+    )
+    MockApiHandler.throttled_responses = 1
+
+    with open(read_end, "rb") as pipe:
+        try:
+            client.upload_multipart.post(request_body={"file": pipe})
+            raise AssertionError("Expected an HttpExceptionError")
+        except runtime_client.HttpExceptionError as error:
+            assert error.status_code == 429
+        finally:
+            MockApiHandler.throttled_responses = 0
+
+
+def test_rate_limiter_raises_when_retries_are_exhausted(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that the `429` is raised once the retries of the limiter are used up."""
+    rate_limiter = runtime_client.RateLimiter(max_retries=1)
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, rate_limiter=rate_limiter
+    )
+    MockApiHandler.throttled_responses = 3
+
+    try:
+        client.throttled.get()
+        raise AssertionError("Expected an HttpExceptionError")
+    except runtime_client.HttpExceptionError as error:
+        assert error.status_code == 429
+    finally:
+        MockApiHandler.throttled_responses = 0
+
+
+def test_endpoint_rate_limiter_only_applies_to_endpoint(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that a limiter for an endpoint class does not slow down other endpoints."""
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url,
+        default_headers={},
+        endpoint_rate_limiters={
+            "throttled": runtime_client.RateLimiter(requests_per_second=10, burst=1)
+        },
+    )
+
+    started_at = time.monotonic()
+    for _ in range(3):
+        client.paginated_cursor.get()
+    assert time.monotonic() - started_at < 0.2
+
+    for _ in range(3):
+        client.throttled.get()
+    assert time.monotonic() - started_at >= 0.2
+
+
+def test_rate_limiter_is_async_safe(runtime_client: ModuleType):
+    """Test that coroutines sharing a limiter respect the maximum in flight and the rate."""
+    rate_limiter = runtime_client.RateLimiter(requests_per_second=50, burst=1, max_in_flight=2)
+    in_flight, max_in_flight = 0, 0
+
+    async def call() -> None:
+        nonlocal in_flight, max_in_flight
+        async with rate_limiter.limit_async():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(call() for _ in range(10)))
+
+    started_at = time.monotonic()
+    asyncio.run(main())
+
+    assert max_in_flight == 2
+    assert time.monotonic() - started_at >= 9 / 50
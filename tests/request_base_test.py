@@ -0,0 +1,89 @@
+import json
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import pytest
+
+from tests.http_server import MockApiHandler
+
+PROXY_VARIABLES = ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY", "no_proxy", "NO_PROXY")
+
+
+def test_none_query_parameters_are_dropped(runtime_client: ModuleType, mock_api_url: str):
+    """Test that optional query parameters that are not given are left out of the URL."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    MockApiHandler.received_paths.clear()
+
+    client.paginated_offset.get(limit=2)
+    client.paginated_offset.get(category="books", limit=2, offset=4)
+
+    assert MockApiHandler.received_paths == [
+        "/paginated/offset?limit=2",
+        "/paginated/offset?category=books&limit=2&offset=4",
+    ]
+
+
+def test_base_url_with_trailing_slash(runtime_client: ModuleType, mock_api_url: str):
+    """Test that the base URL is normalised once, so paths are joined with a single slash."""
+    client = runtime_client.ClientAlpha(base_url=f"{mock_api_url}/", default_headers={})
+    MockApiHandler.received_paths.clear()
+
+    client.paginated_offset.get(limit=2)
+    client._request_base.get("items").close()
+
+    assert MockApiHandler.received_paths == ["/paginated/offset?limit=2", "/items"]
+
+
+def test_call_headers_take_precedence(runtime_client: ModuleType):
+    """Test that call headers override the default headers and the content type of the body."""
+    received: List[Tuple[str, str]] = []
+
+    def app(environ: Dict, start_response: Callable) -> Iterable[bytes]:
+        received.append((environ["CONTENT_TYPE"], environ["HTTP_X_TOKEN"]))
+        start_response("201 Created", [("Content-Type", "application/json")])
+        return [json.dumps({"id": "item_1", "name": "Created"}).encode()]
+
+    default_headers = {"X-Token": "default"}
+    client = runtime_client.ClientAlpha(
+        base_url="http://testserver",
+        default_headers=default_headers,
+        transport=runtime_client.WSGITransport(app),
+    )
+    request_body = runtime_client.schemas.item_create_schema.ItemCreateSchema(name="Created")
+
+    client.items.post(request_body=request_body)
+    client.items.post(
+        request_body=request_body,
+        headers={"X-Token": "call", "Content-Type": "application/merge-patch+json"},
+    )
+
+    assert received == [("application/json", "default"), ("application/merge-patch+json", "call")]
+    assert default_headers == {"X-Token": "default"}
+
+
+def test_cookies_of_responses_are_not_stored(runtime_client: ModuleType, mock_api_url: str):
+    """Test that a cookie set by one response is not sent along with the next request."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    request_base = client._request_base
+
+    first = request_base.get("/cookies").json()
+    second = request_base.get("/cookies").json()
+
+    assert first == second == {"cookie": None}
+    assert request_base.get("/cookies", headers={"Cookie": "own=1"}).json() == {"cookie": "own=1"}
+
+
+def test_environment_proxy_is_read_once(
+    runtime_client: ModuleType, mock_api_url: str, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that the proxy of the environment is read when the client is created, not per call."""
+    for variable in PROXY_VARIABLES:
+        monkeypatch.delenv(variable, raising=False)
+
+    monkeypatch.setenv("http_proxy", mock_api_url)
+    client = runtime_client.ClientAlpha(base_url="http://api.invalid", default_headers={})
+    monkeypatch.delenv("http_proxy")
+    MockApiHandler.received_paths.clear()
+
+    assert len(client.paginated_offset.get(limit=2).items) == 2
+    assert MockApiHandler.received_paths == ["http://api.invalid/paginated/offset?limit=2"]
@@ -0,0 +1,63 @@
+from types import ModuleType
+
+import msgspec
+import pytest
+
+
+def test_msgspec_schemas_are_slot_based_structs(msgspec_client: ModuleType):
+    """Test that the msgspec backend generates Structs without instance dicts."""
+    from msgspec_client.schemas.item_schema import ItemSchema
+
+    item = ItemSchema(id="item_1", name="Item")
+
+    assert isinstance(item, msgspec.Struct)
+    assert not hasattr(item, "__dict__")
+    assert item.description is None
+
+
+def test_msgspec_schemas_keep_original_field_names(msgspec_client: ModuleType):
+    """Test that aliased and reserved field names are decoded and encoded by their JSON name."""
+    from msgspec_client.schemas.item_create_alias_schema import ItemCreateAliasSchema
+    from msgspec_client.schemas.item_reserved_keyword_schema import ItemReservedKeywordSchema
+
+    alias = msgspec.json.decode(b'{"PascalCase": "value"}', type=ItemCreateAliasSchema)
+    reserved = ItemReservedKeywordSchema(from_="value")
+
+    assert alias.pascal_case == "value"
+    assert msgspec.json.encode(reserved) == b'{"from":"value"}'
+
+
+def test_msgspec_schemas_validate_required_fields(msgspec_client: ModuleType):
+    """Test that decoding fails when a required field is missing."""
+    from msgspec_client.schemas.item_list_response_schema import ItemListResponseSchema
+
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(b'{"items": [{"id": "item_1"}]}', type=ItemListResponseSchema)
+
+
+def test_msgspec_endpoints_encode_and_decode_bodies(msgspec_client: ModuleType, mock_api_url: str):
+    """Test that endpoints encode request bodies and decode responses with msgspec."""
+    from msgspec_client.schemas.item_create_schema import ItemCreateSchema
+    from msgspec_client.schemas.item_schema import ItemSchema
+
+    client = msgspec_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    item = client.items.post(request_body=ItemCreateSchema(name="Item", description="New"))
+    items = list(client.paginated_offset.iter_all())
+
+    assert item == ItemSchema(id="item_1", name="Item", description="New")
+    assert len(items) == 120
+    assert all(isinstance(page_item, ItemSchema) for page_item in items)
+
+
+def test_msgspec_query_parameter_schemas_are_sent(msgspec_client: ModuleType, mock_api_url: str):
+    """Test that a query parameter referencing a schema is sent by its fields, without `None`."""
+    from msgspec_client.schemas.item_schema import ItemSchema
+
+    client = msgspec_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    response = client.good_path_parameters_query_parameter_as_ref.get(
+        item_id=ItemSchema(id="item_1", name="Item")
+    )
+
+    assert response["path"] == "/good-path/parameters/query_parameter_as_ref?id=item_1&name=Item"
@@ -0,0 +1,71 @@
+import importlib
+import json
+from pathlib import Path
+from types import ModuleType
+
+from fastapi_client_generator.shared.schema_duplicates import SchemaDuplicates
+from fastapi_client_generator.shared.schema_unions import SchemaUnions
+
+
+def _schema(client: ModuleType, module: str, class_name: str) -> type:
+    return getattr(importlib.import_module(f"{client.__name__}.schemas.{module}"), class_name)
+
+
+def test_duplicate_schemas_are_aliased(runtime_client: ModuleType):
+    """Test that structurally identical schemas are generated once and aliased by name."""
+    item_input = _schema(runtime_client, "item_input_schema", "ItemInputSchema")
+    item_output = _schema(runtime_client, "item_output_schema", "ItemOutputSchema")
+    item_create = _schema(runtime_client, "item_create_schema", "ItemCreateSchema")
+    body_create_item = _schema(runtime_client, "body_create_item_schema", "BodyCreateItemSchema")
+
+    assert item_output is item_input
+    assert body_create_item is item_create
+
+
+def test_schemas_referencing_duplicates_are_aliased(runtime_client: ModuleType):
+    """Test that schemas that only differ in references to duplicates are aliased as well."""
+    input_page = _schema(runtime_client, "item_input_page_schema", "ItemInputPageSchema")
+    output_page = _schema(runtime_client, "item_output_page_schema", "ItemOutputPageSchema")
+
+    page = output_page.model_validate({"items": [{"name": "a", "tags": ["b"]}]})
+
+    assert output_page is input_page
+    assert type(page.items[0]).__name__ == "ItemInputSchema"
+
+
+def test_distinct_schemas_are_kept(local_openapi_spec_path: Path):
+    """Test that schemas with different fields, or a tag of their own, are not aliased."""
+    schemas = json.loads(local_openapi_spec_path.read_text())["components"]["schemas"]
+    schemas["ItemDescribed"] = json.loads(json.dumps(schemas["ItemInput"]))
+    schemas["ItemDescribed"]["properties"]["name"]["description"] = "The name of the item."
+    schemas["Cat2"] = schemas["Cat"]
+
+    schema_duplicates = SchemaDuplicates(schemas, SchemaUnions(schemas))
+
+    assert schema_duplicates.aliases == {
+        "ItemOutput": "ItemInput",
+        "ItemOutputPage": "ItemInputPage",
+        "BodyCreateItem": "ItemCreate",
+    }
+    assert "ItemOutput" not in schema_duplicates.canonical_schemas
+    assert schema_duplicates.canonical_of("Cat2") == "Cat2"
+
+
+def test_duplicate_reference_cycles():
+    """Test that identical schemas that reference themselves, or each other, are aliased."""
+    node = {"type": "object", "properties": {"value": {"type": "string"}}}
+    schemas = {
+        name: {**node, "properties": {**node["properties"], "next": {"$ref": ref}}}
+        for name, ref in (
+            ("NodeInput", "#/components/schemas/NodeInput"),
+            ("NodeOutput", "#/components/schemas/NodeOutput"),
+            ("Ping", "#/components/schemas/Pong"),
+            ("Pong", "#/components/schemas/Ping"),
+        )
+    }
+
+    assert SchemaDuplicates(schemas).aliases == {
+        "NodeOutput": "NodeInput",
+        "Ping": "NodeInput",
+        "Pong": "NodeInput",
+    }
@@ -0,0 +1,62 @@
+import importlib
+import inspect
+import json
+from pathlib import Path
+from types import ModuleType
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from fastapi_client_generator.shared.schema_enums import SchemaEnums
+
+
+def _module(client: ModuleType, module: str) -> ModuleType:
+    return importlib.import_module(f"{client.__name__}.schemas.{module}")
+
+
+def test_large_inline_enums_are_shared(runtime_client: ModuleType):
+    """Test that fields with the same large inline enum share one definition."""
+    shared_enums = _module(runtime_client, "shared_enums")
+    address_source = inspect.getsource(_module(runtime_client, "address_schema"))
+    invoice_source = inspect.getsource(_module(runtime_client, "invoice_schema"))
+
+    assert len(shared_enums.ADDRESS_CURRENCY_ENUM_VALUES) == 60
+    assert "currency: Optional[AddressCurrencyEnum]" in address_source
+    assert "billing_currency: Optional[AddressCurrencyEnum]" in invoice_source
+    assert 'Literal["draft", "sent", "paid"]' in invoice_source
+
+
+def test_large_enums_are_validated(runtime_client: ModuleType):
+    """Test that the hashed-set validators accept the enum values only."""
+    address_schema = _module(runtime_client, "address_schema").AddressSchema
+    invoice_schema = _module(runtime_client, "invoice_schema").InvoiceSchema
+
+    address = address_schema.model_validate({"country": "C59", "currency": "X00"})
+    invoice = invoice_schema.model_validate({"shippingCountries": ["C01", "C02"]})
+
+    assert (address.country, address.currency) == ("C59", "X00")
+    assert invoice.shipping_countries == ["C01", "C02"]
+
+    with pytest.raises(ValidationError, match="one of the 60 values of CountryCodeSchema"):
+        address_schema.model_validate({"country": "NL"})
+
+
+def test_large_enums_msgspec(msgspec_client: ModuleType):
+    """Test that the msgspec backend shares large enums as a single Literal type."""
+    address_schema = _module(msgspec_client, "address_schema").AddressSchema
+
+    assert msgspec.json.decode(b'{"country": "C01"}', type=address_schema).country == "C01"
+
+    with pytest.raises(msgspec.ValidationError, match="Invalid enum value"):
+        msgspec.json.decode(b'{"country": "C01", "currency": "EUR"}', type=address_schema)
+
+
+def test_enum_threshold(local_openapi_spec_path: Path):
+    """Test that enums up to the threshold are left inline."""
+    schemas = json.loads(local_openapi_spec_path.read_text())["components"]["schemas"]
+    currency = schemas["Address"]["properties"]["currency"]
+
+    assert SchemaEnums(schemas).alias_of(currency) == "AddressCurrencyEnum"
+    assert SchemaEnums(schemas, threshold=60).alias_of(currency) is None
+    assert not SchemaEnums(schemas, threshold=60).shared_enums
@@ -0,0 +1,67 @@
+import importlib
+from types import ModuleType
+
+from fastapi_client_generator.shared.schema_graph import SchemaGraph
+
+
+def _ref(name: str) -> dict:
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def test_schema_graph_orders_components_by_dependency():
+    """Test that cycles are grouped and referenced schemas come before their dependents."""
+    schema_graph = SchemaGraph(
+        {
+            "Order": {
+                "properties": {"customer": _ref("Customer"), "lines": {"items": _ref("Line")}}
+            },
+            "Customer": {"properties": {"orders": {"type": "array", "items": _ref("Order")}}},
+            "Line": {"properties": {"product": _ref("Product")}},
+            "Product": {"properties": {"name": {"type": "string"}}},
+            "Status": {"type": "string", "enum": ["open", "closed"]},
+        }
+    )
+    components = schema_graph.components
+
+    assert ["Customer", "Order"] in components
+    assert components.index(["Product"]) < components.index(["Line"])
+    assert components.index(["Line"]) < components.index(["Customer", "Order"])
+    assert schema_graph.cycle_of("Order") == {"Order", "Customer"}
+    assert schema_graph.cycle_of("Line") == set()
+    assert not schema_graph.is_model("Status")
+
+
+def test_schema_graph_detects_self_references_and_ignores_unknown_refs():
+    """Test that a schema referencing itself forms a cycle and unknown refs are skipped."""
+    schema_graph = SchemaGraph({"Node": {"properties": {"next": _ref("Node"), "x": _ref("Gone")}}})
+
+    assert schema_graph.refs("Node") == {"Node"}
+    assert schema_graph.cycle_of("Node") == {"Node"}
+
+
+def test_schema_graph_handles_long_reference_chains():
+    """Test that long chains do not hit the recursion limit."""
+    schemas = {
+        f"S{index}": {"properties": {"next": _ref(f"S{index + 1}")}} for index in range(5000)
+    }
+    schemas["S5000"] = {"properties": {"first": _ref("S0")}}
+
+    schema_graph = SchemaGraph(schemas)
+
+    assert len(schema_graph.components) == 1
+    assert len(schema_graph.cycle_of("S42")) == 5001
+
+
+def test_generated_schemas_defer_building_and_resolve_cycles(runtime_client: ModuleType):
+    """Test that cyclic schemas import, build on first use and can be rebuilt up front."""
+    cycle_child = importlib.import_module("runtime_client.schemas.cycle_child_schema")
+    schema_graph = importlib.import_module("runtime_client.schemas.schema_graph")
+    cycle_child_schema = cycle_child.CycleChildSchema
+
+    assert not cycle_child_schema.__pydantic_complete__
+
+    schema_graph.rebuild_schemas(["CycleParentSchema"])
+    child = cycle_child_schema(parent={"name": "parent", "children": [{"siblings": []}]})
+
+    assert cycle_child_schema.__pydantic_complete__
+    assert child.parent.children[0].siblings == []
@@ -0,0 +1,130 @@
+import importlib
+import inspect
+import json
+from pathlib import Path
+from types import ModuleType
+
+import msgspec
+import pytest
+from pydantic import ValidationError
+
+from fastapi_client_generator import FastapiClientGenerator
+
+
+def _schema(client: ModuleType, module: str, class_name: str) -> type:
+    return getattr(importlib.import_module(f"{client.__name__}.schemas.{module}"), class_name)
+
+
+def test_discriminated_union_from_discriminator(runtime_client: ModuleType):
+    """Test that the `discriminator` of a union selects the member by its mapped tag."""
+    pet_owner_schema = _schema(runtime_client, "pet_owner_schema", "PetOwnerSchema")
+    cat_schema = _schema(runtime_client, "cat_schema", "CatSchema")
+
+    pet_owner = pet_owner_schema.model_validate({"pet": {"petType": "dog", "name": "Rex"}})
+
+    assert type(pet_owner.pet).__name__ == "DogSchema"
+    assert pet_owner_schema(pet=cat_schema(name="Tom")).model_dump(by_alias=True)["pet"] == {
+        "petType": "cat",
+        "name": "Tom",
+        "meows": None,
+    }
+
+    with pytest.raises(ValidationError, match="union_tag_invalid"):
+        pet_owner_schema.model_validate({"pet": {"petType": "fish", "name": "Nemo"}})
+
+
+def test_discriminated_union_inferred_from_literal_tags(runtime_client: ModuleType):
+    """Test that a required property with distinct `const`/`enum` values is used as tag."""
+    drawing_schema = _schema(runtime_client, "drawing_schema", "DrawingSchema")
+    source = inspect.getsource(drawing_schema)
+
+    drawing = drawing_schema.model_validate(
+        {
+            "shapes": [{"kind": "circle", "radius": 1}, {"kind": "square", "side": 2}],
+            "highlight": None,
+        }
+    )
+
+    assert source.count("discriminator=") == 2
+    assert [type(shape).__name__ for shape in drawing.shapes] == ["CircleSchema", "SquareSchema"]
+
+    with pytest.raises(ValidationError, match="union_tag_not_found"):
+        drawing_schema.model_validate({"shapes": [{"radius": 1}]})
+
+
+def test_plain_unions(runtime_client: ModuleType):
+    """Test that unions without tag property are generated as plain Union types."""
+    one_of_schema = _schema(runtime_client, "one_of_schema_schema", "OneOfSchemaSchema")
+    any_of_schema = _schema(runtime_client, "any_of_schema_schema", "AnyOfSchemaSchema")
+
+    assert "Union[ItemSchema, ItemCreateSchema]" in inspect.getsource(one_of_schema)
+    item = any_of_schema.model_validate({"value": {"id": "1", "name": "a"}}).value
+
+    assert any_of_schema.model_validate({"value": "text"}).value == "text"
+    assert type(item).__name__ == "ItemSchema"
+
+
+def test_msgspec_tagged_unions(msgspec_client: ModuleType):
+    """Test that members of discriminated unions become tagged Structs with the msgspec backend."""
+    pet_owner_schema = _schema(msgspec_client, "pet_owner_schema", "PetOwnerSchema")
+
+    pet_owner = msgspec.json.decode(
+        b'{"pet": {"petType": "cat", "name": "Tom"}}', type=pet_owner_schema
+    )
+
+    assert type(pet_owner.pet).__name__ == "CatSchema"
+    assert msgspec.json.decode(msgspec.json.encode(pet_owner)) == {
+        "pet": {"petType": "cat", "name": "Tom"}
+    }
+
+
+def test_msgspec_tagged_union_with_several_tags(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that a member mapped by several tags gets a tagged Struct subclass for each tag."""
+    pet = {"type": "object", "required": ["petType"], "properties": {"petType": {"type": "string"}}}
+    api_spec = {
+        "openapi": "3.1.0",
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Cat": pet,
+                "Dog": pet,
+                "PetOwner": {
+                    "type": "object",
+                    "properties": {
+                        "pet": {
+                            "oneOf": [
+                                {"$ref": "#/components/schemas/Cat"},
+                                {"$ref": "#/components/schemas/Dog"},
+                            ],
+                            "discriminator": {
+                                "propertyName": "petType",
+                                "mapping": {
+                                    "cat": "#/components/schemas/Cat",
+                                    "kitten": "#/components/schemas/Cat",
+                                    "dog": "#/components/schemas/Dog",
+                                },
+                            },
+                        }
+                    },
+                },
+            }
+        },
+    }
+    spec_path = tmp_path / "openapi.json"
+    spec_path.write_text(json.dumps(api_spec))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    generator = FastapiClientGenerator(client_name="tagged_client", schema_backend="msgspec")
+    generator.from_file_path(spec_path)
+    tagged_client = importlib.import_module("tagged_client")
+    pet_owner_schema = _schema(tagged_client, "pet_owner_schema", "PetOwnerSchema")
+    cat_schema = _schema(tagged_client, "cat_schema", "CatSchema")
+
+    pets = [
+        msgspec.json.decode(f'{{"pet": {{"petType": "{tag}"}}}}', type=pet_owner_schema).pet
+        for tag in ("cat", "kitten", "dog")
+    ]
+
+    assert [type(pet).__name__ for pet in pets] == ["CatSchema", "CatSchema1", "DogSchema"]
+    assert isinstance(pets[1], cat_schema)
+    assert msgspec.json.decode(msgspec.json.encode(pets[1])) == {"petType": "kitten"}
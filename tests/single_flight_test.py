@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from types import ModuleType
+
+from tests.http_server import MockApiHandler
+
+CONCURRENT_CALLS = 8
+
+
+def _call_concurrently(function, count: int = CONCURRENT_CALLS):
+    """Calls the function from multiple threads that start at the same moment."""
+    barrier = Barrier(count)
+
+    def call(index: int):
+        barrier.wait()
+        return function(index)
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def _count_paths(prefix: str) -> int:
+    return len([path for path in MockApiHandler.received_paths if path.startswith(prefix)])
+
+
+def test_single_flight_shares_identical_requests(runtime_client: ModuleType, mock_api_url: str):
+    """Test that identical concurrent GETs share one upstream call and its parsed result."""
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, single_flight=True
+    )
+    MockApiHandler.received_paths.clear()
+
+    results = _call_concurrently(lambda _: client.throttled.get(delay=0.2))
+
+    assert _count_paths("/throttled") == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_keeps_different_requests_apart(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test that requests with different parameters or headers are not coalesced."""
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, single_flight=True
+    )
+    MockApiHandler.received_paths.clear()
+
+    _call_concurrently(
+        lambda index: client.throttled.get(
+            delay=0.2 + index % 2 / 100, headers={"X-Id": str(index % 4)}
+        )
+    )
+
+    assert _count_paths("/throttled") == 4
+
+
+def test_single_flight_is_disabled_by_default(runtime_client: ModuleType, mock_api_url: str):
+    """Test that every call is sent upstream without single-flight."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    MockApiHandler.received_paths.clear()
+
+    _call_concurrently(lambda _: client.throttled.get(delay=0.1))
+
+    assert _count_paths("/throttled") == CONCURRENT_CALLS
+
+
+def test_single_flight_shares_errors(runtime_client: ModuleType, mock_api_url: str):
+    """Test that all coalesced callers receive the error of the shared call."""
+    client = runtime_client.ClientAlpha(
+        base_url=mock_api_url, default_headers={}, single_flight=True
+    )
+    MockApiHandler.received_paths.clear()
+    MockApiHandler.throttled_responses = 1
+
+    def call(_):
+        try:
+            client.throttled.get(delay=0.2)
+        except runtime_client.HttpExceptionError as error:
+            return error.status_code
+
+    assert _call_concurrently(call) == [429] * CONCURRENT_CALLS
+    assert _count_paths("/throttled") == 1
@@ -0,0 +1,151 @@
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from socketserver import ThreadingUnixStreamServer
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List
+
+import pytest
+
+from tests.fastapi_instance import fastapi_instance
+from tests.http2_server import Http2Protocol
+
+
+@pytest.fixture
+def no_sockets(monkeypatch: pytest.MonkeyPatch):
+    """Fails every attempt to open a connection, so requests can only be handled in-process."""
+
+    def connect(*args, **kwargs):
+        raise AssertionError("A socket was opened")
+
+    monkeypatch.setattr(socket.socket, "connect", connect)
+
+
+class UnixSocketHandler(BaseHTTPRequestHandler):
+    """Answers every request with an item named after the path, keeping the connection open."""
+
+    protocol_version = "HTTP/1.1"
+    opened_connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        type(self).opened_connections += 1
+
+    def do_GET(self) -> None:
+        body = json.dumps({"id": self.path.rsplit("/", 1)[-1], "name": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def test_asgi_transport_calls_fastapi_instance(fastapi_client: ModuleType, no_sockets):
+    """Test that a client bound to a FastAPI instance calls it without opening sockets."""
+    client = fastapi_client.ClientAlpha(
+        base_url="http://testserver",
+        default_headers={},
+        transport=fastapi_client.ASGITransport(fastapi_instance),
+    )
+    request_body = fastapi_client.schemas.item_create_schema.ItemCreateSchema(name="Created")
+
+    assert client.items.get().total == 1
+    assert client.items.post(request_body=request_body).name == "Created"
+    assert client.items_item_id.get(item_id="item 7").id == "item 7"
+    assert client.warmup(connections=2)["connections"] == 0
+
+
+def test_wsgi_transport_passes_request(fastapi_client: ModuleType, no_sockets):
+    """Test that the method, path, query, headers and body reach a WSGI application."""
+    received: List[Dict] = []
+
+    def app(environ: Dict, start_response: Callable) -> Iterable[bytes]:
+        received.append(
+            {
+                "method": environ["REQUEST_METHOD"],
+                "path": environ["PATH_INFO"],
+                "query": environ["QUERY_STRING"],
+                "token": environ.get("HTTP_X_TOKEN"),
+                "body": environ["wsgi.input"].read(int(environ["CONTENT_LENGTH"])),
+            }
+        )
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps({"id": "item_1", "name": "WSGI"}).encode()]
+
+    client = fastapi_client.ClientAlpha(
+        base_url="http://testserver",
+        default_headers={"X-Token": "secret"},
+        transport=fastapi_client.WSGITransport(app),
+    )
+
+    request_body = fastapi_client.schemas.item_create_schema.ItemCreateSchema(name="WSGI")
+
+    assert client.items.post(request_body=request_body).name == "WSGI"
+    assert client.items_item_id.get(item_id="item_1").name == "WSGI"
+    assert received == [
+        {
+            "method": "POST",
+            "path": "/items",
+            "query": "",
+            "token": "secret",
+            "body": json.dumps({"name": "WSGI", "description": None}).encode(),
+        },
+        {"method": "GET", "path": "/items/item_1", "query": "", "token": "secret", "body": b""},
+    ]
+
+
+def test_http2_transport_multiplexes_concurrent_requests(
+    fastapi_client: ModuleType, http2_api_url: str
+):
+    """Test that concurrent requests of many threads share one HTTP/2 connection."""
+    client = fastapi_client.ClientAlpha(
+        base_url=http2_api_url,
+        default_headers={},
+        transport=fastapi_client.HTTP2Transport(max_connections=1, http1=False),
+    )
+    request_body = fastapi_client.schemas.item_create_schema.ItemCreateSchema(name="HTTP/2")
+    Http2Protocol.opened_connections = 0
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        items = list(
+            executor.map(lambda index: client.items_item_id.get(item_id=f"item_{index}"), range(20))
+        )
+
+    assert [item.id for item in items] == [f"item_{index}" for index in range(20)]
+    assert Http2Protocol.opened_connections == 1
+    assert Http2Protocol.max_in_flight == 20
+    body_size = len(json.dumps(request_body.model_dump()))
+
+    assert client.items.post(request_body=request_body).name == f"POST /items {body_size}"
+
+
+def test_unix_socket_base_url_reuses_connections(fastapi_client: ModuleType, tmp_path: Path):
+    """Test that a Unix domain socket base URL is called over pooled keep-alive connections."""
+    socket_path = str(tmp_path / "api.sock")
+    server = ThreadingUnixStreamServer(socket_path, UnixSocketHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = fastapi_client.ClientAlpha(
+        base_url=fastapi_client.unix_socket_url(socket_path, "/api"), default_headers={}
+    )
+
+    try:
+        assert client.warmup(connections=2)["connections"] == 2
+        items = [client.items_item_id.get(item_id=f"item_{index}") for index in range(5)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [item.name for item in items] == [f"/api/items/item_{index}" for index in range(5)]
+    assert UnixSocketHandler.opened_connections == 2
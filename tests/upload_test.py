@@ -0,0 +1,88 @@
+import importlib
+import io
+import resource
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+UPLOAD_SIZE = 2 * 1024**3
+MEMORY_BUDGET = 64 * 1024**2
+
+
+def _create_sparse_file(path: Path, size: int) -> Path:
+    """Creates a file of the given size without allocating it on disk."""
+    with path.open("wb") as file:
+        file.truncate(size)
+    return path
+
+
+def _peak_memory() -> int:
+    """Returns the peak resident memory of the test process in bytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def test_binary_upload_accepts_bytes_memoryview_and_file_objects(
+    runtime_client: ModuleType, mock_api_url: str
+):
+    """Test uploading the supported in-memory inputs as raw binary body."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    for request_body in (b"abcd", memoryview(bytearray(b"abcd")), io.BytesIO(b"abcd")):
+        response = client.upload_binary.put(request_body=request_body)
+
+        assert response["received"] == 4
+        assert response["content_type"] == "application/octet-stream"
+
+
+def test_multipart_upload_sends_fields_and_files(
+    runtime_client: ModuleType, mock_api_url: str, tmp_path: Path
+):
+    """Test uploading a file path together with a regular form field."""
+    file_path = tmp_path / "report.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    response = client.upload_multipart.post(
+        request_body={"file": str(file_path), "description": "Monthly report"}
+    )
+
+    assert response["content_type"].startswith("multipart/form-data; boundary=")
+    assert response["received"] > file_path.stat().st_size
+
+
+def test_binary_upload_streams_multi_gb_file_from_disk(
+    runtime_client: ModuleType, mock_api_url: str, tmp_path: Path
+):
+    """Test that a multi-GB upload is streamed from disk instead of being read in memory."""
+    file_path = _create_sparse_file(tmp_path / "large.bin", UPLOAD_SIZE)
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    peak_memory_before = _peak_memory()
+    response = client.upload_binary.put(request_body=file_path)
+
+    assert response["received"] == UPLOAD_SIZE
+    assert _peak_memory() - peak_memory_before < MEMORY_BUDGET
+
+
+def test_multipart_upload_streams_multi_gb_file_from_disk(
+    runtime_client: ModuleType, mock_api_url: str, tmp_path: Path
+):
+    """Test that a multi-GB multipart upload is encoded while streaming."""
+    file_path = _create_sparse_file(tmp_path / "large.bin", UPLOAD_SIZE)
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    peak_memory_before = _peak_memory()
+    response = client.upload_multipart.post(request_body={"file": file_path})
+
+    assert response["received"] > UPLOAD_SIZE
+    assert _peak_memory() - peak_memory_before < MEMORY_BUDGET
+
+
+def test_upload_bases_are_abstract(runtime_client: ModuleType):
+    """Test that an upload body or part without its abstract methods can not be created."""
+    upload = importlib.import_module(f"{runtime_client.__name__}.utils.upload")
+
+    for base in (upload.UploadBody, upload._Part):
+        with pytest.raises(TypeError, match="abstract"):
+            base()
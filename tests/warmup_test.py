@@ -0,0 +1,78 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from types import ModuleType
+
+import pytest
+
+from tests.http_server import MockApiHandler
+
+
+def _wait_for_connections(count: int, timeout: float = 2.0) -> int:
+    """Waits until the mock API accepted `count` connections and returns the accepted number."""
+    deadline = time.monotonic() + timeout
+    while MockApiHandler.opened_connections < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return MockApiHandler.opened_connections
+
+
+def test_warmup_builds_schema_validators(runtime_client: ModuleType, mock_api_url: str):
+    """Test that the schemas of the selected endpoints are complete after the warm-up."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    schemas = client.items.SCHEMAS
+
+    result = client.warmup(endpoints=["items"], connections=0)
+
+    assert {schema.__name__ for schema in schemas} == {
+        "ItemCreateSchema",
+        "ItemListResponseSchema",
+        "ItemSchema",
+    }
+    assert all(schema.__pydantic_complete__ for schema in schemas)
+    assert result["connections"] == 0
+    assert client.warmup(endpoints=["items"], connections=0)["schemas"] == 0
+
+
+def test_warmup_opens_pooled_connections(runtime_client: ModuleType, mock_api_url: str):
+    """Test that warmed up connections are reused by concurrent requests."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+    MockApiHandler.opened_connections = 0
+
+    assert client.warmup(endpoints=[], connections=3)["connections"] == 3
+    assert _wait_for_connections(3) == 3
+
+    barrier = Barrier(3)
+
+    def call(_):
+        barrier.wait()
+        return client.throttled.get(delay=0.1)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(call, range(3)))
+
+    assert MockApiHandler.opened_connections == 3
+    assert client.warmup(endpoints=[], connections=3)["connections"] == 0
+
+
+def test_warmup_connections_are_limited_to_pool_size(runtime_client: ModuleType, mock_api_url: str):
+    """Test that no more connections are opened than the pool keeps."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={}, pool_maxsize=2)
+
+    assert client.warmup(endpoints=[], connections=5)["connections"] == 2
+
+
+def test_warmup_rejects_unknown_endpoints(runtime_client: ModuleType, mock_api_url: str):
+    """Test that a typo in the endpoint names is reported instead of silently skipped."""
+    client = runtime_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    with pytest.raises(ValueError, match="itemz"):
+        client.warmup(endpoints=["itemz"])
+
+
+def test_warmup_msgspec_client(msgspec_client: ModuleType, mock_api_url: str):
+    """Test that the msgspec backend prepares a decoder for every schema of the endpoint."""
+    client = msgspec_client.ClientAlpha(base_url=mock_api_url, default_headers={})
+
+    result = client.warmup(endpoints=["items"], connections=0)
+
+    assert result == {"schemas": len(client.items.SCHEMAS), "connections": 0}
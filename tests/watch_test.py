@@ -0,0 +1,161 @@
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import fastapi_client_generator.client as client_module
+from fastapi_client_generator import FastapiClientGenerator
+from fastapi_client_generator.shared.config import Config
+from fastapi_client_generator.shared.spec_watcher import SpecWatcher
+from tests.http_server import MockApiHandler
+
+
+def _modification_times(client_path: Path) -> Dict[str, int]:
+    return {
+        str(path.relative_to(client_path)): path.stat().st_mtime_ns
+        for path in client_path.rglob("*.py")
+    }
+
+
+def test_watch_regenerates_changed_files(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a changed spec only rewrites the affected files and removes the stale ones."""
+    monkeypatch.chdir(tmp_path)
+    spec_path = tmp_path / "openapi.json"
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    spec_path.write_text(json.dumps(api_spec))
+    client_path = tmp_path / "watched_client"
+    before: Dict[str, int] = {}
+
+    def edit_spec_once(seconds: float) -> None:
+        if before:
+            return
+
+        before.update(_modification_times(client_path))
+        schemas = api_spec["components"]["schemas"]
+        schemas["Item"]["properties"]["price"] = {"type": "number"}
+        del schemas["EmptyProperty"]
+        spec_path.write_text(json.dumps(api_spec))
+
+    monkeypatch.setattr(
+        client_module,
+        "SpecWatcher",
+        lambda source, interval, debounce, log: SpecWatcher(source, 0, 0, edit_spec_once, log),
+    )
+
+    FastapiClientGenerator(client_name="watched_client").watch(spec_path, runs=2)
+    after = _modification_times(client_path)
+
+    assert "price: " in (client_path / "schemas" / "item_schema.py").read_text()
+    assert sorted(set(before) - set(after)) == ["schemas/empty_property_schema.py"]
+    assert sorted(name for name in after if after[name] != before[name]) == [
+        "schemas/item_schema.py",
+        "schemas/schema_graph.py",
+    ]
+
+
+def test_watch_polls_url_with_conditional_requests(mock_api_url: str):
+    """Test that an unchanged spec URL is answered with `304` and a changed one is parsed again."""
+    MockApiHandler.api_spec = {"openapi": "3.1.0", "info": {"version": "1"}, "paths": {}}
+    MockApiHandler.api_spec_statuses.clear()
+    polls: List[float] = []
+
+    def change_spec_on_third_poll(seconds: float) -> None:
+        polls.append(seconds)
+        if len(polls) == 3:
+            MockApiHandler.api_spec = {**MockApiHandler.api_spec, "info": {"version": "2"}}
+
+    changes = SpecWatcher(f"{mock_api_url}/openapi.json", sleep=change_spec_on_third_poll).changes()
+
+    assert next(changes)["info"]["version"] == "1"
+    assert next(changes)["info"]["version"] == "2"
+    assert MockApiHandler.api_spec_statuses == [200, 304, 304, 200, 304]
+
+
+def test_watch_keeps_polling_a_missing_file(tmp_path: Path):
+    """Test that a spec file that is briefly missing, as on an atomic save, is polled again."""
+    spec_path = tmp_path / "openapi.json"
+    spec_path.write_text(json.dumps({"info": {"version": "1"}}))
+    polls: List[float] = []
+    logs: List[str] = []
+
+    def replace_spec(seconds: float) -> None:
+        polls.append(seconds)
+        if len(polls) == 1:
+            spec_path.unlink()
+        elif len(polls) == 2:
+            spec_path.write_text("{")
+        elif len(polls) == 4:
+            spec_path.write_text(json.dumps({"info": {"version": "2"}}))
+
+    changes = SpecWatcher(str(spec_path), sleep=replace_spec, log=logs.append).changes()
+
+    assert next(changes)["info"]["version"] == "1"
+    assert next(changes)["info"]["version"] == "2"
+    assert [log.split(",")[0] for log in logs] == [
+        f"Could not read '{spec_path}'",
+        f"'{spec_path}' is not valid JSON",
+    ]
+
+
+def test_watch_keeps_polling_a_failing_url(mock_api_url: str):
+    """Test that a spec URL that answers an error is polled again, without losing the change."""
+    MockApiHandler.api_spec = {"openapi": "3.1.0", "info": {"version": "1"}, "paths": {}}
+    MockApiHandler.api_spec_statuses.clear()
+    logs: List[str] = []
+
+    def fail_once(seconds: float) -> None:
+        if not logs:
+            MockApiHandler.api_spec = {**MockApiHandler.api_spec, "info": {"version": "2"}}
+            MockApiHandler.api_spec_errors = 1
+
+    source = f"{mock_api_url}/openapi.json"
+    changes = SpecWatcher(source, sleep=fail_once, log=logs.append).changes()
+
+    assert next(changes)["info"]["version"] == "1"
+    assert next(changes)["info"]["version"] == "2"
+    assert MockApiHandler.api_spec_statuses == [200, 503, 200, 304]
+    assert logs[0].startswith(f"Could not read '{source}', polling again: 503 Server Error")
+
+
+def test_watch_keeps_the_client_when_generation_fails(
+    local_openapi_spec_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a failed generation is logged, and the files it staged are written next run."""
+    monkeypatch.chdir(tmp_path)
+    spec_path = tmp_path / "openapi.json"
+    api_spec = json.loads(local_openapi_spec_path.read_text())
+    spec_path.write_text(json.dumps(api_spec))
+    client_path = tmp_path / "watched_client"
+    runs: List[int] = []
+    logs: List[str] = []
+    post_processor = client_module.PostProcessor
+
+    def fail_second_run(config):
+        runs.append(len(runs) + 1)
+        if len(runs) == 2:
+            raise RuntimeError("Ruff failed")
+        return post_processor(config)
+
+    def edit_spec(seconds: float) -> None:
+        api_spec["info"]["version"] = str(len(runs))
+        api_spec["components"]["schemas"]["Item"]["properties"]["price"] = {"type": "number"}
+        spec_path.write_text(json.dumps(api_spec))
+
+    monkeypatch.setattr(client_module, "PostProcessor", fail_second_run)
+    monkeypatch.setattr(Config, "log_action", lambda config, action: logs.append(action))
+    monkeypatch.setattr(
+        client_module,
+        "SpecWatcher",
+        lambda source, interval, debounce, log: SpecWatcher(source, 0, 0, edit_spec, log),
+    )
+
+    FastapiClientGenerator(client_name="watched_client").watch(spec_path, runs=3)
+
+    assert runs == [1, 2, 3]
+    assert [log for log in logs if log.startswith("Could not generate client")] == [
+        f"Could not generate client: RuntimeError('Ruff failed'). Watching '{spec_path}' for changes"
+    ]
+    assert "price: " in (client_path / "schemas" / "item_schema.py").read_text()